@@ -0,0 +1,161 @@
+"""
+Public functions of filterdesigner paired with the raw SciPy calls that
+they wrap. Each case builds two thunks, the wrapper and the raw call, for
+the 'small' and 'large' sizes.
+"""
+
+import numpy as np
+import scipy.signal as signal
+import scipy.interpolate as ip
+import filterdesigner.FIRDesign as FIRDesign
+import filterdesigner.IIRDesign as IIRDesign
+import filterdesigner.FilterSpec as FilterSpec
+
+SIZES = ['small', 'large']
+
+# Orders of FIR and IIR filters for each size.
+FIRORDER = {'small': 16, 'large': 256}
+IIRORDER = {'small': 4, 'large': 12}
+
+
+def _fir1(size):
+    n = FIRORDER[size]
+    return (lambda: FIRDesign.fir1(n, 0.3),
+            lambda: signal.firwin(n+1, 0.3, window='hamming'))
+
+
+def _fir2(size):
+    n = FIRORDER[size]
+    f, m = [0, 0.3, 0.4, 1], [1, 1, 0, 0]
+    return (lambda: FIRDesign.fir2(n, f, m),
+            lambda: signal.firwin2(n+1, f, m, nfreqs=1024, window='hamming'))
+
+
+def _firls(size):
+    n = FIRORDER[size]
+    f, a = [0, 0.3, 0.4, 1], [1, 1, 0, 0]
+    return (lambda: FIRDesign.firls(n, f, a),
+            lambda: signal.firls(n+1, f, a))
+
+
+def _firpm(size):
+    # The Remez exchange does not converge for these bands at high orders.
+    n = {'small': 17, 'large': 129}[size]
+    f = np.array([0, 0.3, 0.4, 0.6, 0.7, 1])
+    a = [0, 0, 1, 1, 0, 0]
+    x = np.arange(len(f))
+    fi = ip.interp1d(x, f)(np.linspace(x[0], x[-1], 2*len(x)))
+    return (lambda: FIRDesign.firpm(n, f, a),
+            lambda: signal.remez(n+1, fi, a, fs=2))
+
+
+def _kaiserord(size):
+    width = {'small': 0.1, 'large': 0.01}[size]
+    f, a, dev = [0.3, 0.3+width], [1, 0], [0.01, 0.001]
+    return (lambda: FIRDesign.kaiserord(f, a, dev),
+            lambda: signal.kaiserord(60, width))
+
+
+def _sgolay(size):
+    framelen = {'small': 11, 'large': 101}[size]
+    return (lambda: FIRDesign.sgolay(3, framelen),
+            lambda: signal.savgol_coeffs(framelen, 3))
+
+
+def _iir(name):
+    def case(size):
+        n = IIRORDER[size]
+        args = {'butter': (), 'cheby1': (1,), 'cheby2': (40,),
+                'ellip': (1, 40)}[name]
+        ours = getattr(IIRDesign, name)
+        raw = getattr(signal, name)
+        return (lambda: ours(n, *args, 0.3),
+                lambda: raw(n, *args, 0.3, 'lowpass', fs=2))
+    return case
+
+
+def _iirord(name):
+    def case(size):
+        ws = {'small': 0.4, 'large': 0.31}[size]
+        ours = getattr(IIRDesign, name)
+        raw = getattr(signal, name)
+        return (lambda: ours(0.3, ws, 1, 60),
+                lambda: raw(0.3, ws, 1.0, 60.0, fs=2))
+    return case
+
+
+def _iirnotch(size):
+    return (lambda: IIRDesign.iirnotch(0.3, 0.01),
+            lambda: signal.iirnotch(0.3, 30.0, fs=2.0))
+
+
+def _iirpeak(size):
+    return (lambda: IIRDesign.iirpeak(0.3, 0.01),
+            lambda: signal.iirpeak(0.3, 30.0, fs=2.0))
+
+
+def _system(size):
+    return IIRDesign.butter(IIRORDER[size], 0.3)
+
+
+def _freqz(size):
+    b, a = _system(size)
+    return (lambda: FilterSpec.freqz((b, a), outform='dB'),
+            lambda: 20*np.log10(np.abs(signal.freqz(b, a, worN=512)[1])))
+
+
+def _grpdelay(size):
+    b, a = _system(size)
+    return (lambda: FilterSpec.grpdelay((b, a)),
+            lambda: signal.group_delay((b, a), w=512))
+
+
+def _phasez(size):
+    b, a = _system(size)
+    return (lambda: FilterSpec.phasez((b, a)),
+            lambda: np.unwrap(np.angle(signal.freqz(b, a, worN=512)[1])))
+
+
+def _impz(size):
+    b, a = _system(size)
+    dl = signal.dlti(b, a, dt=1)
+    return (lambda: FilterSpec.impz((b, a), n=1000),
+            lambda: signal.dimpulse(dl, n=1000))
+
+
+def _zplane(size):
+    b, a = _system(size)
+    return (lambda: FilterSpec.zplane((b, a), show=False),
+            lambda: signal.tf2zpk(b, a))
+
+
+def _isstable(size):
+    b, a = _system(size)
+    return (lambda: FilterSpec.isstable((b, a)),
+            lambda: np.all(np.abs(np.roots(a)) < 1))
+
+
+CASES = {
+    'fir1': _fir1,
+    'fir2': _fir2,
+    'firls': _firls,
+    'firpm': _firpm,
+    'kaiserord': _kaiserord,
+    'sgolay': _sgolay,
+    'butter': _iir('butter'),
+    'cheby1': _iir('cheby1'),
+    'cheby2': _iir('cheby2'),
+    'ellip': _iir('ellip'),
+    'buttord': _iirord('buttord'),
+    'cheb1ord': _iirord('cheb1ord'),
+    'cheb2ord': _iirord('cheb2ord'),
+    'ellipord': _iirord('ellipord'),
+    'iirnotch': _iirnotch,
+    'iirpeak': _iirpeak,
+    'freqz': _freqz,
+    'grpdelay': _grpdelay,
+    'phasez': _phasez,
+    'impz': _impz,
+    'zplane': _zplane,
+    'isstable': _isstable,
+}
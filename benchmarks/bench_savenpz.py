@@ -0,0 +1,85 @@
+"""
+asv benchmarks of the compressed .npz writer against np.savez_compressed.
+
+Run with `asv run` from the repository root, or without asv by
+`python -m benchmarks.bench_savenpz [--mbytes 64]`, which prints the
+throughput and the archive size of both writers.
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import numpy as np
+import filterdesigner.IO as IO
+
+WORKERS = [1, 2, 4, 8]
+
+
+def bank(mbytes:int)->np.ndarray:
+    # Coefficients of FIR filters with 4 significant digits, which compress
+    # about as well as designed filters.
+    rng = np.random.RandomState(0)
+    n = mbytes * 2**20 // (8 * 128)
+    return np.round(rng.randn(n, 128) * np.hamming(128), 4)
+
+
+class SaveNpz:
+    params = [WORKERS]
+    param_names = ['max_workers']
+    timeout = 300
+
+    def setup(self, max_workers):
+        self.bank = bank(32)
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, 'bank.npz')
+
+    def teardown(self, max_workers):
+        shutil.rmtree(self.dir)
+
+    def time_savenpz(self, max_workers):
+        IO.savenpz(self.filename, bank=self.bank, comp=True, max_workers=max_workers)
+
+    def time_savez_compressed(self, max_workers):
+        np.savez_compressed(self.filename, bank=self.bank)
+
+    def track_size_savenpz(self, max_workers):
+        IO.savenpz(self.filename, bank=self.bank, comp=True, max_workers=max_workers)
+        return os.path.getsize(self.filename)
+    track_size_savenpz.unit = 'bytes'
+
+    def track_size_savez_compressed(self, max_workers):
+        np.savez_compressed(self.filename, bank=self.bank)
+        return os.path.getsize(self.filename)
+    track_size_savez_compressed.unit = 'bytes'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--mbytes', type=int, default=64,
+                        help='size of the coefficient bank in MiB')
+    args = parser.parse_args()
+
+    x = bank(args.mbytes)
+    tmp = tempfile.mkdtemp()
+    filename = os.path.join(tmp, 'bank.npz')
+    print('%d MiB bank, %d CPUs' % (args.mbytes, os.cpu_count() or 1))
+    print('%-24s %10s %12s %14s' % ('writer', 'time (s)', 'MiB/s', 'size (bytes)'))
+    try:
+        runs = [('np.savez_compressed', lambda: np.savez_compressed(filename, bank=x))]
+        for w in WORKERS:
+            runs.append(('savenpz max_workers=%d' % w,
+                         lambda w=w: IO.savenpz(filename, bank=x, comp=True, max_workers=w)))
+        for name, func in runs:
+            t = time.perf_counter()
+            func()
+            t = time.perf_counter() - t
+            print('%-24s %10.3f %12.1f %14d' % (name, t, x.nbytes / 2**20 / t,
+                                                os.path.getsize(filename)))
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
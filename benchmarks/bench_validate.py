@@ -0,0 +1,52 @@
+"""
+Per-call overhead of the parameter checks of the IIR design functions.
+
+    python -m benchmarks.bench_validate [--number 2000] [--repeat 5]
+
+Each function and the bare scipy.signal call it wraps are timed as the
+minimum of `repeat` runs of `number` calls, and the difference is printed,
+with and without `filterdesigner.trusted()`. Run it from a checkout of an
+older revision, with this file copied there, to compare the overheads.
+"""
+
+import timeit
+import argparse
+import contextlib
+import warnings
+import filterdesigner
+from ._cases import CASES
+
+NAMES = ['butter', 'cheby1', 'iirnotch', 'ellipord', 'cheb1ord']
+
+
+def percall(func, number:int, repeat:int)->float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # Revisions before the trusted mode have no `trusted`.
+    trusted = getattr(filterdesigner, 'trusted', None)
+    warnings.simplefilter('ignore')
+
+    print('%-10s %12s %12s %14s %14s' % ('function', 'wrapper us', 'scipy us',
+                                          'overhead us', 'trusted us'))
+    for name in NAMES:
+        ours, raw = CASES[name]('small')
+        t0 = percall(raw, args.number, args.repeat)
+        t = percall(ours, args.number, args.repeat)
+        if trusted is None:
+            tt = float('nan')
+        else:
+            with trusted():
+                tt = percall(ours, args.number, args.repeat) - t0
+        print('%-10s %12.1f %12.1f %14.1f %14.1f' % (name, t*1e6, t0*1e6,
+                                                     (t-t0)*1e6, tt*1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+asv benchmarks of the wrapper overhead.
+
+Run with `asv run` from the repository root, or without asv by
+`python -m benchmarks.run`.
+"""
+
+import tracemalloc
+from ._cases import CASES, SIZES
+
+
+class Wrappers:
+    params = [sorted(CASES), SIZES]
+    param_names = ['function', 'size']
+
+    def setup(self, name, size):
+        self.ours, self.raw = CASES[name](size)
+        # Warm up the caches of both sides.
+        self.ours()
+        self.raw()
+
+    def time_wrapper(self, name, size):
+        self.ours()
+
+    def time_scipy(self, name, size):
+        self.raw()
+
+    def track_peakmem_wrapper(self, name, size):
+        return _peak(self.ours)
+    track_peakmem_wrapper.unit = 'bytes'
+
+    def track_peakmem_scipy(self, name, size):
+        return _peak(self.raw)
+    track_peakmem_scipy.unit = 'bytes'
+
+
+def _peak(func):
+    # Peak memory allocated by Python objects during one call.
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
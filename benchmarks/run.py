@@ -0,0 +1,138 @@
+"""
+Standalone runner of the wrapper benchmarks, without asv.
+
+    python -m benchmarks.run [--quick] [--only fir1,butter] [--threshold 1.25]
+
+Each public function and its raw SciPy call are timed for the 'small' and
+'large' sizes, and the peak memory of one call is traced by tracemalloc.
+The results are stored in benchmarks/results/<version>_<timestamp>.json,
+and compared with the latest previous result, so that a regression of the
+overhead ratio (wrapper time / SciPy time) is reported.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import glob
+import timeit
+import argparse
+import platform
+import warnings
+import numpy as np
+import scipy
+from .bench_wrappers import _peak
+from ._cases import CASES, SIZES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS = os.path.join(ROOT, 'benchmarks', 'results')
+
+
+def version()->str:
+    # The installed version, or the version in setup.py of the checkout.
+    try:
+        from importlib.metadata import version as _version
+        return _version('filterdesigner')
+    except Exception:
+        pass
+    try:
+        with open(os.path.join(ROOT, 'setup.py')) as fp:
+            return re.search(r'__version__ = "(.*)"', fp.read()).group(1)
+    except (IOError, AttributeError):
+        return 'unknown'
+
+
+def measure(func, repeat:int, budget:float)->float:
+    # Minimum time per call of `repeat` runs of about `budget` seconds.
+    timer = timeit.Timer(func)
+    number, t = timer.autorange()
+    number = max(1, int(number * budget / max(t, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(names, repeat:int=5, budget:float=0.05)->dict:
+    results = {}
+    for name in names:
+        for size in SIZES:
+            ours, raw = CASES[name](size)
+            ours()
+            raw()
+            t = measure(ours, repeat, budget)
+            t0 = measure(raw, repeat, budget)
+            results[name + '/' + size] = {
+                'wrapper_s': t,
+                'scipy_s': t0,
+                'overhead_s': t - t0,
+                'ratio': t / t0,
+                'wrapper_peak_bytes': _peak(ours),
+                'scipy_peak_bytes': _peak(raw),
+            }
+    return results
+
+
+def latest(exclude:str=None):
+    files = sorted(glob.glob(os.path.join(RESULTS, '*.json')), key=os.path.getmtime)
+    files = [f for f in files if f != exclude]
+    return files[-1] if files else None
+
+
+def compare(new:dict, old:dict, threshold:float)->list:
+    # Cases which overhead ratio grew more than `threshold` times.
+    slower = []
+    for key, r in new.items():
+        if key in old and r['ratio'] > threshold * old[key]['ratio']:
+            slower.append((key, old[key]['ratio'], r['ratio']))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--only', default=None,
+                        help='comma separated functions to run')
+    parser.add_argument('--quick', action='store_true',
+                        help='fewer and shorter repeats')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='ratio of overhead ratios reported as regression')
+    parser.add_argument('--no-save', action='store_true',
+                        help='do not store the results')
+    args = parser.parse_args(argv)
+
+    names = sorted(CASES) if args.only is None else args.only.split(',')
+    warnings.simplefilter('ignore')
+    results = run(names, *((2, 0.01) if args.quick else (5, 0.05)))
+
+    print('%-20s %12s %12s %8s %12s' % ('case', 'wrapper us', 'scipy us',
+                                         'ratio', 'peak bytes'))
+    for key, r in results.items():
+        print('%-20s %12.1f %12.1f %8.2f %12d' % (key, r['wrapper_s']*1e6,
+              r['scipy_s']*1e6, r['ratio'], r['wrapper_peak_bytes']))
+
+    doc = {
+        'version': version(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'machine': {'python': platform.python_version(),
+                    'numpy': np.__version__, 'scipy': scipy.__version__,
+                    'platform': platform.platform()},
+        'results': results,
+    }
+
+    previous = latest()
+    if previous is not None:
+        with open(previous) as fp:
+            old = json.load(fp)['results']
+        for key, before, after in compare(results, old, args.threshold):
+            print('REGRESSION %s: ratio %.2f -> %.2f (%s)'
+                  % (key, before, after, os.path.basename(previous)))
+
+    if not args.no_save:
+        os.makedirs(RESULTS, exist_ok=True)
+        path = os.path.join(RESULTS, '%s_%s.json' % (doc['version'],
+                            time.strftime('%Y%m%dT%H%M%S')))
+        with open(path, 'w') as fp:
+            json.dump(doc, fp, indent=1)
+        print('saved ' + path)
+
+
+if __name__ == '__main__':
+    main()
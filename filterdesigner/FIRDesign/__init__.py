@@ -9,5 +9,10 @@ from ._fir1 import fir1
 from ._fir2 import fir2
 from ._firls import firls
 from ._firpm import firpm
+from ._firpmmin import firpmmin
+from ._getwindow import getwindow, windowcache
 from ._kaiserord import kaiserord
-from ._sgolay import sgolay
\ No newline at end of file
+from ._sgolay import sgolay
+
+from .._profile import _instrument
+_instrument(globals())
\ No newline at end of file
@@ -2,6 +2,7 @@ import numpy as np
 import scipy.signal as signal
 import scipy.interpolate as ip
 from typing import List, Tuple
+from ._getwindow import getwindow
 
 def fir1(n : int, Wn, ftype : str ='default', window='hamming', scaleopt : bool =True) -> Tuple:
     """
@@ -22,12 +23,16 @@ def fir1(n : int, Wn, ftype : str ='default', window='hamming', scaleopt : bool
             Filter order. 
             `n` must be even if a passband includes the Nyquist frequency.
             
-        Wn : float or 1D array_like
+        Wn : float, 1D array_like or 2D array_like
             Cutoff frequency of filter (expressed in the same units as fs) 
             OR an array of cutoff frequencies (that is, band edges). 
             In the latter case, the frequencies in `Wn` should be positive 
             and monotonically increasing between 0 and 1. 
             The values 0 and 1 must not be included in `Wn`.
+            If `Wn` is a 2D array, each row is the cutoff frequency or the
+            band edges of a filter, and all the filters are designed at once.
+            For example, `Wn[:, None]` designs lowpass filters for the
+            cutoff frequencies `Wn`.
         
         ftype : string, optional
             Filter type of filter('low', 'high', 'bandpass', 'stop', 'DC-0' 
@@ -46,9 +51,11 @@ def fir1(n : int, Wn, ftype : str ='default', window='hamming', scaleopt : bool
             6. 'DC-1' specifies that the first band of a multiband filter is 
                a passband.
         
-        window : string or tuple of string and parameter values, optional
+        window : string, tuple of string and parameter values or array_like, optional
             Desired window to use. See 'scipy.signal.get_window' for a list of 
             windows and required parameters.
+            The windows are cached by `getwindow`, and a precomputed window
+            of length n+1 can also be passed as array_like.
             
         scaleopt : bool, optional
             Set to True to scale the coefficients so that the frequency response 
@@ -67,6 +74,9 @@ def fir1(n : int, Wn, ftype : str ='default', window='hamming', scaleopt : bool
                 
                 * (num, den)
                 
+            If `Wn` is a 2D array, `num` is a 2D array which rows are the 
+            numerators.
+                
     Raises
     ------
         ValueError
@@ -93,38 +103,94 @@ def fir1(n : int, Wn, ftype : str ='default', window='hamming', scaleopt : bool
         raise ValueError("ftype must be 'default', 'low', 'bandpass', 'high'"
                          +", 'stop', 'DC-0' or 'DC-1'.")
     
+    # The number of band edges, the last axis of Wn.
+    cutoff = np.asarray(Wn, dtype=float)
+    nedges = 1 if cutoff.ndim == 0 else cutoff.shape[-1]
+    
     #Filter length check
-    if type(Wn) == float and (ftype in ['default', 'low', 'high']) == False:
+    if nedges == 1 and (ftype in ['default', 'low', 'high']) == False:
         # When the length of Wn equals to 1.
         raise ValueError("If the length of Wn equals to 1, ftype must be"
                          +" 'default', 'low', or 'high'.")
-    elif type(Wn) == list and len(Wn) == 2 and (ftype in ['default', 'bandpass', 'stop', 'DC-0', 'DC-1']) == False:
+    elif nedges == 2 and (ftype in ['default', 'bandpass', 'stop', 'DC-0', 'DC-1']) == False:
         # When the length of Wn equals to 2.
         raise ValueError("If the length of Wn equals to 2, ftype must be"
                          +" 'default', 'bandpass', 'stop', 'DC-0', 'DC-1'.")
-    elif type(Wn) == list and len(Wn) >= 3 and (ftype in ['default', 'DC-0', 'DC-1']) == False:
+    elif nedges >= 3 and (ftype in ['default', 'DC-0', 'DC-1']) == False:
         # When the length of Wn is greater than 2.
         raise ValueError("If the length of Wn is greater than 2, ftype must be"
                          +" 'default', 'DC-0', or 'DC-1'.")
     
     #Define default filter types
-    if type(Wn) == float and ftype == 'default':
+    if nedges == 1 and ftype == 'default':
         #If the length of Wn equals to 1, the default filter type is low-pass
         ftype = 'low'
     
-    if type(Wn) == list and len(Wn) == 2 and (ftype == 'default' or ftype == 'DC-0'):
+    if nedges == 2 and (ftype == 'default' or ftype == 'DC-0'):
         #If the length of Wn equals to 2, the default filter type is bandpass
         ftype = 'bandpass'
     
-    if type(Wn) == list and len(Wn) >= 3 and ftype == 'default':
+    if nedges >= 3 and ftype == 'default':
         #If the length of Wn is greater than 2, the default filter type is DC-0
         ftype = 'DC-0'
     
     if ftype in ['high', 'bandpass', 'DC-0']:
         pass_zero = False
-        
-    num = signal.firwin(n+1, Wn, window=window, pass_zero=pass_zero, 
-                        scale=scaleopt) # Numerator
+    
+    if cutoff.ndim > 2:
+        raise ValueError("Wn must be a scalar, a 1D or a 2D array.")
+    
+    num = _firwin(n, cutoff.reshape(-1, nedges), pass_zero, 
+                  getwindow(window, n+1), scaleopt) # Numerator
+    if cutoff.ndim < 2:
+        num = num[0]
     den = 1 # Denominator
     
     return num, den
+
+
+def _firwin(n:int, cutoff:np.ndarray, pass_zero:bool, win:np.ndarray, 
+            scale:bool) -> np.ndarray:
+    """
+    Windowed sinc FIR filters for the rows of band edges `cutoff`.
+    
+    The same computation as `scipy.signal.firwin` broadcast over the rows,
+    which returns a 2D array which rows are the filter coefficients.
+    """
+    
+    if np.any(cutoff <= 0) or np.any(cutoff >= 1):
+        raise ValueError("Invalid cutoff frequency: frequencies must be "
+                         +"greater than 0 and less than 1.")
+    if np.any(np.diff(cutoff, axis=1) <= 0):
+        raise ValueError("Invalid cutoff frequencies: the frequencies "
+                         +"must be strictly increasing.")
+    
+    pass_nyquist = bool(cutoff.shape[1] & 1) ^ pass_zero
+    if pass_nyquist and n % 2 == 1:
+        raise ValueError("A filter with an even number of coefficients must "
+                         +"have zero response at the Nyquist frequency.")
+    
+    # Band edges including 0 and 1, and the pairs of the passbands.
+    k = cutoff.shape[0]
+    bands = np.hstack([np.zeros((k, 1))]*pass_zero + [cutoff]
+                      + [np.ones((k, 1))]*pass_nyquist)
+    left = bands[:, 0::2, None]
+    right = bands[:, 1::2, None]
+    
+    # Build up the coefficients for all rows at once.
+    m = np.arange(0, n+1) - 0.5 * n
+    h = 0
+    for i in range(left.shape[1]):
+        h += right[:, i] * np.sinc(right[:, i] * m)
+        h -= left[:, i] * np.sinc(left[:, i] * m)
+    h *= win
+    
+    if scale:
+        # Scale to unity at DC, Nyquist or the center of the first passband.
+        scale_frequency = np.where(left[:, 0] == 0, 0.0, 
+                                   np.where(right[:, 0] == 1, 1.0, 
+                                            0.5 * (left[:, 0] + right[:, 0])))
+        c = np.cos(np.pi * m * scale_frequency)
+        h /= np.sum(h * c, axis=1, keepdims=True)
+    
+    return h
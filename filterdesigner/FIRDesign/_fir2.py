@@ -2,6 +2,7 @@ import numpy as np
 import scipy.signal as signal
 import scipy.interpolate as ip
 from typing import List, Tuple
+from ._getwindow import getwindow
 
 def fir2(n : int, f, m, npt : int =512, window='hamming') -> Tuple:
     """
@@ -37,10 +38,12 @@ def fir2(n : int, f, m, npt : int =512, window='hamming') -> Tuple:
         The size of the interpolation mesh used to construct the filter.
         The default is 512.  `npt` must be greater than `n/2`.
         
-    window : string or (string, float) or float, or None, optional
+    window : string or (string, float) or float, array_like or None, optional
         Window function to use. Default is "hamming".  See
         `scipy.signal.get_window` for the complete list of possible values.
         If None, no window function is applied.
+        The windows are cached by `getwindow`, and a precomputed window
+        of the filter length can also be passed as array_like.
 
     Returns
     -------
@@ -60,7 +63,10 @@ def fir2(n : int, f, m, npt : int =512, window='hamming') -> Tuple:
     
     nfreqs = npt * 2
     n += 1
-    num = signal.firwin2(n, f, m, nfreqs=nfreqs, window=window)
+    num = signal.firwin2(n, f, m, nfreqs=nfreqs, window=None)
+    if window is not None:
+        # Apply the window from the cache.
+        num *= getwindow(window, n)
     den = 1
     
     return num, den
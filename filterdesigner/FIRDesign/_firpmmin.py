@@ -0,0 +1,151 @@
+import numpy as np
+import scipy.signal as signal
+from typing import List, Tuple
+from ._kaiserord import kaiserord
+from ..FilterSpec._specmargin import specmargin
+
+def firpmmin(f, a, dev, fs:float=2, lgrid:int=16, nmax:int=2000) -> Tuple:
+    """
+    Minimum order Parks-McClellan optimal FIR filter design.
+
+    Search the lowest filter order for which the Parks-McClellan (remez)
+    design meets the deviations `dev` in every band. The search starts from
+    the Kaiser window order estimate, brackets the minimum order and bisects
+    the bracket. Every trial design is verified on a dense frequency grid
+    by `FilterSpec.specmargin`.
+
+    Parameters
+    ----------
+    f : array_like
+        Band edges. The length of `f` is the length of `2*len(a)-2`.
+        The same as `kaiserord`.
+
+    a : array_like
+        Band amplitude. The amplitude is specified on the bands defined by `f`.
+
+    dev : array_like
+        Maximum allowable deviation for each band, specified as positive
+        numbers representing absolute filter gain (unit-less).
+        A scalar applies to all bands.
+
+    fs : float, optional
+        Sample rate. The frequency band edges in f must be from 0 to fs/2.
+        Default is 2.
+
+    lgrid : int, optional
+        Grid density. The dense grid used in remez and in the verification of
+        the specification is of size (numtaps + 1) * lgrid. Default is 16.
+
+    nmax : int, optional
+        The maximum filter order to search. Default is 2000.
+
+    Raises
+    ------
+    ValueError
+        If `f`, `a` and `dev` are inconsistent (see `kaiserord`).
+        If no filter order up to `nmax` meets the specification.
+
+    Returns
+    -------
+    n : int
+        The minimum filter order.
+
+    system :a tuple of array_like describing the system.
+            The following gives the number of elements in the tuple and
+            the interpretation:
+
+                * (num, den)
+
+    Notes
+    -----
+    `scipy.signal.remez` does not accept an initial set of extremal
+    frequencies, so the warm start is done on the order axis instead:
+    the deviation measured on the previous trial design is converted to an
+    attenuation excess (or surplus) in dB, and the next trial order is
+    predicted from the Kaiser relation of about 2.285*width dB per order.
+    Each order is designed at most once.
+    """
+
+    # Kaiser window estimation also checks the consistency of parameters.
+    n0, _, _, _ = kaiserord(f, a, dev, fs)
+
+    f = np.asarray(f, dtype=float).ravel()
+    a = np.asarray(a, dtype=float).ravel()
+    dev = np.broadcast_to(np.asarray(dev, dtype=float).ravel(), a.shape)
+
+    bands = np.hstack(([0], f, [fs/2]))
+    weight = np.max(dev) / dev
+
+    # Type I filter is necessary when the last band is a passband.
+    step = 2 if a[-1] != 0 else 1
+
+    # Attenuation in dB obtained by increasing the order by 1.
+    width = 2*np.pi*np.min(f[1::2]-f[0::2])/fs
+    slope = 2.285 * width
+
+    designs = {}
+
+    def design(n):
+        # Design and verify the filter of order `n`, only once for each order.
+        if n not in designs:
+            num = signal.remez(n+1, bands, a, weight=weight, fs=fs,
+                               grid_density=lgrid)
+            margin = specmargin((num, 1), f, a, dev, fs=fs, lgrid=lgrid)
+            ratio = np.max((dev-margin)/dev)
+            # Excess attenuation needed to meet the specification in dB.
+            designs[n] = (20*np.log10(max(ratio, 1e-12)), num)
+        return designs[n]
+
+    def parity(n):
+        # Round `n` up to the nearest order allowed.
+        n = max(int(n), step)
+        return n + (n % step)
+
+    # Bracket the minimum order from the Kaiser estimate.
+    n = parity(min(n0, nmax))
+    excess, _ = design(n)
+    if excess > 0:
+        while excess > 0:
+            lo = n
+            n = parity(n + max(np.ceil(excess/slope), step))
+            if n > nmax:
+                raise ValueError("No filter order up to `nmax` meets the"
+                                 + " specification.")
+            excess, _ = design(n)
+        hi = n
+    else:
+        hi = n
+        lo = 0
+        while excess <= 0 and n > step:
+            hi = n
+            n = parity(n - max(np.floor(-excess/slope), step))
+            n = min(n, hi-step)
+            excess, _ = design(n)
+        if excess <= 0:
+            hi = n
+        else:
+            lo = n
+
+    # Bisect the bracket. The interpolated order from the measured excess
+    # and the midpoint are used alternately.
+    count = 0
+    while lo != 0 and hi - lo > step:
+        e_lo, _ = design(lo)
+        e_hi, _ = design(hi)
+        if count % 2 == 0 and e_lo > e_hi:
+            mid = lo + (hi-lo)*e_lo/(e_lo-e_hi)
+        else:
+            mid = (lo+hi)/2
+        mid = parity(np.ceil(mid))
+        mid = min(max(mid, lo+step), hi-step)
+        excess, _ = design(mid)
+        if excess > 0:
+            lo = mid
+        else:
+            hi = mid
+        count += 1
+
+    num = design(hi)[1]
+    den = 1
+
+    return hi, (num, den)
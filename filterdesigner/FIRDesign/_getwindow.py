@@ -0,0 +1,119 @@
+import numpy as np
+import scipy.signal as signal
+import threading
+from collections import OrderedDict
+from typing import List, Tuple
+
+# Cache of the window functions keyed by (window, length).
+_cache = OrderedDict()
+_lock = threading.Lock()
+_stats = {'nbytes': 0, 'maxbytes': 64 * 2**20, 'hits': 0, 'misses': 0}
+
+
+def getwindow(window, n:int, cache:bool=True) -> np.ndarray:
+    """
+    Window function for FIR filter design.
+
+    Return a symmetric window of length `n`. Windows specified by name and
+    parameters are kept in a cache of bounded memory, so that windows such as
+    Kaiser and DPSS are not recomputed for designs of the same length.
+
+    Parameters
+    ----------
+        window : string, float, tuple or array_like
+            Desired window. See 'scipy.signal.get_window' for a list of
+            windows and required parameters. If array_like, it is used as
+            the window itself.
+
+        n : int
+            The length of the window, that is, the filter order plus one.
+
+        cache : bool, optional
+            If False, the cache is neither used nor updated.
+            Default is True.
+
+    Raises
+    ------
+        ValueError
+            If `window` is array_like and its length is not `n`.
+
+    Returns
+    -------
+        win : ndarray
+            The window. The windows from the cache are read-only.
+    """
+
+    if isinstance(window, (np.ndarray, list)):
+        win = np.asarray(window, dtype=float)
+        if win.shape != (n,):
+            raise ValueError("The length of `window` must be the filter order"
+                             + " plus one.")
+        return win
+
+    key = (window, int(n))
+    try:
+        hash(key)
+    except TypeError:
+        cache = False
+
+    if cache == False:
+        return signal.get_window(window, n, fftbins=False)
+
+    with _lock:
+        win = _cache.get(key)
+        if win is not None:
+            _cache.move_to_end(key)
+            _stats['hits'] += 1
+            return win
+
+    win = signal.get_window(window, n, fftbins=False)
+    win.setflags(write=False)
+
+    with _lock:
+        _stats['misses'] += 1
+        if key not in _cache and win.nbytes <= _stats['maxbytes']:
+            _cache[key] = win
+            _stats['nbytes'] += win.nbytes
+            _evict()
+
+    return win
+
+
+def windowcache(maxbytes:int=None, clear:bool=False) -> dict:
+    """
+    Configure and inspect the window cache of `getwindow`.
+
+    Parameters
+    ----------
+        maxbytes : int, optional
+            The maximum memory of the cached windows in bytes. The least
+            recently used windows are discarded beyond this size.
+            Default is 64 MiB.
+
+        clear : bool, optional
+            If True, discard all cached windows and reset the statistics.
+
+    Returns
+    -------
+        info : dict
+            'entries', 'nbytes', 'maxbytes', 'hits' and 'misses' of the cache.
+    """
+
+    with _lock:
+        if clear:
+            _cache.clear()
+            _stats.update(nbytes=0, hits=0, misses=0)
+        if maxbytes is not None:
+            _stats['maxbytes'] = int(maxbytes)
+            _evict()
+        info = dict(_stats)
+        info['entries'] = len(_cache)
+
+    return info
+
+
+def _evict():
+    # Discard the least recently used windows. The lock must be held.
+    while _stats['nbytes'] > _stats['maxbytes']:
+        _, win = _cache.popitem(last=False)
+        _stats['nbytes'] -= win.nbytes
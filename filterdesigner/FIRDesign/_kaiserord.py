@@ -2,6 +2,7 @@ import numpy as np
 import scipy.signal as signal
 import scipy.interpolate as ip
 from typing import Tuple
+from .._validate import _asvector
 
 def kaiserord(f:np.ndarray, a:np.ndarray, dev:np.ndarray, fs:float=2)->Tuple:
     """Kaiser window FIR filter design estimation parameters
@@ -66,23 +67,9 @@ def kaiserord(f:np.ndarray, a:np.ndarray, dev:np.ndarray, fs:float=2)->Tuple:
                a passband.
                
     """
-    if type(f) != np.ndarray:
-        if type(f) == list:
-            f = np.array(f)
-        else:
-            f = np.array([f])
-    
-    if type(a) != np.ndarray:
-        if type(a) == list:
-            a = np.array(a)
-        else:
-            a = np.array([a])
-
-    if type(dev) != np.ndarray:
-        if type(dev) == list:
-            dev = np.array(dev)
-        else:
-            dev = np.array([dev])
+    f = _asvector(f)
+    a = _asvector(a)
+    dev = _asvector(dev)
 
     # Parameter check
     if len(f) != 2*len(a)-2:
@@ -5,10 +5,19 @@ Created on Mon Nov 25 13:25:03 2019
 @author: Yuki-F
 """
 
+from ._filternorm import filternorm
 from ._freqz import freqz
 from ._grpdelay import grpdelay
-from ._impz import impz
+from ._impz import impz, impzgen
 from ._isminphase import isminphase
 from ._isstable import isstable
+from ._measure import measure
 from ._phasez import phasez
-from ._zplane import zplane
\ No newline at end of file
+from ._render import render, renderbank
+from ._specmargin import specmargin
+from ._stepz import stepz, stepzgen
+from ._zplane import zplane
+from ._zpk import zpk
+
+from .._profile import _instrument
+_instrument(globals())
\ No newline at end of file
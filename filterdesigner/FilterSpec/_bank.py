@@ -0,0 +1,135 @@
+import numpy as np
+from typing import List, Tuple
+
+def _asbank(system) -> Tuple:
+    """
+    Stack a digital filter or a bank of digital filters.
+
+    Parameters
+    ----------
+        system : a tuple of array_like or a list of them.
+            * (num, den) of a single filter.
+            * (num, den) of a bank of filters, where `num` is a 2D array which
+              rows are the numerators. `den` is a scalar, a 1D array shared
+              by all filters or a 2D array which rows are the denominators.
+            * A list of (num, den).
+
+    Returns
+    -------
+        b : ndarray
+            2D array which rows are the numerators.
+
+        a : ndarray
+            2D array which rows are the denominators.
+
+        single : bool
+            True if `system` is a single filter.
+    """
+
+    if isinstance(system, list):
+        # Pad the coefficients with trailing zeros, which does not change
+        # the response of the filter.
+        nums = [np.atleast_1d(s[0]) for s in system]
+        dens = [np.atleast_1d(s[1]) for s in system]
+        nb = max(len(x) for x in nums)
+        na = max(len(x) for x in dens)
+        b = np.zeros((len(system), nb), dtype=np.result_type(*nums, float))
+        a = np.zeros((len(system), na), dtype=np.result_type(*dens, float))
+        for i in range(len(system)):
+            b[i, :len(nums[i])] = nums[i]
+            a[i, :len(dens[i])] = dens[i]
+        return b, a, False
+
+    num = np.asarray(system[0])
+    den = np.asarray(system[1])
+    single = (num.ndim <= 1 and den.ndim <= 1)
+    b = np.atleast_2d(num)
+    a = np.atleast_2d(den)
+    k = max(b.shape[0], a.shape[0])
+    if b.shape[0] != k:
+        b = np.broadcast_to(b, (k, b.shape[1]))
+    if a.shape[0] != k:
+        a = np.broadcast_to(a, (k, a.shape[1]))
+
+    return b, a, single
+
+
+def _response(b:np.ndarray, a:np.ndarray, w:np.ndarray, fs:float=2*np.pi) -> np.ndarray:
+    """
+    Frequency response of a bank of digital filters at frequencies `w`.
+
+    Returns a 2D array which shape is (len(b), len(w)).
+    """
+
+    wt = 2*np.pi*np.asarray(w, dtype=float)/fs
+
+    def polyval(c):
+        # Evaluate the polynomials of z^-1 by real matrix products.
+        wm = np.outer(np.arange(c.shape[1]), wt)
+        return c @ np.cos(wm) - 1j * (c @ np.sin(wm))
+
+    if a.shape[1] == 1:
+        return polyval(b) / a
+    return polyval(b) / polyval(a)
+
+
+def _rowresponse(b:np.ndarray, a:np.ndarray, w:np.ndarray, fs:float=2*np.pi) -> np.ndarray:
+    """
+    Frequency response of a bank of digital filters, where the i-th filter
+    is evaluated at the frequency `w[i]`.
+
+    Returns a 1D array which length is len(b).
+    """
+
+    wt = 2*np.pi*np.asarray(w, dtype=float)/fs
+
+    def polyval(c):
+        wm = np.outer(wt, np.arange(c.shape[1]))
+        return np.sum(c*np.cos(wm), axis=1) - 1j * np.sum(c*np.sin(wm), axis=1)
+
+    if a.shape[1] == 1:
+        return polyval(b) / a[:, 0]
+    return polyval(b) / polyval(a)
+
+
+def _roots(a:np.ndarray) -> np.ndarray:
+    """
+    Roots of a stack of polynomials by the eigenvalues of their companion
+    matrices, computed for all polynomials at once.
+
+    `a` is a 2D array which rows are the coefficients of the polynomials in
+    descending powers, where a[:, 0] must not be zero. Returns a 2D array
+    which shape is (len(a), a.shape[1]-1).
+    """
+
+    a = np.asarray(a)
+    k, m = a.shape[0], a.shape[1] - 1
+    if m == 0:
+        return np.zeros((k, 0), dtype=complex)
+
+    c = np.zeros((k, m, m), dtype=np.result_type(a, float))
+    c[:, 0, :] = -a[:, 1:] / a[:, :1]
+    c[:, np.arange(1, m), np.arange(m-1)] = 1.0
+
+    return np.linalg.eigvals(c).astype(complex)
+
+
+def _poly(r:np.ndarray) -> np.ndarray:
+    """
+    Monic polynomials of a stack of roots, the inverse of `_roots`.
+
+    `r` is a 2D array which rows are the roots. The coefficients are real
+    if the roots of each row are closed under complex conjugation.
+    """
+
+    r = np.asarray(r)
+    c = np.zeros((r.shape[0], r.shape[1]+1), dtype=complex)
+    c[:, 0] = 1.0
+    for j in range(r.shape[1]):
+        c[:, 1:j+2] = c[:, 1:j+2] - r[:, j:j+1] * c[:, :j+1]
+
+    # Complex conjugate pairs give real coefficients.
+    if np.all(np.sort_complex(r) == np.sort_complex(np.conj(r))):
+        c = c.real
+
+    return c
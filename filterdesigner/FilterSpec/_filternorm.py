@@ -0,0 +1,145 @@
+import numpy as np
+import scipy.linalg
+from typing import List, Tuple
+from ._bank import _asbank, _response
+from ._lyap import _sosspace, _dlyap
+
+def filternorm(system, pnorm=2, sos:bool=False):
+    """
+    2-norm or infinity-norm of digital filters.
+
+    The 2-norm, the square root of the energy of the impulse response
+    (the square root of the noise gain), is computed without the impulse
+    response. For (num, den), it is computed by the Astrom-Jury recursion,
+    the Schur-Cohn step-down of the denominator, for a bank of filters at
+    once. For second-order sections, it is sqrt(D^2 + B^T W B) where W is
+    the observability Gramian of the state-space realization of the
+    cascade, the solution of a discrete Lyapunov equation.
+
+    Parameters
+    ----------
+        system : a tuple of array_like describing the system.
+            The following gives the number of elements in the tuple and
+            the interpretation:
+
+                * (num, den)
+
+            `num` may be a 2D array which rows are the numerators of a bank
+            of filters, and `den` may be a scalar, a 1D array or a 2D array.
+            A list of (num, den) is also accepted. If `sos` is True, `system`
+            is an array of second-order sections which shape is
+            (n_sections, 6) or (n_filters, n_sections, 6).
+
+        pnorm : {2, np.inf}, optional
+            The norm. np.inf is the maximum magnitude of the frequency
+            response, evaluated on a grid of at least 8192 frequencies.
+            Default is 2.
+
+        sos : bool, optional
+            If True, `system` is second-order sections. The 2-norm of the
+            cascade is computed from the state-space realization of the
+            sections without expanding them to a transfer function.
+            Default is False.
+
+    Raises
+    ------
+        ValueError
+            If `pnorm` is not 2 or np.inf.
+            If the 2-norm of an unstable filter is required.
+
+    Returns
+    -------
+        L : float or ndarray
+            The norm of the filter, or the norms of the bank of filters.
+    """
+
+    if (pnorm in [2, np.inf]) == False:
+        raise ValueError("`pnorm` must be 2 or np.inf.")
+
+    if sos:
+        sos = np.asarray(system, dtype=float)
+        if sos.shape[-1] != 6:
+            raise ValueError("`sos` must be an array of shape (..., 6).")
+        shape = sos.shape[:-2]
+        sos = sos.reshape((-1,) + sos.shape[-2:])
+        if pnorm == 2:
+            ss = [_sosspace(s) for s in sos]
+            L = _h2([x[0] for x in ss], [x[1] for x in ss],
+                    [x[2] for x in ss], [x[3] for x in ss])
+        else:
+            w = np.linspace(0, np.pi, max(8192, 64*sos.shape[1]))
+            h = np.ones((len(sos), len(w)))
+            for i in range(sos.shape[1]):
+                h *= np.abs(_response(sos[:, i, :3], sos[:, i, 3:], w))
+            L = np.max(h, axis=1)
+        L = L.reshape(shape)
+        return float(L) if shape == () else L
+
+    b, a, single = _asbank(system)
+    if pnorm == 2:
+        L = np.zeros(len(b))
+        fir = np.all(a[:, 1:] == 0, axis=1)
+        # FIR filters are the root of the sum of the squared coefficients.
+        L[fir] = np.sqrt(np.sum(np.abs(b[fir])**2, axis=1)) / np.abs(a[fir, 0])
+        if np.any(~fir):
+            L[~fir] = np.sqrt(_astrom(b[~fir], a[~fir]))
+    else:
+        w = np.linspace(0, np.pi, max(8192, 64*max(b.shape[1], a.shape[1])))
+        L = np.max(np.abs(_response(b, a, w)), axis=1)
+
+    return float(L[0]) if single else L
+
+
+def _h2(A:list, B:list, C:list, D:list) -> np.ndarray:
+    """
+    2-norms of stable state-space systems. The systems of the same order
+    are solved at once.
+    """
+
+    L = np.zeros(len(A))
+    order = np.array([len(x) for x in A])
+    for m in np.unique(order):
+        idx = np.flatnonzero(order == m)
+        As = np.array([A[i] for i in idx]).reshape(len(idx), m, m)
+        Bs = np.array([B[i] for i in idx]).reshape(len(idx), m)
+        Cs = np.array([C[i] for i in idx]).reshape(len(idx), m)
+        Ds = np.array([D[i] for i in idx])
+        if m and np.max(np.abs(np.linalg.eigvals(As))) >= 1:
+            raise ValueError("The 2-norm of an unstable filter is infinite.")
+        if m <= 16:
+            W = _dlyap(As, Cs[:, :, None] * Cs[:, None, :])
+        else:
+            # The Kronecker product form is too large for high orders.
+            W = np.array([scipy.linalg.solve_discrete_lyapunov(x.T, np.outer(c, c))
+                          for x, c in zip(As, Cs)])
+        L[idx] = np.sqrt(Ds**2 + np.einsum('ki,kij,kj->k', Bs, W, Bs))
+
+    return L
+
+
+def _astrom(b:np.ndarray, a:np.ndarray) -> np.ndarray:
+    """
+    Energies of the impulse responses of the rows of b and a by the
+    Astrom-Jury recursion, which is better conditioned than the Lyapunov
+    equation of the companion form for high orders.
+    """
+
+    n = max(b.shape[1], a.shape[1])
+    bk = np.zeros((len(b), n))
+    ak = np.zeros((len(a), n))
+    bk[:, :b.shape[1]] = b
+    ak[:, :a.shape[1]] = a
+    scale = ak[:, 0].copy()
+
+    I = np.zeros(len(b))
+    for k in range(n-1, 0, -1):
+        alpha = ak[:, k] / ak[:, 0]
+        beta = bk[:, k] / ak[:, 0]
+        if np.any(np.abs(alpha) >= 1):
+            raise ValueError("The 2-norm of an unstable filter is infinite.")
+        I += bk[:, k]**2 / ak[:, 0]
+        rev = ak[:, k:0:-1]
+        ak, bk = ak[:, :k] - alpha[:, None]*rev, bk[:, :k] - beta[:, None]*rev
+    I += bk[:, 0]**2 / ak[:, 0]
+
+    return I / scale
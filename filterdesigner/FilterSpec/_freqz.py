@@ -4,8 +4,11 @@ import scipy as sp
 import numpy as np
 from typing import List, Tuple
 import sys    
+import functools
+import scipy.fft
         
-def freqz(system, worN:int=512, fs=2*np.pi, outform:str='complex')->Tuple:
+def freqz(system, worN:int=512, fs=2*np.pi, outform:str='complex', out=None,
+          precision:str='double')->Tuple:
     """
     Frequency response of a digital filter.
     
@@ -31,6 +34,22 @@ def freqz(system, worN:int=512, fs=2*np.pi, outform:str='complex')->Tuple:
         fs : float, optional
             The sampling frequency of the digital system.
             Defaults to 2*pi radians/sample (so w is from 0 to pi).
+
+        outform : str, optional
+            'complex', 'dB' or 'abs'. The form of the frequency response.
+            Default is 'complex'.
+
+        out : ndarray, optional
+            Buffer in which the frequency response is stored and returned.
+            Its length must be the number of frequencies, and its dtype must
+            be complex for 'complex' and real for 'dB' and 'abs', of the
+            precision given by `precision`. The magnitude and the decibels
+            are converted in place without temporary arrays.
+
+        precision : str, optional
+            'double' or 'single'. If 'single', the response is computed in
+            complex64, with the temporary arrays in single precision, and
+            returned in complex64 or float32. Default is 'double'.
         
         
     Returns
@@ -41,8 +60,25 @@ def freqz(system, worN:int=512, fs=2*np.pi, outform:str='complex')->Tuple:
                 
         h : ndarray
             The frequency response, as complex numbers.
+
+    Notes
+    -----
+        If `out` is given or `precision` is 'single' and worN is an integer,
+        the response is computed by real FFTs of the numerator and the
+        denominator, and `w` is a cached read-only array shared by the calls
+        with the same worN and fs.
     """
     
+    if (outform in ['complex', 'dB', 'abs']) == False:
+        raise ValueError("Parameter outform is must be 'complex', 'dB', or"
+                         +"'abs'.")
+
+    if (precision in ['double', 'single']) == False:
+        raise ValueError("`precision` must be 'double' or 'single'.")
+
+    if out is not None or precision == 'single':
+        return _freqzout(system, worN, fs, outform, out, precision)
+
     #Calcurate frequency response
     w, h = signal.freqz(system[0], system[1], worN=worN, fs=fs)
     
@@ -55,13 +91,95 @@ def freqz(system, worN:int=512, fs=2*np.pi, outform:str='complex')->Tuple:
         h = 20 * np.log10(np.abs(h))
         return w, h
     
-    elif outform == 'abs':
+    else:
         #If outform is 'abs', return np.abs(h)
         h = np.abs(h)
         return w, h
-    
+
+
+@functools.lru_cache(maxsize=64)
+def _grid(N:int, fs:float)->np.ndarray:
+    # Frequencies of signal.freqz for an integer worN, kept read-only.
+    w = np.linspace(0, np.pi, N, endpoint=False) * fs / (2*np.pi)
+    w.setflags(write=False)
+    return w
+
+
+def _fold(c:np.ndarray, nfft:int, dtype)->np.ndarray:
+    # Coefficients wrapped modulo nfft, which have the same DFT at the
+    # nfft frequencies as the coefficients padded with zeros.
+    c = np.atleast_1d(np.asarray(c, dtype=dtype))
+    if len(c) <= nfft:
+        return c
+    c = np.concatenate((c, np.zeros(-len(c) % nfft, dtype=dtype)))
+    return c.reshape(-1, nfft).sum(axis=0)
+
+
+def _polyval(c, zinv:np.ndarray, dtype)->np.ndarray:
+    # Polynomial of z^-1 with the coefficients c, at zinv.
+    c = np.atleast_1d(np.asarray(c, dtype=dtype))
+    h = np.full(len(zinv), c[-1], dtype=zinv.dtype)
+    for k in range(len(c)-2, -1, -1):
+        h *= zinv
+        h += c[k]
+    return h
+
+
+def _freqzout(system, worN, fs, outform:str, out, precision:str)->Tuple:
+    """
+    Frequency response stored in `out` with in-place conversions.
+    """
+
+    real = np.float32 if precision == 'single' else np.float64
+    cplx = np.complex64 if precision == 'single' else np.complex128
+    dtype = cplx if outform == 'complex' else real
+
+    # None is the default number of frequencies of signal.freqz.
+    if worN is None:
+        worN = 512
+
+    if isinstance(worN, (int, np.integer)):
+        N = int(worN)
+        w = _grid(N, float(fs))
     else:
-        #If the others raise the exception.
-        raise ValueError("Parameter outform is must be 'complex', 'dB', or"
-                         +"'abs'.")
-    
\ No newline at end of file
+        w = np.asarray(worN)
+        N = len(w)
+
+    if out is None:
+        out = np.empty(N, dtype=dtype)
+    elif out.shape != (N,) or out.dtype != dtype:
+        raise ValueError("`out` must be a 1D array of " + np.dtype(dtype).name
+                         + " which length is the number of frequencies.")
+
+    if isinstance(worN, (int, np.integer)):
+        # The FFT of length 2N gives the response at the N frequencies.
+        h = scipy.fft.rfft(_fold(system[0], 2*N, real), n=2*N)[:N]
+        den = np.atleast_1d(system[1])
+        if len(den) == 1:
+            h /= np.asarray(den[0], dtype=real)
+        else:
+            h /= scipy.fft.rfft(_fold(den, 2*N, real), n=2*N)[:N]
+    else:
+        # Horner's rule in z^-1 in the precision of `out`, with the
+        # temporaries of the length of `w` only.
+        wt = np.asarray(w, dtype=real) * real(2*np.pi/fs)
+        zinv = np.empty(N, dtype=cplx)
+        np.cos(wt, out=zinv.real)
+        np.sin(wt, out=zinv.imag)
+        np.negative(zinv.imag, out=zinv.imag)
+        h = _polyval(system[0], zinv, real)
+        den = np.atleast_1d(system[1])
+        if len(den) == 1:
+            h /= np.asarray(den[0], dtype=real)
+        else:
+            h /= _polyval(den, zinv, real)
+
+    if outform == 'complex':
+        out[...] = h
+    else:
+        np.abs(h, out=out)
+        if outform == 'dB':
+            np.log10(out, out=out)
+            out *= 20
+
+    return w, out
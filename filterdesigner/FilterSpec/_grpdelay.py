@@ -4,10 +4,16 @@ import scipy as sp
 import numpy as np
 from typing import List, Tuple
 import sys
+from ._bank import _asbank, _response
 
-def grpdelay(system, worN:int=512, fs=2*np.pi)->Tuple:
+def grpdelay(system, worN:int=512, fs=2*np.pi, sos:bool=False)->Tuple:
     """
     Group delay of a digital filter.
+
+    The group delay of a linear phase FIR filter, which coefficients are
+    symmetric or antisymmetric, is the constant n/2 without computation.
+    The group delay of second-order sections is the sum of the delays of
+    the sections, and a bank of filters is computed at once.
     
     Parameters
     ----------
@@ -16,6 +22,12 @@ def grpdelay(system, worN:int=512, fs=2*np.pi)->Tuple:
             the interpretation:
             
                 * (num, den)
+
+            `num` may be a 2D array which rows are the numerators of a bank
+            of filters, and `den` may be a scalar, a 1D array or a 2D array.
+            A list of (num, den) is also accepted. If `sos` is True, `system`
+            is an array of second-order sections which shape is
+            (n_sections, 6) or (n_filters, n_sections, 6).
                 
         worN : {None, int, array_like}, optional
             If a single integer, then compute at that many frequencies 
@@ -31,6 +43,10 @@ def grpdelay(system, worN:int=512, fs=2*np.pi)->Tuple:
         fs : float, optional
             The sampling frequency of the digital system.
             Defaults to 2*pi radians/sample (so w is from 0 to pi).
+
+        sos : bool, optional
+            If True, `system` is second-order sections.
+            Default is False.
             
     Returns
     -------
@@ -39,17 +55,82 @@ def grpdelay(system, worN:int=512, fs=2*np.pi)->Tuple:
             By default, w is normalized to the range [0, pi) (radians/sample).
             
         gd : ndarray
-            The group delay.
+            The group delay. A 2D array which rows are the filters for a
+            bank of filters.
     """
+
+    if sos:
+        sos = np.asarray(system)
+        if sos.shape[-1] != 6:
+            raise ValueError("`sos` must be an array of shape (..., 6).")
+        shape = sos.shape[:-2]
+        sec = sos.reshape(-1, 6)
+        w, gd = _bankdelay(sec[:, :3], sec[:, 3:], worN, fs)
+        # The delays of the sections are additive.
+        gd = np.sum(gd.reshape(shape + (sos.shape[-2], -1)), axis=-2)
+        return w, gd
+
+    if isinstance(system, list) or np.ndim(system[0]) > 1 or np.ndim(system[1]) > 1:
+        b, a, _ = _asbank(system)
+        return _bankdelay(b, a, worN, fs)
+
+    b = np.atleast_1d(system[0])
+    if np.size(system[1]) == 1 and _linearphase(b[None, :])[0]:
+        # Linear phase FIR filter
+        w = _grid(worN, fs)
+        return w, np.full(len(w), (len(b)-1)/2)
     
     # Calcurate the group delay of the digital filter
     w, gd = signal.group_delay(system, w = worN, fs = fs)
     
-    if type(system[1]) in [float, np.float, np.float16, np.float32, np.float64,  
-                       int, np.int, np.int0, np.int16, np.int32, np.int64, np.int8] and system[1] == 1:
-        # If filter is FIR, round the group_delay
-        gd = np.round(gd)
-    
     # Return the frequency and group delay
     return w, gd
-    
+
+
+def _grid(worN, fs)->np.ndarray:
+    # Frequencies in the same units as fs, the same as signal.group_delay.
+    if worN is None:
+        worN = 512
+    if isinstance(worN, (int, np.integer)):
+        return np.linspace(0, np.pi, worN, endpoint=False)*fs/(2*np.pi)
+    return np.atleast_1d(worN)*1.0
+
+
+def _linearphase(b:np.ndarray)->np.ndarray:
+    # True for the rows which coefficients are symmetric or antisymmetric.
+    tol = 1e-12 * np.max(np.abs(b), axis=1)
+    sym = np.all(np.abs(b - b[:, ::-1]) <= tol[:, None], axis=1)
+    anti = np.all(np.abs(b + b[:, ::-1]) <= tol[:, None], axis=1)
+    return (sym | anti) & np.any(b != 0, axis=1)
+
+
+def _bankdelay(b:np.ndarray, a:np.ndarray, worN, fs)->Tuple:
+    """
+    Group delay of a bank of filters, Re(B'/B) - Re(A'/A) where B' is the
+    polynomial of the coefficients k*b[k].
+    """
+
+    w = _grid(worN, fs)
+    wr = 2*np.pi*w/fs
+
+    def delay(c):
+        k = np.arange(c.shape[1])
+        if c.shape[1] == 1:
+            return np.zeros((c.shape[0], len(wr)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.real(_response(c*k, c, wr))
+
+    gd = delay(b) - delay(a)
+
+    # Linear phase FIR filters have the constant delay.
+    fir = np.all(a[:, 1:] == 0, axis=1)
+    lin = fir & _linearphase(b)
+    gd[lin] = ((b.shape[1]-1)/2)
+
+    singular = ~np.isfinite(gd)
+    if np.any(singular):
+        gd[singular] = 0
+        warnings.warn("The group delay is singular at some frequencies, "
+                      + "setting to 0", stacklevel=3)
+
+    return w, gd
@@ -4,6 +4,8 @@ import scipy as sp
 import numpy as np
 from typing import List, Tuple
 import sys
+from ._lyap import _statespace, _obsgram
+from .._validate import _isint
 
 def impz(system:tuple, n:int=None, fs:int=1)->Tuple:
     """
@@ -40,7 +42,7 @@ def impz(system:tuple, n:int=None, fs:int=1)->Tuple:
     """
     
     # when FIR filter
-    if type(system[1]) == int and system[1] == 1:
+    if _isint(system[1]) and system[1] == 1:
         # calcurate time points
         if n == None:
             # automatically determine the length of time points
@@ -72,4 +74,84 @@ def impz(system:tuple, n:int=None, fs:int=1)->Tuple:
         yout = i_d[1][0]
         
     return T, yout
-    
+
+
+def impzgen(system:tuple, n:int=None, fs:int=1, blocksize:int=4096,
+            tol:float=None):
+    """
+    Impulse response of a digital filter in blocks.
+
+    A generator version of `impz` for very long impulse responses. The
+    response is computed in blocks by `scipy.signal.lfilter`, carrying the
+    filter state from one block to the next.
+
+    Parameters
+    ----------
+        system : a tuple of array_like describing the system.
+            The following gives the number of elements in the tuple and
+            the interpretation:
+
+                * (num, den)
+
+        n : int, optional
+            The number of time points to compute. Default is the length of
+            the numerator for FIR filters and unlimited for IIR filters.
+
+        fs : int optional
+            Sampling frequency to calcurate time points. default is 1.
+
+        blocksize : int, optional
+            The number of time points of each block. Default is 4096.
+
+        tol : float, optional
+            If given, stop after the block at which the energy of the rest of
+            the response is at most `tol` times the energy of the whole
+            response. The energy of the rest is computed exactly from the
+            filter state by the observability Gramian. If the filter is not
+            stable, the response does not decay and `n` must be given.
+
+    Raises
+    ------
+        ValueError
+            If neither `n` nor `tol` is given for an IIR filter.
+            If `n` is not given for an unstable IIR filter.
+
+    Yields
+    ------
+        T : ndarray
+            A 1-D array of time points of the block.
+
+        yout : ndarray
+            A 1-D array containing the impulse response of the block.
+    """
+
+    b = np.atleast_1d(system[0])
+    a = np.atleast_1d(system[1])
+
+    if n == None:
+        if len(a) == 1:
+            n = len(b)
+        elif tol is None:
+            raise ValueError("`n` or `tol` must be given for an IIR filter.")
+
+    A, B, C, D = _statespace(b, a)
+    W = None if tol is None else _obsgram(A, C)
+    if W is None and n == None:
+        raise ValueError("`n` must be given for an unstable IIR filter.")
+    if W is not None:
+        # Energy of the whole response, D^2 plus the tail from x[1] = B.
+        total = D**2 + B @ W @ B
+
+    zi = np.zeros(max(len(a), len(b)) - 1)
+    start = 0
+    while n == None or start < n:
+        m = blocksize if n == None else min(blocksize, n - start)
+        x = np.zeros(m)
+        if start == 0:
+            x[0] = 1
+        yout, zi = signal.lfilter(b, a, x, zi=zi)
+        yield np.arange(start, start + m) / fs, yout
+        start += m
+
+        if W is not None and zi @ W @ zi <= tol * total:
+            return
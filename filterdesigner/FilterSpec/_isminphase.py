@@ -1,15 +1,19 @@
 import scipy.signal as signal
-from ._zplane import zplane
 import warnings
 import scipy as sp
 import numpy as np
 from typing import List, Tuple
 import sys
 
-def isminphase(system, tol:float=sys.float_info.epsilon**(2/3))->bool:
+def isminphase(system, tol:float=sys.float_info.epsilon**(2/3), sos:bool=False,
+               margin:bool=False):
     """
     Determine whether is minimum phase.
 
+    The zeros are not computed. Instead, a Schur-Cohn step-down recursion
+    checks that all zeros are inside the circle of radius 1-tol, for all
+    numerators of a bank of filters at once.
+
     Parameters
     ----------
     system : a tuple of array_like describing the system.
@@ -18,14 +22,89 @@ def isminphase(system, tol:float=sys.float_info.epsilon**(2/3))->bool:
                 
             * (num, den)
 
+        `num` may be a 2D array which rows are the numerators of a bank
+        of filters. If `sos` is True, `system` is an array of second-order
+        sections which shape is (n_sections, 6) or (n_filters, n_sections, 6).
+
+    tol : float, optional
+        Zeros with magnitudes greater than 1-tol are regarded as outside the
+        unit circle.
+
+    sos : bool, optional
+        If True, `system` is second-order sections, and each section is
+        checked separately.
+        Default is False.
+
+    margin : bool, optional
+        If True, the stability margin of the recursion is also returned.
+        Default is False.
+
     Returns
     -------
-    flag : bool
+    flag : bool or ndarray
         If `system` is minimum phase, return True.
 
+    mgn : float or ndarray
+        Returned if `margin` is True. 1 minus the largest magnitude of the
+        reflection coefficients of the numerator, which is positive if and
+        only if `system` is minimum phase. The margin stops at the first
+        reflection coefficient with magnitude 1 or more.
+
     """
-    z, _, _ = zplane(system, show=False)
-    frag = np.max(np.abs(z)) <= 1.0 - tol
-    
+
+    if sos:
+        sos = np.asarray(system)
+        if sos.shape[-1] != 6:
+            raise ValueError("`sos` must be an array of shape (..., 6).")
+        num = sos[..., :3]
+        shape = num.shape[:-2]
+        mgn = _schurcohn(num.reshape(-1, 3), 1.0 - tol)
+        mgn = np.min(mgn.reshape(shape + (-1,)), axis=-1)
+    else:
+        num = np.asarray(system[0])
+        shape = num.shape[:-1]
+        mgn = _schurcohn(np.atleast_2d(num), 1.0 - tol).reshape(shape)
+
+    frag = mgn > 0
+    if shape == ():
+        frag = bool(frag)
+        mgn = float(mgn)
+
+    if margin:
+        return frag, mgn
     return frag
-    
\ No newline at end of file
+
+
+def _schurcohn(c:np.ndarray, r:float)->np.ndarray:
+    """
+    Margins of the Schur-Cohn recursion for the rows of `c`, which are
+    positive if all roots of the rows are inside the circle of radius `r`.
+    """
+
+    c = np.asarray(c)
+    c = c.astype(np.result_type(c, float))
+
+    # Shift out the leading zeros, which do not give zeros in the z-plane.
+    # The trailing zeros appended instead are zeros at the origin.
+    lead = np.argmax(c != 0, axis=1)
+    if np.any(lead):
+        idx = np.arange(c.shape[1]) + lead[:, None]
+        c = np.where(idx < c.shape[1], np.take_along_axis(c, np.minimum(idx, c.shape[1]-1), axis=1), 0)
+
+    # Scale the roots by 1/r.
+    c = c * (1/r) ** np.arange(c.shape[1])
+
+    k = c.shape[0]
+    mgn = np.ones(k)
+    alive = np.any(c != 0, axis=1)
+    a = np.where(alive[:, None], c, 1)
+    for n in range(c.shape[1]-1, 0, -1):
+        # Reflection coefficient and step-down of the degree n polynomials.
+        rc = a[:, n] / a[:, 0]
+        m = 1 - np.abs(rc)
+        mgn = np.where(alive, np.minimum(mgn, m), mgn)
+        alive = alive & (m > 0)
+        d = np.where(alive, 1 - np.abs(rc)**2, 1)
+        a = (a[:, :n] - rc[:, None] * np.conj(a[:, n:0:-1])) / d[:, None]
+
+    return mgn
@@ -0,0 +1,92 @@
+import numpy as np
+import scipy.linalg
+from typing import List, Tuple
+
+def _statespace(b, a) -> Tuple:
+    """
+    State-space matrices of the transposed direct form II realization,
+    which states are the same as `zi` of `scipy.signal.lfilter`.
+
+    Returns (A, B, C, D), where x[n+1] = A x[n] + B u[n] and
+    y[n] = C x[n] + D u[n].
+    """
+
+    b = np.atleast_1d(np.asarray(b, dtype=float))
+    a = np.atleast_1d(np.asarray(a, dtype=float))
+    b = b / a[0]
+    a = a / a[0]
+    m = max(len(b), len(a))
+    b = np.hstack((b, np.zeros(m - len(b))))
+    a = np.hstack((a, np.zeros(m - len(a))))
+
+    A = np.zeros((m-1, m-1))
+    A[:, 0] = -a[1:]
+    A[np.arange(m-2), np.arange(1, m-1)] = 1.0
+    B = b[1:] - a[1:] * b[0]
+    C = np.zeros(m-1)
+    if m > 1:
+        C[0] = 1.0
+    D = b[0]
+
+    return A, B, C, D
+
+
+def _obsgram(A:np.ndarray, C:np.ndarray) -> np.ndarray:
+    """
+    Observability Gramian W = sum (A^T)^k C^T C A^k of a stable system, so
+    that the energy of the zero-input response from the state x is x^T W x.
+
+    Returns None if the system is not stable.
+    """
+
+    if A.shape[0] == 0:
+        return A
+    if np.max(np.abs(np.linalg.eigvals(A))) >= 1:
+        return None
+
+    return scipy.linalg.solve_discrete_lyapunov(A.T, np.outer(C, C))
+
+
+def _sosspace(sos:np.ndarray) -> Tuple:
+    """
+    State-space matrices of a cascade of second-order sections, each
+    realized in the transposed direct form II. The states of the section i
+    are x[2i] and x[2i+1].
+    """
+
+    sos = np.asarray(sos, dtype=float)
+    L = sos.shape[0]
+    A = np.zeros((2*L, 2*L))
+    B = np.zeros(2*L)
+    C = np.zeros(2*L)
+    D = 1.0
+    for i in range(L):
+        Ai, Bi, Ci, Di = _statespace(sos[i, :3], sos[i, 3:])
+        j = slice(2*i, 2*i+2)
+        # The input of the section i is the output of the section i-1,
+        # C x + D u of the previous sections.
+        A[j, j] = Ai
+        A[j, :2*i] = np.outer(Bi, C[:2*i])
+        B[j] = Bi * D
+        C[:2*i] = Di * C[:2*i]
+        C[j] = Ci
+        D = Di * D
+
+    return A, B, C, D
+
+
+def _dlyap(A:np.ndarray, Q:np.ndarray) -> np.ndarray:
+    """
+    Solutions W of W = A^T W A + Q for stacks of A and Q, which shapes are
+    (k, m, m), by the Kronecker product form of the Lyapunov equation.
+    """
+
+    k, m = A.shape[0], A.shape[1]
+    if m == 0:
+        return np.zeros((k, 0, 0))
+
+    At = np.swapaxes(A, 1, 2)
+    kron = np.einsum('kij,klm->kiljm', At, At).reshape(k, m*m, m*m)
+    W = np.linalg.solve(np.eye(m*m) - kron, Q.reshape(k, m*m, 1))
+
+    return W.reshape(k, m, m)
@@ -0,0 +1,227 @@
+import numpy as np
+from typing import List, Tuple
+from ._bank import _asbank, _response, _rowresponse
+
+def measure(system, f, a, fs:float=2, Apass=None, Astop=None,
+            xtol:float=1e-10, sos:bool=False)->Tuple:
+    """
+    Measure the frequency response characteristics of digital filters.
+
+    The passband ripple, the stopband attenuation, the 3 dB point and the
+    transition width are measured from the magnitude response of a filter
+    or a bank of filters. The extrema and the crossings are bracketed on a
+    coarse grid of a few points per ripple, and then refined by golden
+    section search and bisection for all filters at once.
+
+    Parameters
+    ----------
+        system : a tuple of array_like describing the system.
+            The following gives the number of elements in the tuple and
+            the interpretation:
+
+                * (num, den)
+
+            `num` may be a 2D array which rows are the numerators of a bank
+            of filters, and `den` may be a scalar, a 1D array or a 2D array.
+            A list of (num, den) is also accepted. If `sos` is True, `system`
+            is an array of second-order sections which shape is
+            (n_sections, 6) or (n_filters, n_sections, 6).
+
+        f : array_like
+            Band edges. The length of `f` is the length of `2*len(a)-2`.
+            The same as `kaiserord`.
+
+        a : array_like
+            Band amplitude. Bands with zero amplitude are stopbands and the
+            others are passbands. Pass and stop bands must be alternating.
+
+        fs : float, optional
+            Sample rate. The frequency band edges in f must be from 0 to fs/2.
+            Default is 2.
+
+        Apass : float, optional
+            Passband ripple (dB) used to measure the transition width.
+            Default is the measured passband ripple.
+
+        Astop : float, optional
+            Stopband attenuation (dB) used to measure the transition width.
+            Default is the measured stopband attenuation.
+
+        xtol : float, optional
+            Absolute tolerance of the measured frequencies relative to `fs`.
+            Default is 1e-10.
+
+        sos : bool, optional
+            If True, `system` is second-order sections, and the response of
+            the cascade is the product of the responses of the sections,
+            without expanding them to a transfer function. Default is False.
+
+    Raises
+    ------
+        ValueError
+            If the length of `f` is not same as `2*len(a)-2`.
+            If pass and stop bands in `a` are not alternating.
+            If `sos` is True and the shape of `system` is not (..., 6).
+
+    Returns
+    -------
+        Rp : ndarray
+            Peak-to-peak ripple in each passband (dB).
+
+        Rs : ndarray
+            Attenuation in each stopband relative to the largest passband
+            amplitude (dB).
+
+        F3dB : ndarray
+            The frequency in each transition band at which the magnitude
+            response is 3 dB below the amplitude of the adjacent passband.
+            NaN if the response does not cross the level in the transition
+            band.
+
+        TW : ndarray
+            The width of each transition band between the frequency at which
+            the response leaves the passband ripple `Apass` and the frequency
+            at which it reaches the stopband attenuation `Astop`.
+            NaN if the response does not cross the levels.
+
+        The shape of each array is (number of bands,) for a single filter
+        and (number of filters, number of bands) for a bank of filters.
+    """
+
+    f = np.atleast_1d(np.asarray(f, dtype=float))
+    a = np.atleast_1d(np.asarray(a, dtype=float))
+
+    # Parameter check
+    if len(f) != 2*len(a)-2:
+        raise ValueError("The length of 'f' must be the length of 2*len(a)-2.")
+
+    passband = (a != 0)
+    if np.any(passband[:-1] == passband[1:]):
+        raise ValueError("Pass and stop bands in a must be strictly alternating.")
+
+    if sos:
+        sections = np.asarray(system, dtype=float)
+        if sections.shape[-1] != 6 or sections.ndim < 2:
+            raise ValueError("`sos` must be an array of shape (..., 6).")
+        single = (sections.ndim == 2)
+        sections = sections.reshape((-1,) + sections.shape[-2:])
+        k = sections.shape[0]
+        ntaps = 2*sections.shape[1] + 1
+
+        def response(func, w):
+            # Product of the responses of the sections.
+            h = 1
+            for i in range(sections.shape[1]):
+                h = h * func(sections[:, i, :3], sections[:, i, 3:], w, fs=fs)
+            return h
+    else:
+        b, den, single = _asbank(system)
+        k = b.shape[0]
+        ntaps = max(b.shape[1], den.shape[1])
+
+        def response(func, w):
+            return func(b, den, w, fs=fs)
+
+    bands = np.hstack(([0], f, [fs/2]))
+    xtol = xtol * fs
+
+    def mag(w):
+        # Magnitude response of the i-th filter at w[i].
+        return np.abs(response(_rowresponse, w))
+
+    def coarse(lo, hi):
+        # Coarse grid with about 4 points per ripple.
+        n = int(np.clip(np.ceil(4*ntaps*(hi-lo)/(fs/2)), 16, 4096))
+        w = np.linspace(lo, hi, n)
+        return w, np.abs(response(_response, w))
+
+    def extremum(lo, hi, sign):
+        # Maximum of sign*|H| in [lo, hi] for each filter.
+        w, h = coarse(lo, hi)
+        i = np.argmax(sign*h, axis=1)
+        x0 = w[np.maximum(i-1, 0)]
+        x1 = w[np.minimum(i+1, len(w)-1)]
+        # Golden section search
+        g = (np.sqrt(5)-1)/2
+        c = x1 - g*(x1-x0)
+        d = x0 + g*(x1-x0)
+        fc = sign*mag(c)
+        fd = sign*mag(d)
+        while np.max(x1-x0) > xtol:
+            # Keep [x0, d] if fc > fd, otherwise [c, x1].
+            left = fc > fd
+            x0, x1 = np.where(left, x0, c), np.where(left, d, x1)
+            new = np.where(left, x1-g*(x1-x0), x0+g*(x1-x0))
+            fnew = sign*mag(new)
+            c, d, fc, fd = (np.where(left, new, d), np.where(left, c, new),
+                            np.where(left, fnew, fd), np.where(left, fc, fnew))
+        # The extremum may be at the grid points or the band edges.
+        return np.maximum(sign*h[np.arange(k), i], np.maximum(fc, fd))*sign
+
+    def crossing(lo, hi, level, fromleft, clip):
+        # First frequency from the pass side at which |H| falls to `level`.
+        # If |H| is already below `level` at the band edge, the edge is
+        # returned when `clip` is True, otherwise NaN.
+        w, h = coarse(lo, hi)
+        if not fromleft:
+            w = w[::-1]
+            h = h[:, ::-1]
+        below = h <= level[:, None]
+        found = np.any(below, axis=1)
+        i = np.argmax(below, axis=1)
+        x1 = w[i]
+        x0 = w[np.maximum(i-1, 0)]
+        # Bisection
+        while np.max(np.abs(x1-x0)) > xtol:
+            mid = (x0+x1)/2
+            under = mag(mid) <= level
+            x1 = np.where(under, mid, x1)
+            x0 = np.where(under, x0, mid)
+        x = np.where(i == 0, w[0] if clip else np.nan, x1)
+        return np.where(found, x, np.nan)
+
+    Rp = []
+    Rs = []
+    hpass = {}
+    hstop = {}
+    for i in range(len(a)):
+        lo = bands[2*i]
+        hi = bands[2*i+1]
+        hmax = extremum(lo, hi, 1)
+        if passband[i]:
+            hmin = extremum(lo, hi, -1)
+            hpass[i] = hmin
+            Rp.append(20*np.log10(hmax/hmin))
+        else:
+            hstop[i] = hmax
+            Rs.append(-20*np.log10(hmax/np.max(a)))
+
+    F3dB = []
+    TW = []
+    for i in range(len(a)-1):
+        lo = bands[2*i+1]
+        hi = bands[2*i+2]
+        p = i if passband[i] else i+1
+        s = i+1 if passband[i] else i
+        fromleft = passband[i]
+        ap = np.full(k, a[p])
+        F3dB.append(crossing(lo, hi, ap/np.sqrt(2), fromleft, False))
+
+        # Levels of the passband and stopband edges
+        if Apass is None:
+            lp = hpass[p]
+        else:
+            lp = ap * 10**(-Apass/20)
+        if Astop is None:
+            ls = hstop[s]
+        else:
+            ls = np.max(a) * 10**(-Astop/20) * np.ones(k)
+        fp = crossing(lo, hi, lp, fromleft, True)
+        fstop = crossing(lo, hi, ls, fromleft, True)
+        TW.append(np.abs(fstop-fp))
+
+    Rp, Rs, F3dB, TW = [np.array(x).T.reshape(k, -1) for x in (Rp, Rs, F3dB, TW)]
+    if single:
+        Rp, Rs, F3dB, TW = Rp[0], Rs[0], F3dB[0], TW[0]
+
+    return Rp, Rs, F3dB, TW
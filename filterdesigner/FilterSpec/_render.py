@@ -0,0 +1,153 @@
+import io
+import os
+import numpy as np
+import scipy.signal as signal
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib import patches
+
+def render(system, kind:str='zplane', fmt:str='png', worN:int=512,
+           fs=2*np.pi, figsize:Tuple[int, int]=(8, 8), dpi:int=100)->bytes:
+    """
+    Render a plot of a digital filter to an image without pyplot.
+
+    The plot is drawn on its own Figure and Agg canvas, which are not
+    registered in pyplot. Therefore `render` can be called from multiple
+    threads at once, and the figure is freed when it is returned.
+
+    Parameters
+    ----------
+        system : a tuple of array_like describing the system.
+            The following gives the number of elements in the tuple and
+            the interpretation:
+
+                * (num, den)
+
+        kind : str, optional
+            'zplane' for a zero-pole plot, or 'freqz' for the magnitude (dB)
+            and phase responses.
+            Default is 'zplane'.
+
+        fmt : str, optional
+            'png' or 'svg'.
+            Default is 'png'.
+
+        worN : int, optional
+            The number of frequencies of 'freqz'. Default is 512.
+
+        fs : float, optional
+            The sampling frequency of 'freqz'.
+            Defaults to 2*pi radians/sample.
+
+        figsize : tuple, optional
+            The figure size in inches. Default is (8, 8).
+
+        dpi : int, optional
+            The resolution of 'png' in dots per inch. Default is 100.
+
+    Raises
+    ------
+        ValueError
+            If `kind` is not 'zplane' or 'freqz'.
+            If `fmt` is not 'png' or 'svg'.
+
+    Returns
+    -------
+        image : bytes
+            The image file.
+    """
+
+    if (kind in ['zplane', 'freqz']) == False:
+        raise ValueError("`kind` must be 'zplane' or 'freqz'.")
+
+    if (fmt in ['png', 'svg']) == False:
+        raise ValueError("`fmt` must be 'png' or 'svg'.")
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+
+    if kind == 'zplane':
+        z, p, _ = signal.tf2zpk(system[0], system[1])
+        _drawzplane(fig.add_subplot(111), z, p)
+    else:
+        w, h = signal.freqz(system[0], system[1], worN=worN, fs=fs)
+        ax1 = fig.add_subplot(211)
+        ax2 = fig.add_subplot(212, sharex=ax1)
+        with np.errstate(divide='ignore'):
+            ax1.plot(w, 20*np.log10(np.abs(h)))
+        ax1.set_ylabel('Magnitude (dB)')
+        ax1.grid(True)
+        ax2.plot(w, np.unwrap(np.angle(h)))
+        ax2.set_ylabel('Phase (rad)')
+        ax2.set_xlabel('Frequency')
+        ax2.grid(True)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt)
+
+    return buf.getvalue()
+
+
+def renderbank(systems:list, kind:str='zplane', fmt:str='png',
+               max_workers:int=None, **kwargs)->List[bytes]:
+    """
+    Render plots of a bank of digital filters in a pool of processes.
+
+    Parameters
+    ----------
+        systems : list of tuple of array_like
+            The filters (num, den) to be rendered.
+
+        kind, fmt :
+            The same as `render`.
+
+        max_workers : int, optional
+            The number of processes. If 1, the plots are rendered in the
+            calling process. Default is the number of processors.
+
+        **kwargs :
+            The other parameters of `render`.
+
+    Returns
+    -------
+        images : list of bytes
+            The image files in the order of `systems`.
+    """
+
+    systems = [(np.asarray(s[0]), np.asarray(s[1])) for s in systems]
+    if max_workers == 1:
+        return [render(s, kind, fmt, **kwargs) for s in systems]
+
+    args = [(s, kind, fmt, kwargs) for s in systems]
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(args) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_renderargs, args, chunksize=chunksize))
+
+
+def _renderargs(args)->bytes:
+    # Picklable entry point of the worker processes.
+    system, kind, fmt, kwargs = args
+    return render(system, kind, fmt, **kwargs)
+
+
+def _drawzplane(ax, z, p):
+    """
+    Draw a zero-pole plot on the axes `ax`.
+    """
+
+    uc = patches.Circle((0, 0), radius=1, fill=False,
+                        color='black', ls='dashed')
+    ax.add_patch(uc)
+    ax.plot(z.real, z.imag, 'go', ms=10)
+    ax.plot(p.real, p.imag, 'rx', ms=10)
+    ax.spines['left'].set_position('center')
+    ax.spines['bottom'].set_position('center')
+    ax.spines['right'].set_visible(False)
+    ax.spines['top'].set_visible(False)
+    ax.axis('scaled')
+    ticks = [-1, -.5, .5, 1]
+    ax.set_xticks(ticks)
+    ax.set_yticks(ticks)
@@ -0,0 +1,111 @@
+import numpy as np
+from typing import List, Tuple
+from ._bank import _asbank, _response
+
+def specmargin(system, f, a, dev, fs:float=2, lgrid:int=16, maxgrid:int=8192,
+               chunk:int=2**20) -> np.ndarray:
+    """
+    Worst-case margins of digital filters against a piecewise-constant
+    magnitude specification.
+
+    The magnitude response is evaluated only in the bands defined by `f`,
+    on a grid whose density follows the filter length and is bounded by
+    `maxgrid` points per band. The response of a bank of filters is
+    evaluated in blocks of frequencies whose response and cos/sin matrices
+    have at most `chunk` elements, and only the running worst case is kept.
+
+    Parameters
+    ----------
+        system : a tuple of array_like describing the system.
+            The following gives the number of elements in the tuple and
+            the interpretation:
+
+                * (num, den)
+
+            `num` may be a 2D array which rows are the numerators of a bank
+            of filters, and `den` may be a scalar, a 1D array or a 2D array.
+            A list of (num, den) is also accepted.
+
+        f : array_like
+            Band edges. The length of `f` is the length of `2*len(a)-2`.
+            The same as `kaiserord`.
+
+        a : array_like
+            Band amplitude. The amplitude is specified on the bands defined
+            by `f`.
+
+        dev : array_like
+            Maximum allowable deviation for each band, specified as positive
+            numbers representing absolute filter gain (unit-less).
+            A scalar applies to all bands.
+
+        fs : float, optional
+            Sample rate. The frequency band edges in f must be from 0 to fs/2.
+            Default is 2.
+
+        lgrid : int, optional
+            Grid density. The grid on the whole frequency range is of size
+            (numtaps + 1) * lgrid. Default is 16.
+
+        maxgrid : int, optional
+            The maximum number of grid points in each band. Default is 8192.
+
+        chunk : int, optional
+            The maximum number of the elements of the response and of the
+            cos/sin matrices (number of taps by frequencies) evaluated at
+            once. Default is 2**20.
+
+    Raises
+    ------
+        ValueError
+            If the length of `f` is not same as `2*len(a)-2`.
+            If the length `a` and `dev` is not the same.
+
+    Returns
+    -------
+        margin : ndarray
+            `dev` minus the maximum deviation of the magnitude response from
+            `a` in each band. The filter meets the specification when all
+            margins are not negative. The shape is (len(a),) for a single
+            filter and (number of filters, len(a)) for a bank.
+    """
+
+    f = np.atleast_1d(np.asarray(f, dtype=float))
+    a = np.atleast_1d(np.asarray(a, dtype=float))
+    dev = np.atleast_1d(np.asarray(dev, dtype=float))
+
+    # Parameter check
+    if len(f) != 2*len(a)-2:
+        raise ValueError("The length of 'f' must be the length of 2*len(a)-2.")
+
+    if (len(dev) != len(a)) and (len(dev) != 1):
+        raise ValueError("'dev' and 'a' must be the same size.")
+    dev = np.broadcast_to(dev, a.shape)
+
+    b, den, single = _asbank(system)
+    bands = np.hstack(([0], f, [fs/2]))
+    ntaps = max(b.shape[1], den.shape[1])
+
+    # Number of the grid points in each band.
+    npts = np.ceil(lgrid*(ntaps+1)*(bands[1::2]-bands[0::2])/(fs/2))
+    npts = np.clip(npts, 8, maxgrid).astype(int)
+
+    # The number of frequencies evaluated at once, for which both the
+    # response (filters x frequencies) and the cos/sin matrices of
+    # `_response` (taps x frequencies) fit in `chunk` elements.
+    step = max(chunk // max(b.shape[0], ntaps), 1)
+
+    err = np.zeros((b.shape[0], len(a)))
+    for i in range(len(a)):
+        w = np.linspace(bands[2*i], bands[2*i+1], npts[i])
+        for j in range(0, len(w), step):
+            h = np.abs(_response(b, den, w[j:j+step], fs=fs))
+            h -= a[i]
+            np.abs(h, out=h)
+            np.maximum(err[:, i], np.max(h, axis=1), out=err[:, i])
+
+    margin = dev - err
+    if single:
+        margin = margin[0]
+
+    return margin
@@ -0,0 +1,124 @@
+import scipy.signal as signal
+import numpy as np
+from typing import List, Tuple
+from ._lyap import _statespace, _obsgram
+
+def stepz(system:tuple, n:int=None, fs:int=1)->Tuple:
+    """
+    Step response of a digital filter.
+    
+    Parameters
+    ----------
+        system : a tuple of array_like describing the system.
+            The following gives the number of elements in the tuple and
+            the interpretation:
+                
+                * (num, den)
+                
+        n : int, optional
+            The number of time points to compute. Default is the length of
+            the numerator for FIR filters and 100 for IIR filters.
+            
+        fs : int optional
+            Sampling frequency to calcurate time points. default is 1.
+            
+    Returns
+    -------
+        T : ndarray
+            A 1-D array of time points.
+            
+        yout : ndarray
+            A 1-D array containing the step response of the system.
+    """
+
+    b = np.atleast_1d(system[0])
+    a = np.atleast_1d(system[1])
+
+    if n == None:
+        n = len(b) if len(a) == 1 else 100
+
+    T = np.arange(n) / fs
+    yout = signal.lfilter(b, a, np.ones(n))
+
+    return T, yout
+
+
+def stepzgen(system:tuple, n:int=None, fs:int=1, blocksize:int=4096,
+             tol:float=None):
+    """
+    Step response of a digital filter in blocks.
+
+    A generator version of `stepz` for very long step responses. The
+    response is computed in blocks by `scipy.signal.lfilter`, carrying the
+    filter state from one block to the next.
+
+    Parameters
+    ----------
+        system : a tuple of array_like describing the system.
+            The following gives the number of elements in the tuple and
+            the interpretation:
+
+                * (num, den)
+
+        n : int, optional
+            The number of time points to compute. Default is the length of
+            the numerator for FIR filters and unlimited for IIR filters.
+
+        fs : int optional
+            Sampling frequency to calcurate time points. default is 1.
+
+        blocksize : int, optional
+            The number of time points of each block. Default is 4096.
+
+        tol : float, optional
+            If given, stop after the block at which the energy of the rest of
+            the transient, the difference from the final value, is at most
+            `tol` times the energy of the whole transient. The energy is
+            computed exactly from the filter state by the observability
+            Gramian. If the filter is not stable, the response does not
+            settle and `n` must be given.
+
+    Raises
+    ------
+        ValueError
+            If neither `n` nor `tol` is given for an IIR filter.
+            If `n` is not given for an unstable IIR filter.
+
+    Yields
+    ------
+        T : ndarray
+            A 1-D array of time points of the block.
+
+        yout : ndarray
+            A 1-D array containing the step response of the block.
+    """
+
+    b = np.atleast_1d(system[0])
+    a = np.atleast_1d(system[1])
+
+    if n == None:
+        if len(a) == 1:
+            n = len(b)
+        elif tol is None:
+            raise ValueError("`n` or `tol` must be given for an IIR filter.")
+
+    A, B, C, D = _statespace(b, a)
+    W = None if tol is None else _obsgram(A, C)
+    if W is None and n == None:
+        raise ValueError("`n` must be given for an unstable IIR filter.")
+    if W is not None:
+        # Steady state and the energy of the transient from the zero state.
+        xss = np.linalg.solve(np.eye(len(A)) - A, B)
+        yss = C @ xss + D
+        total = (D - yss)**2 + (B - xss) @ W @ (B - xss)
+
+    zi = np.zeros(max(len(a), len(b)) - 1)
+    start = 0
+    while n == None or start < n:
+        m = blocksize if n == None else min(blocksize, n - start)
+        yout, zi = signal.lfilter(b, a, np.ones(m), zi=zi)
+        yield np.arange(start, start + m) / fs, yout
+        start += m
+
+        if W is not None and (zi - xss) @ W @ (zi - xss) <= tol * total:
+            return
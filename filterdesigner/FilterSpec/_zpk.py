@@ -0,0 +1,99 @@
+import numpy as np
+from typing import List, Tuple
+from ._bank import _roots
+
+def zpk(system)->Tuple:
+    """
+    Zeros, poles and gains of digital filters.
+
+    The data-only counterpart of `zplane(show=False)` for a bank of
+    filters. The roots of all polynomials of the same degree are computed
+    by one batched eigenvalue call on their companion matrices, which are
+    balanced by LAPACK before the QR iteration, as in `numpy.roots`.
+
+    Parameters
+    ----------
+        system : a tuple of array_like describing the system.
+            The following gives the number of elements in the tuple and
+            the interpretation:
+
+                * (num, den)
+
+            `num` may be a 2D array which rows are the numerators of a bank
+            of filters, and `den` may be a scalar, a 1D array or a 2D array.
+            A list of (num, den) is also accepted.
+
+    Raises
+    ------
+        ValueError
+            If a numerator or a denominator is all zeros.
+
+    Returns
+    -------
+        z : ndarray
+            Zeros of the filters padded with NaN.
+
+        p : ndarray
+            Poles of the filters padded with NaN.
+
+        k : ndarray
+            Gains of the filters.
+
+        nz : ndarray
+            The number of zeros of each filter.
+
+        npoles : ndarray
+            The number of poles of each filter.
+
+        For a single filter, z and p are 1D arrays, and k, nz and npoles
+        are scalars. For a bank of filters, z and p are 2D arrays which rows
+        are the filters.
+    """
+
+    if isinstance(system, list):
+        nums = [np.atleast_1d(s[0]) for s in system]
+        dens = [np.atleast_1d(s[1]) for s in system]
+        single = False
+    else:
+        num = np.asarray(system[0])
+        den = np.asarray(system[1])
+        single = (num.ndim <= 1 and den.ndim <= 1)
+        num = np.atleast_2d(num)
+        den = np.atleast_2d(den)
+        K = max(num.shape[0], den.shape[0])
+        nums = list(np.broadcast_to(num, (K, num.shape[1])))
+        dens = list(np.broadcast_to(den, (K, den.shape[1])))
+
+    z, nz, lz = _stackroots(nums, "numerator")
+    p, npoles, lp = _stackroots(dens, "denominator")
+    k = np.array([nums[i][lz[i]] / dens[i][lp[i]] for i in range(len(nums))])
+
+    if single:
+        return z[0], p[0], k[0], nz[0], npoles[0]
+
+    return z, p, k, nz, npoles
+
+
+def _stackroots(polys:list, name:str)->Tuple:
+    """
+    Roots of a list of polynomials padded with NaN, the number of roots and
+    the index of the leading coefficient of each polynomial.
+    """
+
+    lead = []
+    for c in polys:
+        nonzero = np.flatnonzero(c)
+        if len(nonzero) == 0:
+            raise ValueError("The " + name + " must not be all zeros.")
+        lead.append(nonzero[0])
+    lead = np.array(lead)
+    degree = np.array([len(c) for c in polys]) - 1 - lead
+
+    r = np.full((len(polys), int(np.max(degree))), np.nan, dtype=complex)
+    # Polynomials of the same degree share one eigenvalue call.
+    for d in np.unique(degree):
+        idx = np.flatnonzero(degree == d)
+        c = np.array([polys[i][lead[i]:lead[i]+d+1] for i in idx])
+        r[idx, :d] = _roots(c)
+
+    return r, degree, lead
@@ -5,7 +5,7 @@ import numpy as np
 from typing import List, Tuple
 import sys
 import matplotlib.pyplot as plt
-from matplotlib import patches
+from ._render import _drawzplane
 
 def zplane(system, show:bool=True, figsize:Tuple[int, int]=(8, 8)):
     """
@@ -67,22 +67,7 @@ def zplane(system, show:bool=True, figsize:Tuple[int, int]=(8, 8)):
     
     if show == True:
         plt.figure(figsize=figsize)
-        ax = plt.subplot(111)
-        uc = patches.Circle((0, 0), radius=1, fill=False,
-                            color='black', ls='dashed')
-        ax.add_patch(uc)
-        plt.plot(z.real, z.imag, 'go', ms=10)
-        plt.plot(p.real, p.imag, 'rx', ms=10)
-        ax.spines['left'].set_position('center')
-        ax.spines['bottom'].set_position('center')
-        ax.spines['right'].set_visible(False)
-        ax.spines['top'].set_visible(False)
-        #r = 1.5
-        plt.axis('scaled')
-        #plt.axis([-r, r, -r, r])
-        ticks = [-1, -.5, .5, 1]
-        plt.xticks(ticks)
-        plt.yticks(ticks)
+        _drawzplane(plt.subplot(111), z, p)
 
     return z, p, k
     
\ No newline at end of file
@@ -6,8 +6,10 @@ Created on Mon Mar  9 01:12:05 2020
 """
 
 from ._butter import butter
+from ._butterbatch import butterbatch
 from ._buttord import buttord
 from ._cheby1 import cheby1
+from ._cheby1batch import cheby1batch
 from ._cheb1ord import cheb1ord
 from ._cheby2 import cheby2
 from ._cheb2ord import cheb2ord
@@ -16,4 +18,7 @@ from ._ellipord import ellipord
 from ._iirnotch import iirnotch
 from ._iirpeak import iirpeak
 from ._polyscale import polyscale
-from ._polystab import polystab
\ No newline at end of file
+from ._polystab import polystab
+
+from .._profile import _instrument
+_instrument(globals())
\ No newline at end of file
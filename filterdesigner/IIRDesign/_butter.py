@@ -1,6 +1,7 @@
 import scipy.signal as signal
 from typing import List, Tuple
 import numpy as np
+from .._validate import _checkin, _checkint, _checkrange, _isreal, _isseq
 
 def butter(n : int, Wn, ftype :str='default', zs :str= 'z') -> Tuple:
     """
@@ -48,54 +49,41 @@ def butter(n : int, Wn, ftype :str='default', zs :str= 'z') -> Tuple:
     analog = False
     fs = None
     
-    if (type(n) in [int, np.int, np.int0, np.int16, np.int32, np.int64, 
-           np.int8]) == False:
-        raise ValueError("`n` must be an integer.")
+    _checkint(n, "`n` must be an integer.")
     
-    if (ftype in ftypelist) == False:
-        raise ValueError("`ftype` must be 'low', 'high', 'bandpass', 'stop',"
-                         + " or 'default'.")
+    _checkin(ftype, ftypelist, "`ftype` must be 'low', 'high', 'bandpass',"
+                               + " 'stop', or 'default'.")
         
-    if (zs in zslist) == False:
-        raise ValueError("`zs` must be 'z' or 's'.")
+    _checkin(zs, zslist, "`zs` must be 'z' or 's'.")
         
     if zs == 'z':
-        if type(Wn) in [list, np.ndarray]:
-            if np.max(Wn) >= 1.0 or np.min(Wn) < 0.0:
-                raise ValueError("When `zs` is 'z', value of `Wn` must be from"
-                                 + "0 to 1.")
-        else:
-            if Wn >= 1.0 or Wn < 0.0:
-                raise ValueError("When `zs` is 'z', value of `Wn` must be from"
-                                 + "0 to 1.")
+        _checkrange(Wn, "When `zs` is 'z', value of `Wn` must be from"
+                    + " 0 to 1.")
             
         
     if ftype == 'default':
-        if type(Wn) in [float, np.float, np.float16, np.float32, np.float64,  
-                       int, np.int, np.int0, np.int16, np.int32, np.int64, np.int8]:
+        if _isreal(Wn):
             ftype = 'lowpass'
         else:
             ftype = 'bandpass'
     elif ftype == 'low':
-        if type(Wn) in [list, np.ndarray]:
+        if _isseq(Wn):
             raise ValueError("`Wn` must be float when `ftype` is 'low'.")
         else:
             ftype = 'lowpass'
     elif ftype == 'high':
-        if type(Wn) in [list, np.ndarray]:
+        if _isseq(Wn):
             raise ValueError("`Wn` must be float when `ftype` is 'high'.")
         else:
             ftype = 'highpass'
     elif ftype == 'stop':
-        if type(Wn) in [float, np.float, np.float16, np.float32, np.float64,  
-                       int, np.int, np.int0, np.int16, np.int32, np.int64, np.int8]:
+        if _isreal(Wn):
             raise ValueError("`Wn` must be sequence when `ftype` is 'stop'.")
         else:
             ftype = 'bandstop'
     else:
         #bandpass filter
-        if type(Wn) in [float, np.float, np.float16, np.float32, np.float64,  
-                       int, np.int, np.int0, np.int16, np.int32, np.int64, np.int8]:
+        if _isreal(Wn):
             raise ValueError("`Wn` must be sequence when `ftype` is 'band'.")
         else:
             ftype = 'bandpass'
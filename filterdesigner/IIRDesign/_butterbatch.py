@@ -0,0 +1,60 @@
+import numpy as np
+from typing import List, Tuple
+from ._iirbatch import _check, _digital
+
+def butterbatch(n, Wn, ftype:str='low', output:str='sos'):
+    """
+    Batched Butterworth digital filter design.
+
+    Design many Nth-order digital Butterworth filters at once. The poles of
+    the analog prototypes are computed in closed form and transformed by the
+    vectorized bilinear transform, instead of designing the filters one by
+    one.
+
+    Parameters
+    ----------
+    n : int or array_like of int
+        The orders of the filters.
+
+    Wn : float or array_like
+        The cutoff frequencies ("-3 dB point") of the filters, normalized
+        from 0 to 1, where 1 is the Nyquist frequency.
+        `n` and `Wn` are broadcast against each other.
+
+    ftype : {'low', 'high'}, optional
+        The type of filters. The default is 'low'.
+
+    output : {'sos', 'zpk'}, optional
+        Type of output. The default is 'sos'.
+
+    Raises
+    ------
+    ValueError
+        If `ftype` or `output` is invalid.
+        If `n` is not positive integers.
+        If `Wn` is not from 0 to 1.
+
+    Returns
+    -------
+    sos : ndarray
+        Second-order sections of shape (..., (max(n)+1)//2, 6), where ...
+        is the broadcast shape of `n` and `Wn`. Filters of lower order are
+        padded with identity sections at the front.
+        Only returned if output='sos'.
+
+    z, p, k : ndarray
+        Zeros and poles of shape (..., max(n)) and gains of shape (...).
+        Filters of lower order are padded with zeros and poles at the origin.
+        Only returned if output='zpk'.
+    """
+
+    n, Wn = _check(n, Wn, ftype, output)
+    n, Wn = np.broadcast_arrays(n, Wn)
+
+    def prototype(N, idx):
+        # Poles on the unit circle in the left half plane
+        m = np.arange(N)
+        p = np.exp(1j * np.pi * (2*m + N + 1) / (2*N))
+        return np.broadcast_to(p, (len(idx), N)), np.ones(len(idx))
+
+    return _digital(n, Wn, prototype, ftype, output)
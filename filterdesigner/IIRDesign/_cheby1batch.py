@@ -0,0 +1,73 @@
+import numpy as np
+from typing import List, Tuple
+from ._iirbatch import _check, _digital
+
+def cheby1batch(n, Rp, Wp, ftype:str='low', output:str='sos'):
+    """
+    Batched Chebyshev type I digital filter design.
+
+    Design many Nth-order digital Chebyshev type I filters at once. The
+    poles of the analog prototypes are computed in closed form and
+    transformed by the vectorized bilinear transform, instead of designing
+    the filters one by one.
+
+    Parameters
+    ----------
+    n : int or array_like of int
+        The orders of the filters.
+
+    Rp : float or array_like
+        The maximum ripple allowed below unity gain in the passband.
+        Specified in decibels, as positive numbers.
+
+    Wp : float or array_like
+        The passband edge frequencies at which the gain first drops below
+        -Rp, normalized from 0 to 1, where 1 is the Nyquist frequency.
+        `n`, `Rp` and `Wp` are broadcast against each other.
+
+    ftype : {'low', 'high'}, optional
+        The type of filters. The default is 'low'.
+
+    output : {'sos', 'zpk'}, optional
+        Type of output. The default is 'sos'.
+
+    Raises
+    ------
+    ValueError
+        If `ftype` or `output` is invalid.
+        If `n` is not positive integers.
+        If `Rp` is not positive.
+        If `Wp` is not from 0 to 1.
+
+    Returns
+    -------
+    sos : ndarray
+        Second-order sections of shape (..., (max(n)+1)//2, 6), where ...
+        is the broadcast shape of `n`, `Rp` and `Wp`. Filters of lower order
+        are padded with identity sections at the front.
+        Only returned if output='sos'.
+
+    z, p, k : ndarray
+        Zeros and poles of shape (..., max(n)) and gains of shape (...).
+        Filters of lower order are padded with zeros and poles at the origin.
+        Only returned if output='zpk'.
+    """
+
+    n, Wp = _check(n, Wp, ftype, output)
+    Rp = np.asarray(Rp, dtype=float)
+    if np.any(Rp <= 0):
+        raise ValueError("`Rp` must be positive.")
+    n, Rp, Wp = np.broadcast_arrays(n, Rp, Wp)
+    eps = np.sqrt(10 ** (0.1 * Rp.ravel()) - 1.0)
+
+    def prototype(N, idx):
+        # Poles on an ellipse in the left half plane
+        mu = np.arcsinh(1 / eps[idx, None]) / N
+        theta = np.pi * np.arange(-N+1, N, 2) / (2*N)
+        p = -np.sinh(mu + 1j * theta)
+        k = np.real(np.prod(-p, axis=1))
+        if N % 2 == 0:
+            k = k / np.sqrt(1 + eps[idx]**2)
+        return p, k
+
+    return _digital(n, Wp, prototype, ftype, output)
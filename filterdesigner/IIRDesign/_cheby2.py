@@ -1,6 +1,7 @@
 import scipy.signal as signal
 from typing import List, Tuple
 import numpy as np 
+from .._validate import _checkin, _checkint, _isfloat, _isseq
 
 def cheby2(n:int, Rs:float, Ws, ftype:str='default', zs:str='z')->Tuple:
     """
@@ -52,42 +53,38 @@ def cheby2(n:int, Rs:float, Ws, ftype:str='default', zs:str='z')->Tuple:
     ftypelist = ['default', 'low', 'high', 'bandpass', 'stop']
     
     # Filter type
-    if (ftype in ftypelist) == False:
-        raise ValueError("`ftype` must be 'low', 'high', 'bandpass', 'stop',"
-                         + " or 'default'.")
+    _checkin(ftype, ftypelist, "`ftype` must be 'low', 'high', 'bandpass',"
+                               + " 'stop', or 'default'.")
     
     # Digital or Analog
-    if (zs in zslist) == False:
-        raise ValueError("`zs` must be 'z' or 's'.")
+    _checkin(zs, zslist, "`zs` must be 'z' or 's'.")
         
-    if (type(n) in [int, np.int, np.int0, np.int16, np.int32, np.int64, 
-           np.int8]) == False:
-        raise ValueError("`n` must be an integer.")
+    _checkint(n, "`n` must be an integer.")
         
     # Filter types
     if ftype == 'default':
-        if type(Ws) in [float, np.float, np.float16, np.float32, np.float64]:
+        if _isfloat(Ws):
             ftype = 'lowpass'
         else:
             ftype = 'bandpass'
     elif ftype == 'low':
-        if type(Ws) in [list, np.ndarray]:
+        if _isseq(Ws):
             raise ValueError("`Wn` must be float when `ftype` is 'low'.")
         else:
             ftype = 'lowpass'
     elif ftype == 'high':
-        if type(Ws) in [list, np.ndarray]:
+        if _isseq(Ws):
             raise ValueError("`Wn` must be float when `ftype` is 'high'.")
         else:
             ftype = 'highpass'
     elif ftype == 'stop':
-        if type(Ws) in [float, np.float, np.float16, np.float32, np.float64]:
+        if _isfloat(Ws):
             raise ValueError("`Wn` must be sequence when `ftype` is 'stop'.")
         else:
             ftype = 'bandstop'
     else:
         #bandpass filter
-        if type(Ws) in [float, np.float, np.float16, np.float32, np.float64]:
+        if _isfloat(Ws):
             raise ValueError("`Wn` must be sequence when `ftype` is 'band'.")
         else:
             ftype = 'bandpass'
@@ -1,6 +1,7 @@
 import scipy.signal as signal
 from typing import List, Tuple
 import numpy as np 
+from .._validate import _checkin, _checkint, _checkrange, _isfloat, _isseq
 
 def ellip(n:int, Rp:float, Rs:float, Wp, ftype:str='default', zs:str='z')->Tuple:
     """
@@ -52,52 +53,42 @@ def ellip(n:int, Rp:float, Rs:float, Wp, ftype:str='default', zs:str='z')->Tuple
     analog = False
     fs = None
     
-    if (zs in zslist) == False:
-        raise ValueError("`zs` must be 'z' or 's'.")
+    _checkin(zs, zslist, "`zs` must be 'z' or 's'.")
         
-    if (type(n) in [int, np.int, np.int0, np.int16, np.int32, np.int64, 
-           np.int8]) == False:
-        raise ValueError("`n` must be an integer.")
+    _checkint(n, "`n` must be an integer.")
     
-    if (ftype in ftypelist) == False:
-        raise ValueError("`ftype` must be 'low', 'high', 'bandpass', 'stop',"
-                         + " or 'default'.")
+    _checkin(ftype, ftypelist, "`ftype` must be 'low', 'high', 'bandpass',"
+                               + " 'stop', or 'default'.")
         
     #If digital filter.    
     if zs == 'z':
-        if type(Wp) in [list, np.ndarray]:
-            if np.max(Wp) >= 1.0 or np.min(Wp) < 0.0:
-                raise ValueError("When `zs` is 'z', value of `Wp` must be from"
-                                 + "0 to 1.")
-        else:
-            if Wp >= 1.0 or Wp < 0.0:
-                raise ValueError("When `zs` is 'z', value of `Wp` must be from"
-                                 + "0 to 1.")
+        _checkrange(Wp, "When `zs` is 'z', value of `Wp` must be from"
+                    + " 0 to 1.")
                 
     # Filter types
     if ftype == 'default':
-        if type(Wp) in [float, np.float, np.float16, np.float32, np.float64]:
+        if _isfloat(Wp):
             ftype = 'lowpass'
         else:
             ftype = 'bandpass'
     elif ftype == 'low':
-        if type(Wp) in [list, np.ndarray]:
+        if _isseq(Wp):
             raise ValueError("`Wn` must be float when `ftype` is 'low'.")
         else:
             ftype = 'lowpass'
     elif ftype == 'high':
-        if type(Wp) in [list, np.ndarray]:
+        if _isseq(Wp):
             raise ValueError("`Wn` must be float when `ftype` is 'high'.")
         else:
             ftype = 'highpass'
     elif ftype == 'stop':
-        if type(Wp) in [float, np.float, np.float16, np.float32, np.float64]:
+        if _isfloat(Wp):
             raise ValueError("`Wn` must be sequence when `ftype` is 'stop'.")
         else:
             ftype = 'bandstop'
     else:
         #bandpass filter
-        if type(Wp) in [float, np.float, np.float16, np.float32, np.float64]:
+        if _isfloat(Wp):
             raise ValueError("`Wn` must be sequence when `ftype` is 'band'.")
         else:
             ftype = 'bandpass'
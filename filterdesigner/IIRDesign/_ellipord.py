@@ -1,6 +1,7 @@
 import scipy.signal as signal
 from typing import List, Tuple
 import numpy as np 
+from .._validate import _checkin, _checkreal, _isreal, _isseq, _istrusted
 
 def ellipord(Wp, Ws, Rp:float, Rs:float, zs='z')->Tuple:
     """
@@ -55,31 +56,26 @@ def ellipord(Wp, Ws, Rp:float, Rs:float, zs='z')->Tuple:
     zslist = ['z', 's']
     
     # Digital or Analog
-    if (zs in zslist) == False:
-        raise ValueError("`zs` must be 'z' or 's'.")
+    _checkin(zs, zslist, "`zs` must be 'z' or 's'.")
     
-    #Check the consistency of `Wp` and `Ws`
-    if type(Wp) in [float, np.float, np.float16, np.float32, np.float64,
-                   int, np.int, np.int0, np.int16, np.int32, np.int64, np.int8]:
-        if type(Wp) != type(Ws):
-            raise ValueError("`Wp` and `Ws` must be the same type.")
-    elif type(Wp) == list or tuple or np.array:
-        if type(Wp) != type(Ws):
-            raise ValueError("`Wp` and `Ws` must be the same type.")
-        elif len(Wp) != len(Ws):
-            raise ValueError("`Wp` and `Ws` must have the same length.")
-    else:
-        raise("`Wp` and `Ws` must be float , list or tuple.")
+    # Check the consistency of `Wp` and `Ws`
+    if not _istrusted():
+        if _isreal(Wp):
+            if type(Wp) != type(Ws):
+                raise ValueError("`Wp` and `Ws` must be the same type.")
+        elif _isseq(Wp) or isinstance(Wp, tuple):
+            if type(Wp) != type(Ws):
+                raise ValueError("`Wp` and `Ws` must be the same type.")
+            elif len(Wp) != len(Ws):
+                raise ValueError("`Wp` and `Ws` must have the same length.")
+        else:
+            raise ValueError("`Wp` and `Ws` must be float , list or tuple.")
         
     # Check the type of Rp
-    if (type(Rp) in [int, np.int, np.int0, np.int16, np.int32, np.int64\
-        , np.int8, float, np.float, np.float16, np.float32, np.float64]) == False:
-        raise ValueError("`Rp` must be the number.")
+    _checkreal(Rp, "`Rp` must be the number.")
     
     # Check the type of Rs
-    if (type(Rs) in [int, np.int, np.int0, np.int16, np.int32, np.int64\
-        , np.int8, float, np.float, np.float16, np.float32, np.float64]) == False:
-        raise ValueError("`Rp` must be the number.")
+    _checkreal(Rs, "`Rs` must be the number.")
     
     # Change the default parameters
     if zs == 's':
@@ -0,0 +1,109 @@
+import numpy as np
+from typing import List, Tuple
+
+def _check(n, Wn, ftype:str, output:str) -> Tuple:
+    """
+    Check and broadcast the parameters of the batched IIR filter design.
+    """
+
+    if (ftype in ['low', 'high']) == False:
+        raise ValueError("`ftype` must be 'low' or 'high'.")
+
+    if (output in ['sos', 'zpk']) == False:
+        raise ValueError("`output` must be 'sos' or 'zpk'.")
+
+    n = np.asarray(n)
+    if n.dtype.kind not in 'iu' or np.any(n < 1):
+        raise ValueError("`n` must be positive integers.")
+
+    Wn = np.asarray(Wn, dtype=float)
+    if np.any(Wn <= 0.0) or np.any(Wn >= 1.0):
+        raise ValueError("Value of `Wn` must be from 0 to 1.")
+
+    return n, Wn
+
+
+def _digital(n:np.ndarray, Wn:np.ndarray, prototype, ftype:str, output:str):
+    """
+    Digital lowpass or highpass filters from analog lowpass prototypes by
+    the bilinear transform, vectorized over the filters of the same order.
+
+    `prototype(N, idx)` returns the poles (len(idx), N) and the gains of
+    the analog prototypes of order N for the filters `idx`. The poles must
+    be ordered so that p[j] and p[N-1-j] are complex conjugates.
+    """
+
+    shape = n.shape
+    n = n.ravel()
+    Wn = Wn.ravel()
+    K = len(n)
+    nmax = int(np.max(n))
+
+    # Zeros and poles padded with the pairs at the origin.
+    z = np.zeros((K, nmax), dtype=complex)
+    p = np.zeros((K, nmax), dtype=complex)
+    k = np.zeros(K)
+
+    # Pre-warp the frequencies for the bilinear transform (fs = 2).
+    warped = 4 * np.tan(np.pi * Wn / 2)
+
+    for N in np.unique(n):
+        idx = np.nonzero(n == N)[0]
+        pa, ka = prototype(N, idx)
+        wo = warped[idx, None]
+
+        if ftype == 'low':
+            # Lowpass to lowpass, then the zeros at infinity go to z = -1.
+            pa = pa * wo
+            ka = ka * wo[:, 0]**N
+            kd = ka * np.real(1 / np.prod(4 - pa, axis=1))
+            zd = -1.0
+        else:
+            # Lowpass to highpass, then the zeros at s = 0 go to z = 1.
+            ka = ka * np.real(1 / np.prod(-pa, axis=1))
+            pa = wo / pa
+            kd = ka * np.real(4.0**N / np.prod(4 - pa, axis=1))
+            zd = 1.0
+
+        z[idx, nmax-N:] = zd
+        p[idx, nmax-N:] = (4 + pa) / (4 - pa)
+        k[idx] = kd
+
+    if output == 'zpk':
+        return (z.reshape(shape + (nmax,)), p.reshape(shape + (nmax,)),
+                k.reshape(shape))
+
+    # Second-order sections. The padded zeros and poles at the origin become
+    # identity sections at the front, and the gain is in the first section.
+    nsec = (nmax + 1) // 2
+    sos = np.zeros((K, nsec, 6))
+    sos[:, :, 0] = 1.0
+    sos[:, :, 3] = 1.0
+    for N in np.unique(n):
+        idx = np.nonzero(n == N)[0]
+        pd = p[idx, nmax-N:]
+        zd = np.real(z[idx[0], nmax-1])
+        pairs = N // 2
+        # Complex conjugate pairs p[j] and p[N-1-j], and a real pole
+        secs = np.zeros((len(idx), (N+1)//2, 6))
+        pj = pd[:, :pairs]
+        secs[:, :pairs, 0] = 1.0
+        secs[:, :pairs, 1] = -2 * zd
+        secs[:, :pairs, 2] = 1.0
+        secs[:, :pairs, 3] = 1.0
+        secs[:, :pairs, 4] = -2 * np.real(pj)
+        secs[:, :pairs, 5] = np.abs(pj)**2
+        if N % 2 == 1:
+            secs[:, pairs, 0] = 1.0
+            secs[:, pairs, 1] = -zd
+            secs[:, pairs, 3] = 1.0
+            secs[:, pairs, 4] = -np.real(pd[:, pairs])
+        # Poles closest to the unit circle in the last section.
+        radius = np.hstack((np.abs(pj), np.abs(np.real(pd[:, pairs:pairs+N%2]))))
+        order = np.argsort(radius, axis=1)
+        secs = np.take_along_axis(secs, order[:, :, None], axis=1)
+        sos[idx, nsec-(N+1)//2:] = secs
+
+    sos[:, 0, :3] *= k[:, None]
+
+    return sos.reshape(shape + (nsec, 6))
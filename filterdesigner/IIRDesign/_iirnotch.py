@@ -1,6 +1,7 @@
 import scipy.signal as signal
 from typing import List, Tuple
 import numpy as np 
+from .._validate import _checkfloat
     
 def iirnotch(w0:float, bw:float)->Tuple:
     """
@@ -34,11 +35,9 @@ def iirnotch(w0:float, bw:float)->Tuple:
      
     """
     
-    if (type(w0) in [float, np.float, np.float16, np.float32, np.float64]) == False:
-        raise ValueError("`w0` must be a float.")
+    _checkfloat(w0, "`w0` must be a float.")
         
-    if (type(bw) in [float, np.float, np.float16, np.float32, np.float64]) == False:
-        raise ValueError("`bw` must be a float.")
+    _checkfloat(bw, "`bw` must be a float.")
         
     # Calcurate quality factor
     Q = w0/bw
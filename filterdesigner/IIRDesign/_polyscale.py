@@ -2,7 +2,7 @@ import scipy.signal as signal
 from typing import List, Tuple
 import numpy as np 
 
-def polyscale(a, alpha:float):
+def polyscale(a, alpha:float, output:str='poly'):
     """
     Scale roots of polynomial
 
@@ -14,8 +14,26 @@ def polyscale(a, alpha:float):
     radially scaled toward the origin in the z-plane. Complex values for alpha 
     allow arbitrary changes to the root locations.
 
+    Scaling the roots by alpha is the same as multiplying the k-th coefficient
+    by alpha^k, so the scaled polynomial is computed without root finding.
+    `a` may be a 2D array which rows are polynomials of the same length,
+    and `alpha` may be an array of one factor per row.
+
+    If output='roots', the scaled roots of the 1D polynomial `a` are returned
+    instead of the polynomial.
+
     """
-    r = np.roots(a)
-    
-    return r * alpha
-    
\ No newline at end of file
+
+    if (output in ['poly', 'roots']) == False:
+        raise ValueError("`output` must be 'poly' or 'roots'.")
+
+    if output == 'roots':
+        r = np.roots(a)
+        return r * alpha
+
+    a = np.asarray(a)
+    alpha = np.asarray(alpha)
+    if alpha.ndim > 0:
+        alpha = alpha[..., None]
+
+    return a * alpha ** np.arange(a.shape[-1])
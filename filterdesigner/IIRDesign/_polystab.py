@@ -1,8 +1,9 @@
 import scipy.signal as signal
 from typing import List, Tuple
 import numpy as np 
+from ..FilterSpec._bank import _roots, _poly
 
-def polystab(a):
+def polystab(a, sos:bool=False):
     """
     Stabilize polynomial
     
@@ -13,12 +14,66 @@ def polystab(a):
     a is a vector of polynomial coefficients, normally in the z-domain:
         
     A(z) = a(0) + a(1)*z^-1 + ... + a(m)*z^-m
+
+    If `a` is a 2D array, each row is stabilized. The roots of all rows are
+    found at once from their companion matrices.
+
+    b = polystab(sos, sos=True) stabilizes the denominator of each section
+    of second-order sections, where `sos` is an array of shape (..., 6).
+    The at most two roots of each section are reflected analytically by
+    the quadratic formula, without root finding of the whole polynomial.
+    The numerators are not changed.
     """
+
+    if sos:
+        return _sosstab(np.asarray(a))
+
     a = np.array(a)
+    if a.ndim == 2:
+        if np.any(a[:, 0] == 0):
+            raise ValueError("The leading coefficients of `a` must not be zero.")
+        v = _roots(a)
+        vs = 0.5 * (np.sign(np.abs(v) - 1) + 1)
+        v = (1 - vs) * v + vs / np.conj(np.where(v == 0, 1, v))
+        return a[:, :1] * _poly(v)
+
     v = np.roots(a)
     vs = 0.5 * (np.sign(np.abs(v) - 1) + 1)
-    v = (1 - vs) * v + vs / np.conj(v)
+    v = (1 - vs) * v + vs / np.conj(np.where(v == 0, 1, v))
     b = a[0] * np.poly(v)
     
     return b
-    
\ No newline at end of file
+
+
+def _sosstab(sos:np.ndarray) -> np.ndarray:
+    """
+    Reflect the poles of second-order sections inside the unit circle.
+    """
+
+    if sos.shape[-1] != 6:
+        raise ValueError("`sos` must be an array of shape (..., 6).")
+
+    a0, a1, a2 = [sos[..., i].astype(complex) for i in (3, 4, 5)]
+    if np.any(a0 == 0):
+        raise ValueError("The leading coefficients of the sections must not be zero.")
+
+    # Roots of a0*z^2 + a1*z + a2 by the quadratic formula without
+    # cancellation, r1 = q/a0 and r2 = a2/q.
+    s = np.sqrt(a1**2 - 4*a0*a2)
+    s = np.where(np.real(np.conj(a1) * s) < 0, -s, s)
+    q = -(a1 + s) / 2
+    nz = (q != 0)
+    r1 = q / a0
+    r2 = np.where(nz, a2 / np.where(nz, q, 1), 0)
+
+    def reflect(r):
+        return np.where(np.abs(r) > 1, 1 / np.conj(np.where(r == 0, 1, r)), r)
+
+    r1 = reflect(r1)
+    r2 = reflect(r2)
+
+    out = sos.astype(np.result_type(sos, float), copy=True)
+    out[..., 4] = np.real(-(r1 + r2) * a0)
+    out[..., 5] = np.real(r1 * r2 * a0)
+
+    return out
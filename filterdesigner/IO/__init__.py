@@ -6,8 +6,16 @@ Created on Wed Apr 29 15:05:03 2020
 """
 
 
+from ._compactmat import compactmat
+from ._loadfiles import aloadfiles, loadfiles
 from ._loadmat import loadmat
+from ._loadnpz import loadnpz
+from ._matfile import MatFile
+from ._npybank import appendbank, createbank, openbank
 from ._savemat import savemat
 from ._savenpy import savenpy
 from ._savenpz import savenpz
 from ._whosmat import whosmat
+
+from .._profile import _instrument
+_instrument(globals())
\ No newline at end of file
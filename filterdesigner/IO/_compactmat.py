@@ -0,0 +1,75 @@
+import os
+import numpy as np
+from typing import List, Tuple
+from ._matfile import _matname, _elements
+try:
+    from scipy.io.matlab._mio import mat_reader_factory
+except ImportError:
+    from scipy.io.matlab.mio import mat_reader_factory
+
+def compactmat(filename:str, remove=None) -> int:
+    """
+    Remove the superseded variables from a MATLAB file.
+
+    A variable appended by `savemat` with `append=True` supersedes the
+    variables of the same name before it, which remain in the file. The
+    file is rewritten with only the last variable of each name, in the
+    order of the file. The data elements are copied as they are stored,
+    without decoding or recompressing them, to a temporary file which then
+    replaces the file.
+
+    Parameters
+    ----------
+        filename : str
+            Name of the mat file.
+
+        remove : sequence of str, optional
+            Names of variables to remove as well.
+
+    Returns
+    -------
+        nbytes : int
+            The number of bytes by which the file is reduced.
+    """
+
+    filename = _matname(filename)
+    remove = set() if remove is None else set(remove)
+
+    reader, _ = mat_reader_factory(filename, appendmat=False)
+    with reader.mat_stream as f:
+        elements = [(name, position, end) for name, _, position, end in _elements(reader)]
+        header = elements[0][1] if elements else 0
+
+        # The last element of each name is kept.
+        last = {name: i for i, (name, _, _) in enumerate(elements)}
+        keep = [e for i, e in enumerate(elements)
+                if last[e[0]] == i and (e[0] in remove) == False]
+        if len(keep) == len(elements):
+            return 0
+
+        size = os.path.getsize(filename)
+        temp = filename + '.compact'
+        try:
+            with open(temp, 'wb') as out:
+                f.seek(0)
+                out.write(f.read(header))
+                for _, position, end in keep:
+                    f.seek(position)
+                    _copy(f, out, end - position)
+        except BaseException:
+            os.remove(temp)
+            raise
+
+    os.replace(temp, filename)
+
+    return size - os.path.getsize(filename)
+
+
+def _copy(src, dst, nbytes:int):
+    # Copy nbytes from the current position of src in blocks.
+    while nbytes > 0:
+        block = src.read(min(nbytes, 2**24))
+        if len(block) == 0:
+            raise ValueError("The file ends in the middle of a variable.")
+        dst.write(block)
+        nbytes -= len(block)
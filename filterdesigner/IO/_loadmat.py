@@ -1,6 +1,12 @@
+import warnings
 import scipy.io as io
 import numpy as np
 from typing import List, Tuple
+from ._matfile import _elements
+try:
+    from scipy.io.matlab._mio import mat_reader_factory
+except ImportError:
+    from scipy.io.matlab.mio import mat_reader_factory
 
 def loadmat(filename:str, mdict:dict, byte_order:str=None, 
             matlab_compatible:bool=False, verify_compressed_data_integrity:bool=True, 
@@ -39,6 +45,9 @@ def loadmat(filename:str, mdict:dict, byte_order:str=None,
             The reader will skip any variable with a name not in this sequence,
             possibly saving some read processing.
             
+    A variable appended by `savemat` with `append=True` supersedes the
+    variables of the same name before it, also for `variable_names`, and
+    without the warning of `scipy.io.loadmat` about the duplicate names.
             
     Returns
     -------
@@ -59,11 +68,53 @@ def loadmat(filename:str, mdict:dict, byte_order:str=None,
         # Add '.mat' force.
         filename = filename + '.mat'
         
+    return _loadmat(filename, mdict, byte_order, matlab_compatible,
+                    verify_compressed_data_integrity, variable_names)
+
+
+def _loadmat(filename, mdict:dict=None, byte_order:str=None,
+             matlab_compatible:bool=False,
+             verify_compressed_data_integrity:bool=True,
+             variable_names=None)->dict:
+    # Load a MATLAB file of the given name, in which the appended variables
+    # supersede the previous ones. Also used by `loadfiles`.
+    if variable_names is not None:
+        mat_dict = _loadlast(filename, byte_order, matlab_compatible,
+                             verify_compressed_data_integrity, variable_names)
+        if mdict is not None:
+            mdict.update(mat_dict)
+            mat_dict = mdict
+        return mat_dict
+
     # Load MATLAB-like .mat file
-    mat_dict = io.loadmat(filename, mdict, appendmat=False, byte_order=byte_order, 
-                          matlab_compatible=matlab_compatible, 
-                          verify_compressed_data_integrity=verify_compressed_data_integrity, 
-                          variable_names=variable_names)
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='Duplicate variable name')
+        mat_dict = io.loadmat(filename, mdict, appendmat=False, byte_order=byte_order, 
+                              matlab_compatible=matlab_compatible, 
+                              verify_compressed_data_integrity=verify_compressed_data_integrity)
     
     return mat_dict
-    
\ No newline at end of file
+
+
+def _loadlast(filename, byte_order, matlab_compatible:bool,
+              verify_compressed_data_integrity:bool, variable_names)->dict:
+    # `scipy.io.loadmat` reads the first variable of each name in
+    # `variable_names`, so the last one is located and read here instead.
+    names = [variable_names] if isinstance(variable_names, str) else list(variable_names)
+    reader, _ = mat_reader_factory(
+        filename, appendmat=False, byte_order=byte_order,
+        matlab_compatible=matlab_compatible,
+        verify_compressed_data_integrity=verify_compressed_data_integrity)
+    with reader.mat_stream:
+        last = {name: position for name, _, position, _ in _elements(reader)
+                if name in names}
+        # The header entries, without reading any variable.
+        mat_dict = reader.get_variables(variable_names=[])
+        for name, position in last.items():
+            reader.mat_stream.seek(position)
+            hdr, _ = reader.read_var_header()
+            mat_dict[name] = reader.read_var_array(hdr, name != '__function_workspace__')
+            if getattr(hdr, 'is_global', False):
+                mat_dict['__globals__'].append(name)
+
+    return mat_dict
@@ -0,0 +1,92 @@
+import struct
+import zipfile
+import numpy as np
+import numpy.lib.format as fmt
+from typing import List, Tuple
+
+# Local file header of a zip member, whose data follows the file name and
+# the extra field.
+_LOCALHEADER = struct.Struct('<4s5H3L2H')
+
+
+def loadnpz(filename:str, mmap_mode:str='r', allow_pickle:bool=False) -> dict:
+    """
+    Load the arrays of a ``.npz`` file as memory-mapped arrays.
+
+    The members of an uncompressed archive, as written by `savenpz`, are
+    contiguous ``.npy`` files in the archive, so each array is mapped from
+    the archive without reading or copying it, and its pages are read on
+    access and shared between processes. `savenpz` aligns the data of the
+    members, so the mapped arrays are aligned. Compressed members and
+    object arrays are read into memory as by `np.load`.
+
+    Parameters
+    ----------
+        filename : str
+            The name of the ``.npz`` file.
+
+        mmap_mode : {'r', 'c', None}, optional
+            'r' for read-only memory maps, 'c' for copy-on-write memory maps
+            whose changes are not written to the file, or None to read all
+            arrays into memory. Default is 'r'.
+
+        allow_pickle : bool, optional
+            Allow loading the object arrays, which are pickled, as
+            `np.load` does. Loading pickled data executes arbitrary code
+            from the file, so only allow it for trusted files.
+            Default is False.
+
+    Raises
+    ------
+        ValueError
+            If `mmap_mode` is not 'r', 'c' or None.
+            If a member is an object array and `allow_pickle` is False.
+
+    Returns
+    -------
+        arrays : dict
+            The arrays keyed by the names in the archive, which are memmap
+            for the stored members and ndarray for the others.
+    """
+
+    if (mmap_mode in ['r', 'c', None]) == False:
+        raise ValueError("`mmap_mode` must be 'r', 'c' or None.")
+
+    arrays = {}
+    with zipfile.ZipFile(filename) as zf:
+        for info in zf.infolist():
+            name = info.filename[:-4] if info.filename.endswith('.npy') else info.filename
+            array = None
+            if mmap_mode is not None and info.compress_type == zipfile.ZIP_STORED \
+                    and (info.flag_bits & 0x1) == 0:
+                array = _mapmember(zf.fp, filename, info, mmap_mode)
+            if array is None:
+                with zf.open(info) as f:
+                    array = fmt.read_array(f, allow_pickle=allow_pickle)
+            arrays[name] = array
+
+    return arrays
+
+
+def _mapmember(fp, filename, info:zipfile.ZipInfo, mmap_mode:str):
+    # Memory map of a stored member, or None if it cannot be mapped.
+    fp.seek(info.header_offset)
+    local = _LOCALHEADER.unpack(fp.read(_LOCALHEADER.size))
+    if local[0] != b'PK\x03\x04':
+        return None
+    start = info.header_offset + _LOCALHEADER.size + local[-2] + local[-1]
+    fp.seek(start)
+
+    version = fmt.read_magic(fp)
+    if version == (1, 0):
+        shape, fortran, dtype = fmt.read_array_header_1_0(fp)
+    elif version == (2, 0):
+        shape, fortran, dtype = fmt.read_array_header_2_0(fp)
+    else:
+        return None
+    size = int(np.prod(shape))
+    if dtype.hasobject or size == 0 or fp.tell() + size*dtype.itemsize > start + info.file_size:
+        return None
+
+    return np.memmap(filename, dtype=dtype, mode=mmap_mode, offset=fp.tell(),
+                     shape=shape, order='F' if fortran else 'C')
@@ -0,0 +1,163 @@
+import os
+import sys
+import threading
+import numpy as np
+from collections.abc import Mapping
+from typing import List, Tuple
+try:
+    from scipy.io.matlab._mio import mat_reader_factory
+except ImportError:
+    from scipy.io.matlab.mio import mat_reader_factory
+
+
+class MatFile(Mapping):
+    """
+    Lazy dictionary-like access to a MATLAB file.
+
+    The variable headers are indexed once when the file is opened, and each
+    variable is decoded on its first access and cached, so that only the
+    variables a job uses are read from a file with many large variables.
+    MATLAB 7.3 (HDF5) files are not supported, as in `loadmat`.
+
+    Parameters
+    ----------
+        filename : str
+            Name of the mat file. The ``.mat`` extension is appended if it
+            is not already there.
+
+        byte_order : str or None, optional
+            None by default, implying byte order guessed from mat file.
+            Otherwise can be one of ('native', '=', 'little', '<', 'BIG', '>').
+
+        matlab_compatible : bool, optional
+            Returns matrices as would be loaded by MATLAB.
+
+        verify_compressed_data_integrity : bool, optional
+            Whether the length of compressed sequences in the MATLAB file
+            should be checked. Default is True.
+
+    Examples
+    --------
+    >>> with MatFile('filters.mat') as mat:
+    ...     mat.whos()
+    ...     b = mat['b']
+    """
+
+    def __init__(self, filename:str, byte_order:str=None,
+                 matlab_compatible:bool=False,
+                 verify_compressed_data_integrity:bool=True):
+
+        self.filename = _matname(filename)
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._reader, _ = mat_reader_factory(
+            self.filename, appendmat=False, byte_order=byte_order,
+            matlab_compatible=matlab_compatible,
+            verify_compressed_data_integrity=verify_compressed_data_integrity)
+        try:
+            self._index = self._scan()
+        except BaseException:
+            self._reader.mat_stream.close()
+            raise
+
+    def _scan(self) -> dict:
+        # Index the variable headers in one pass over the file, in the same
+        # way as `whosmat`, keeping the position of each header.
+        reader = self._reader
+        index = {}
+        for name, hdr, position, _ in _elements(reader):
+            shape = reader._matrix_reader.shape_from_header(hdr)
+            if getattr(hdr, 'is_logical', False):
+                info = 'logical'
+            else:
+                info = _mclass_info(reader).get(hdr.mclass, 'unknown')
+            index[name] = (shape, info, position)
+
+        return index
+
+    def whos(self) -> list:
+        """
+        List the variables as `whosmat` does, without reading the file.
+
+        Returns
+        -------
+            variables : list of tuples
+                The name, the shape and the data class of each variable.
+        """
+
+        return [(name, shape, info) for name, (shape, info, _) in self._index.items()]
+
+    def __getitem__(self, name:str):
+        with self._lock:
+            if name in self._cache:
+                return self._cache[name]
+            if name not in self._index:
+                raise KeyError(name)
+            if self._reader.mat_stream.closed:
+                raise ValueError("I/O operation on closed MatFile.")
+            self._reader.mat_stream.seek(self._index[name][2])
+            hdr, _ = self._reader.read_var_header()
+            value = self._reader.read_var_array(hdr, name != '__function_workspace__')
+            self._cache[name] = value
+
+        return value
+
+    def __contains__(self, name) -> bool:
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return "MatFile(%r, variables=%r)" % (self.filename, list(self._index))
+
+    def close(self):
+        """
+        Close the file. The variables already read remain accessible.
+        """
+
+        self._reader.mat_stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _elements(reader):
+    # Name, header, position and end position of each data element, from
+    # the beginning of the file. The stream is left at the end position.
+    reader.mat_stream.seek(0)
+    reader.initialize_read()
+    if hasattr(reader, 'read_file_header'):
+        reader.read_file_header()
+    while not reader.end_of_stream():
+        position = reader.mat_stream.tell()
+        hdr, next_position = reader.read_var_header()
+        name = 'None' if hdr.name is None else hdr.name.decode('latin1')
+        if name == '':
+            # can only be a matlab 7 function workspace
+            name = '__function_workspace__'
+        yield name, hdr, position, next_position
+        reader.mat_stream.seek(next_position)
+
+
+def _mclass_info(reader) -> dict:
+    # Names of the data classes of the MATLAB 4 or 5 reader.
+    return sys.modules[type(reader).__module__].mclass_info
+
+
+def _matname(filename:str, warn:bool=True) -> str:
+    # Replace other than '.mat' extension as `loadmat` does.
+    root, ext = os.path.splitext(filename)
+    if ext != '.mat':
+        if ext != '' and warn:
+            print('Warning: Filename "'+filename+'" has a bad extension "'+ext+'" .')
+            print('Renamed to "'+root+'.mat".')
+        filename = root + '.mat'
+
+    return filename
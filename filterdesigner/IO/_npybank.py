@@ -0,0 +1,193 @@
+import os
+import numpy as np
+import numpy.lib.format as fmt
+from typing import List, Tuple
+
+# The largest number of filters a bank header has room for.
+_MAXROWS = 2**63 - 1
+
+
+def createbank(filename:str, shape, dtype=float, capacity:int=1024) -> str:
+    """
+    Create an empty bank of filter coefficients in NumPy ``.npy`` format.
+
+    The bank is an array of shape (number of filters,) + `shape` which grows
+    along the first axis by `appendbank`. The header is written with room
+    for any number of filters, and the data area is preallocated for
+    `capacity` filters, so that appending only writes the new filters and
+    the header in place. The bank is read by `np.load` or by `openbank`
+    without loading it into memory.
+
+    Parameters
+    ----------
+        filename : str
+            The file name. The ``.npy`` extension is appended if it is not
+            already there.
+
+        shape : int or tuple of int
+            The shape of the coefficients of one filter, e.g. the number of
+            taps, or (number of sections, 6) for second-order sections.
+
+        dtype : data-type, optional
+            The data type of the coefficients. Default is float.
+
+        capacity : int, optional
+            The number of filters the file is preallocated for. The file is
+            extended when the bank grows beyond it. Default is 1024.
+
+    Raises
+    ------
+        ValueError
+            If `dtype` is not a numeric data type.
+            If `capacity` is negative.
+
+    Returns
+    -------
+        filename : str
+            The file name with the ``.npy`` extension.
+    """
+
+    filename = _npyname(filename)
+    shape = tuple(int(s) for s in np.atleast_1d(shape))
+    dtype = np.dtype(dtype)
+    if dtype.kind not in 'biufc':
+        raise ValueError("`dtype` must be a numeric data type.")
+    if capacity < 0:
+        raise ValueError("`capacity` must be non-negative.")
+
+    header = _header(dtype, (0,) + shape)
+    rowbytes = dtype.itemsize * int(np.prod(shape))
+    with open(filename, 'wb') as f:
+        f.write(header)
+        f.truncate(len(header) + int(capacity) * rowbytes)
+
+    return filename
+
+
+def appendbank(filename:str, coefs) -> int:
+    """
+    Append filter coefficients to a bank created by `createbank`.
+
+    The coefficients are written after the last filter of the bank, and
+    then the number of filters in the header is updated, so that readers
+    which open the bank meanwhile see only complete filters. The file is
+    extended to twice its capacity when it is full.
+
+    Parameters
+    ----------
+        filename : str
+            The file name of the bank.
+
+        coefs : array_like
+            The coefficients of one filter, of the shape of the bank, or of
+            several filters, of shape (number of filters,) + the shape.
+
+    Raises
+    ------
+        ValueError
+            If the shape of `coefs` does not match the bank.
+
+    Returns
+    -------
+        n : int
+            The number of filters in the bank after appending.
+    """
+
+    filename = _npyname(filename, warn=False)
+    with open(filename, 'r+b') as f:
+        shape, dtype, offset = _readheader(f)
+        coefs = np.asarray(coefs)
+        if coefs.shape == shape[1:]:
+            coefs = coefs[None]
+        if coefs.shape[1:] != shape[1:]:
+            raise ValueError("The shape of `coefs` must be "
+                             + str(shape[1:]) + " or (n,) + " + str(shape[1:]) + ".")
+        coefs = np.ascontiguousarray(coefs, dtype=dtype)
+
+        rowbytes = dtype.itemsize * int(np.prod(shape[1:]))
+        n = shape[0] + coefs.shape[0]
+        f.seek(0, os.SEEK_END)
+        capacity = (f.tell() - offset) // rowbytes if rowbytes else n
+        if n > capacity:
+            f.truncate(offset + max(n, 2*capacity) * rowbytes)
+
+        f.seek(offset + shape[0] * rowbytes)
+        f.write(coefs.tobytes())
+        f.flush()
+        f.seek(0)
+        f.write(_header(dtype, (n,) + shape[1:]))
+
+    return n
+
+
+def openbank(filename:str, mode:str='r') -> np.memmap:
+    """
+    Open a bank of filter coefficients as a memory-mapped array.
+
+    The filters are read from the file on access, so that a bank larger
+    than the memory is read filter by filter, and processes opening the
+    same bank share its pages.
+
+    Parameters
+    ----------
+        filename : str
+            The file name of the bank.
+
+        mode : str, optional
+            'r' for read-only, 'r+' to modify the filters in place or 'c'
+            for copy-on-write. Default is 'r'.
+
+    Raises
+    ------
+        ValueError
+            If `mode` is not 'r', 'r+' or 'c'.
+
+    Returns
+    -------
+        bank : memmap
+            The filter coefficients of shape (number of filters,) + the
+            shape of the bank.
+    """
+
+    if (mode in ['r', 'r+', 'c']) == False:
+        raise ValueError("`mode` must be 'r', 'r+' or 'c'.")
+
+    return np.load(_npyname(filename, warn=False), mmap_mode=mode)
+
+
+def _npyname(filename:str, warn:bool=True) -> str:
+    # Replace other than '.npy' extension as `savenpy` does.
+    root, ext = os.path.splitext(filename)
+    if ext != '.npy':
+        if ext != '' and warn:
+            print('Warning: Filename "'+filename+'" has a bad extension "'+ext+'" .')
+            print('Renamed to "'+root+'.npy".')
+        filename = root + '.npy'
+
+    return filename
+
+
+def _header(dtype:np.dtype, shape:Tuple) -> bytes:
+    # Version 1.0 header padded to the length of the largest bank, so that
+    # the header is rewritten in place as the bank grows.
+    def text(shape):
+        return "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % (
+            fmt.dtype_to_descr(dtype), shape)
+
+    size = len(text((_MAXROWS,) + shape[1:])) + 11
+    size = -(-size // fmt.ARRAY_ALIGN) * fmt.ARRAY_ALIGN
+    header = text(shape).ljust(size - 11) + '\n'
+
+    return fmt.magic(1, 0) + np.uint16(len(header)).astype('<u2').tobytes() + header.encode('latin1')
+
+
+def _readheader(f) -> Tuple:
+    # Shape, dtype and data offset of a bank.
+    version = fmt.read_magic(f)
+    if version != (1, 0):
+        raise ValueError("The file is not a bank created by `createbank`.")
+    shape, fortran, dtype = fmt.read_array_header_1_0(f)
+    if fortran or len(shape) < 1 or f.tell() != len(_header(dtype, shape)):
+        raise ValueError("The file is not a bank created by `createbank`.")
+
+    return shape, dtype, f.tell()
@@ -1,8 +1,18 @@
+import os
+import sys
 import scipy.io as io
 import numpy as np
 from typing import List, Tuple
+from ._matfile import _matname
+try:
+    from scipy.io.matlab._mio import mat_reader_factory
+    from scipy.io.matlab._mio5 import MatFile5Reader, MatFile5Writer
+except ImportError:
+    from scipy.io.matlab.mio import mat_reader_factory
+    from scipy.io.matlab.mio5 import MatFile5Reader, MatFile5Writer
 
-def savemat(filename:str, mdict:dict, comp:bool=False, oned_as:str='row'):
+def savemat(filename:str, mdict:dict, comp=False, oned_as:str='row',
+            append:bool=False):
     """
     Save variables as MATLAB-style .mat file.
     
@@ -16,27 +26,72 @@ def savemat(filename:str, mdict:dict, comp:bool=False, oned_as:str='row'):
         mdict : dict
             Dictionary from which to save matfile variables.
             
-        comp : bool, otional
+        comp : bool or sequence of str, otional
             Whether or not to compress matrices on write. Default is False.
+            If a variable name or a sequence of variable names, only these
+            are compressed.
             
         oned_as : {'row', 'column'}, optional
             If ‘column’, write 1-D numpy arrays as column vectors. 
             If ‘row’, write 1-D numpy arrays as row vectors.
+            
+        append : bool, optional
+            If True and the file exists, the variables are written at the
+            end of the file without rewriting the variables in it. A
+            variable of the same name as one in the file supersedes it when
+            the file is loaded by `loadmat`, and the superseded variables
+            are removed by `compactmat`. Default is False.
+    
+    Raises
+    ------
+        ValueError
+            If `append` is True and the file is not a MATLAB 5 file of the
+            native byte order.
     """
     
-    # Remove other than '.mat' extension if filename has the other extention.
-    if filename[-4:] != '.mat':
-        if filename.find('.') != -1:
-            bad_ext = filename[filename.find('.'):]
-            print('Warning: Filename "'+filename+'" has a bad extension "'+bad_ext+'" .')
-            
-            filename = filename[0:filename.find('.')]
-            print('Renamed to "'+filename+'.mat".')
-            
-        # Add '.mat' force.
-        filename = filename + '.mat'
-        
-    # Save MATLAB-like .mat file
-    io.savemat(filename, mdict, appendmat=False, long_field_names=True, 
-               do_compression=comp, oned_as=oned_as)
-    
\ No newline at end of file
+    filename = _matname(filename)
+
+    if isinstance(comp, (bool, np.bool_)):
+        compressed = set(mdict) if comp else set()
+    elif isinstance(comp, str):
+        compressed = {comp}
+    else:
+        compressed = set(comp)
+
+    if append and os.path.exists(filename):
+        _checkappend(filename)
+        mode = 'r+b'
+    else:
+        mode = 'wb'
+
+    # Save MATLAB-like .mat file, compressing each variable or not
+    with open(filename, mode) as f:
+        # The matrix tags are written back by seeking, so the file is not
+        # opened in 'ab' mode but from its end.
+        size = f.seek(0, os.SEEK_END)
+        writer = MatFile5Writer(f, unicode_strings=True, long_field_names=True,
+                                oned_as=oned_as)
+        try:
+            if mode == 'wb':
+                writer.write_file_header()
+            for name, var in mdict.items():
+                writer.do_compression = name in compressed
+                writer.put_variables({name: var}, write_header=False)
+        except BaseException:
+            # Leave the file as it was rather than with a partial variable.
+            f.truncate(size)
+            raise
+
+
+def _checkappend(filename:str):
+    # Variables are appended by a MATLAB 5 writer of the native byte order.
+    reader, _ = mat_reader_factory(filename, appendmat=False)
+    try:
+        if isinstance(reader, MatFile5Reader) == False:
+            raise ValueError("Variables can be appended only to a MATLAB 5 file.")
+        native = '<' if sys.byteorder == 'little' else '>'
+        if reader.byte_order != native:
+            raise ValueError("Variables can be appended only to a file of the"
+                             + " native byte order.")
+    finally:
+        reader.mat_stream.close()
@@ -1,11 +1,31 @@
-import scipy.io as io
+import io
+import os
+import zlib
+import struct
 import numpy as np
+import numpy.lib.format as fmt
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
-def savenpz(filename:str, *args, **kwds):
+# Size of the blocks compressed in parallel.
+_CHUNK = 2**20
+# Sizes and offsets from which zip64 records are written.
+_ZIP64_LIMIT = 2**32 - 1
+# Stored and deflate methods, and the date 1980-01-01 of the members.
+_STORED = 0
+_DEFLATED = 8
+# Alignment of the array data of the stored members, and the id of the
+# extra field which pads the local headers to it.
+_ALIGN = 64
+_ALIGNMENT_ID = 0xd935
+_DOSDATE = (0 << 9) | (1 << 5) | 1
+
+def savenpz(filename:str, *args, comp:bool=False, max_workers:int=None, **kwds):
     
     """
-    Save several arrays into a single file in uncompressed ``.npz`` format.
+    Save several arrays into a single file in uncompressed or compressed
+    ``.npz`` format.
     If arguments are passed in with no keywords, the corresponding variable
     names, in the ``.npz`` file, are 'arr_0', 'arr_1', etc. If keyword
     arguments are given, the corresponding variable names, in the ``.npz``
@@ -25,9 +45,24 @@ def savenpz(filename:str, *args, **kwds):
         with names "arr_0", "arr_1", and so on. These arguments can be any
         expression.
     
+    comp : bool, optional
+        If True, the arrays are compressed by deflate in blocks of 1 MiB in
+        a pool of threads, and the file is a standard compressed ``.npz``
+        archive as `np.savez_compressed` writes. Otherwise the data of each
+        array is stored at an offset which is a multiple of 64 bytes in the
+        archive, so that `loadnpz` maps it as an aligned array.
+        Default is False.
+    
+    max_workers : int, optional
+        The number of threads compressing the blocks when `comp` is True.
+        Default is the number of CPUs.
+    
     kwds : Keyword arguments, optional
         Arrays to save to the file. Arrays will be saved in the file with the
-        keyword names.
+        keyword names. `comp` and `max_workers` cannot be used as names, as
+        they are the options above: ``savenpz(filename, comp=arr)`` takes
+        `arr` as the option, whereas ``np.savez(filename, comp=arr)``, and
+        `savenpz` before these options, save an array named 'comp'.
     
     
     Returns
@@ -45,8 +80,9 @@ def savenpz(filename:str, *args, **kwds):
     Notes
     -----
     The ``.npz`` file format is a zipped archive of files named after the
-    variables they contain.  The archive is not compressed and each file
-    in the archive contains one variable in ``.npy`` format. For a
+    variables they contain.  The archive is not compressed unless `comp`
+    is True, and each file in the archive contains one variable in ``.npy``
+    format. For a
     description of the ``.npy`` format, see :py:mod:`numpy.lib.format`.
     When opening the saved ``.npz`` file with `load` a `NpzFile` object is
     returned. This is a dictionary-like object which can be queried for
@@ -94,5 +130,196 @@ def savenpz(filename:str, *args, **kwds):
         # Add '.npz' force.
         filename = filename + '.npz'
 
-    np.savez(filename, *args, **kwds)
-    
\ No newline at end of file
+    arrays = {'arr_%d' % i: arr for i, arr in enumerate(args)}
+    for name, arr in kwds.items():
+        if name in arrays:
+            raise ValueError("Cannot use un-named variables and keyword %s" % name)
+        arrays[name] = arr
+
+    with open(filename, 'wb') as f:
+        try:
+            if comp == False:
+                _writestored(f, arrays)
+            else:
+                _writezip(f, arrays, max_workers or os.cpu_count() or 1)
+        except BaseException:
+            # Remove the partial file, which this call created.
+            f.close()
+            os.remove(filename)
+            raise
+
+
+def _npy(arr) -> Tuple:
+    # The .npy header and the data of an array, without copying the data
+    # of a contiguous array.
+    arr = np.asanyarray(arr)
+    if arr.dtype.hasobject:
+        buf = io.BytesIO()
+        fmt.write_array(buf, arr, allow_pickle=True)
+        return b'', memoryview(buf.getvalue())
+
+    header = fmt.header_data_from_array_1_0(arr)
+    buf = io.BytesIO()
+    try:
+        fmt.write_array_header_1_0(buf, header)
+    except ValueError:
+        buf = io.BytesIO()
+        fmt.write_array_header_2_0(buf, header)
+    data = arr.T if header['fortran_order'] else arr
+    data = np.ascontiguousarray(data).reshape(-1).view(np.uint8)
+
+    return buf.getvalue(), memoryview(data)
+
+
+def _deflate(block, last:bool, zdict=None) -> bytes:
+    # Raw deflate of a block. The blocks which are not the last end with a
+    # sync flush on a byte boundary, so that they are concatenated into one
+    # deflate stream. The 32 KiB before the block are the dictionary, as
+    # they are the window of a sequential compressor.
+    if zdict is None or len(zdict) == 0:
+        z = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    else:
+        z = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15,
+                             zdict=zdict)
+    return z.compress(block) + z.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+def _crc32(header:bytes, data) -> int:
+    return zlib.crc32(data, zlib.crc32(header)) & 0xffffffff
+
+
+def _writestored(f, arrays:dict):
+    # Write the members uncompressed, with the local headers padded so that
+    # the array data begins at a multiple of _ALIGN in the file.
+    entries = []
+    for name, arr in arrays.items():
+        header, data = _npy(arr)
+        size = len(header) + len(data)
+        entry = {'name': (name + '.npy').encode('utf-8'), 'size': size,
+                 'csize': size, 'crc': _crc32(header, data),
+                 'offset': f.tell(), 'zip64': size >= _ZIP64_LIMIT,
+                 'method': _STORED, 'pad': 0}
+        start = entry['offset'] + len(_localheader(entry)) + len(header)
+        entry['pad'] = -start % _ALIGN
+        f.write(_localheader(entry))
+        f.write(header)
+        f.write(data)
+        entries.append(entry)
+
+    _writedirectory(f, entries)
+
+
+def _writezip(f, arrays:dict, max_workers:int):
+    # Write the blocks in order while the next blocks are compressed, with
+    # at most 4*max_workers blocks in flight.
+    entries = []
+    window = 4 * max_workers
+    with ThreadPoolExecutor(max_workers) as pool:
+        pending = deque()
+        try:
+            for task in _tasks(arrays, pool):
+                pending.append(task)
+                if len(pending) >= window:
+                    _writetask(f, pending.popleft(), entries)
+            while pending:
+                _writetask(f, pending.popleft(), entries)
+        finally:
+            for task in pending:
+                task[-1].cancel()
+
+    _writedirectory(f, entries)
+
+
+def _tasks(arrays:dict, pool):
+    # The CRC of each member, followed by its compressed blocks.
+    for name, arr in arrays.items():
+        header, data = _npy(arr)
+        yield ('member', name + '.npy', len(header) + len(data),
+               pool.submit(_crc32, header, data))
+        yield ('block', len(data) == 0, pool.submit(_deflate, header, len(data) == 0))
+        for i in range(0, len(data), _CHUNK):
+            last = (i + _CHUNK >= len(data))
+            yield ('block', last, pool.submit(_deflate, data[i:i+_CHUNK], last,
+                                              data[max(i-2**15, 0):i]))
+
+
+def _writetask(f, task, entries:list):
+    if task[0] == 'member':
+        # Local header with the sizes and the CRC written after the data.
+        _, name, size, crc = task
+        entry = {'name': name.encode('utf-8'), 'size': size, 'csize': 0,
+                 'crc': 0, 'offset': f.tell(),
+                 'zip64': size * 1.05 > _ZIP64_LIMIT, 'method': _DEFLATED}
+        entry['future'] = crc
+        f.write(_localheader(entry))
+        entries.append(entry)
+        return
+
+    _, last, block = task
+    entry = entries[-1]
+    entry['csize'] += f.write(block.result())
+    if last:
+        if entry['zip64'] == False and entry['csize'] > _ZIP64_LIMIT:
+            raise ValueError("The compressed array is too large for the archive.")
+        entry['crc'] = entry.pop('future').result()
+        end = f.tell()
+        f.seek(entry['offset'])
+        f.write(_localheader(entry))
+        f.seek(end)
+
+
+def _localheader(entry:dict) -> bytes:
+    name = entry['name']
+    if entry['zip64']:
+        extra = struct.pack('<2H2Q', 1, 16, entry['size'], entry['csize'])
+        size = csize = _ZIP64_LIMIT
+    else:
+        extra = b''
+        size, csize = entry['size'], entry['csize']
+    if entry.get('pad', 0) > 0:
+        # An alignment field as zipalign writes, of at least 6 bytes.
+        pad = entry['pad'] if entry['pad'] >= 6 else entry['pad'] + _ALIGN
+        extra += struct.pack('<3H', _ALIGNMENT_ID, pad - 4, _ALIGN) + bytes(pad - 6)
+
+    return struct.pack('<4s5H3L2H', b'PK\x03\x04', 45 if entry['zip64'] else 20,
+                       _flags(name), entry['method'], 0, _DOSDATE, entry['crc'],
+                       csize, size, len(name), len(extra)) + name + extra
+
+
+def _writedirectory(f, entries:list):
+    # Central directory and the end records, with the zip64 records if the
+    # sizes, the offsets or the number of members exceed the zip format.
+    start = f.tell()
+    for entry in entries:
+        name = entry['name']
+        zip64 = max(entry['size'], entry['csize'], entry['offset']) >= _ZIP64_LIMIT
+        if zip64:
+            extra = struct.pack('<2H3Q', 1, 24, entry['size'], entry['csize'], entry['offset'])
+            size = csize = offset = _ZIP64_LIMIT
+        else:
+            extra = b''
+            size, csize, offset = entry['size'], entry['csize'], entry['offset']
+        version = 45 if zip64 or entry['zip64'] else 20
+        f.write(struct.pack('<4s6H3L5H2L', b'PK\x01\x02', (3 << 8) | version,
+                            version, _flags(name), entry['method'], 0, _DOSDATE,
+                            entry['crc'], csize, size, len(name), len(extra),
+                            0, 0, 0, 0o600 << 16, offset) + name + extra)
+    end = f.tell()
+
+    count = len(entries)
+    if count >= 0xffff or end - start >= _ZIP64_LIMIT or start >= _ZIP64_LIMIT:
+        f.write(struct.pack('<4sQ2H2L4Q', b'PK\x06\x06', 44, 45, 45, 0, 0,
+                            count, count, end - start, start))
+        f.write(struct.pack('<4sLQL', b'PK\x06\x07', 0, end, 1))
+    f.write(struct.pack('<4s4H2LH', b'PK\x05\x06', 0, 0, min(count, 0xffff),
+                        min(count, 0xffff), min(end - start, _ZIP64_LIMIT),
+                        min(start, _ZIP64_LIMIT), 0))
+
+
+def _flags(name:bytes) -> int:
+    # UTF-8 names are flagged by bit 11.
+    try:
+        name.decode('ascii')
+        return 0
+    except UnicodeDecodeError:
+        return 0x800
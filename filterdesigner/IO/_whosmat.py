@@ -6,6 +6,10 @@ def whosmat(filename:str, byte_order:str=None, matlab_compatible:bool=False)->li
     """
     List variables inside a MATLAB file.
     
+    A variable appended by `savemat` with `append=True` supersedes the
+    variables of the same name before it, so only the last variable of
+    each name is listed, in the order of the file, as `loadmat` loads them.
+    
     Parameters
     ----------
     filename : str
@@ -44,5 +48,9 @@ def whosmat(filename:str, byte_order:str=None, matlab_compatible:bool=False)->li
     variables = io.whosmat(filename, appendmat=False, byte_order=byte_order, 
                            matlab_compatible=matlab_compatible)
     
+    # Keep the last variable of each name, as `compactmat` does.
+    last = {v[0]: i for i, v in enumerate(variables)}
+    variables = [v for i, v in enumerate(variables) if last[v[0]] == i]
+
     return variables
     
\ No newline at end of file
@@ -13,3 +13,7 @@ from . import FilterSpec
 from . import FIRDesign
 from . import IIRDesign
 from . import IO
+
+from ._designfilt import designfilt
+from ._validate import trusted
+from ._profile import profiling, profilestats, serveprofile, writeprofile
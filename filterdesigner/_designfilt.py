@@ -0,0 +1,212 @@
+import warnings
+import numpy as np
+import scipy.signal as signal
+from typing import List, Tuple
+from . import FIRDesign
+from . import IIRDesign
+from .FilterSpec._measure import measure
+
+def designfilt(Wp, Ws, Rp:float, Rs:float, methods=None,
+               weights=(1.0, 0.0, 0.0))->Tuple:
+    """
+    Design the cheapest digital filter that meets a specification.
+
+    The filter orders of the candidate design methods are estimated by
+    `buttord`, `cheb1ord`, `cheb2ord`, `ellipord`, `kaiserord` and
+    `firpmmin`, the candidates are designed and measured, and the candidate
+    with the lowest computational cost among the ones that meet the
+    specification is returned. If none of them meets the specification, a
+    warning is issued and the cheapest candidate is returned. 'firpm' is
+    skipped if `firpmmin` finds no order up to its limit.
+
+    Parameters
+    ----------
+    Wp, Ws : float or array_like
+        Passband and stopband edge frequencies, specified as a scalar or
+        a two-element vector with values between 0 and 1, with
+        1 corresponding to the normalized Nyquist frequency.
+        For example,
+        ・Lowpass: wp = 0.2, ws = 0.3
+        ・Highpass: wp = 0.3, ws = 0.2
+        ・Bandpass: wp = [0.2, 0.5], ws = [0.1, 0.6]
+        ・Bandstop: wp = [0.1, 0.6], ws = [0.2, 0.5]
+
+    Rp : float
+        The maximum peak-to-peak ripple in the passband (dB).
+
+    Rs : float
+        The minimum attenuation in the stopband (dB).
+
+    methods : list of str, optional
+        The candidate design methods, chosen from 'butter', 'cheby1',
+        'cheby2', 'ellip', 'firpm' and 'kaiser' ('kaiserord' and 'fir1').
+        Default is all of them.
+
+    weights : tuple of float, optional
+        Weights of the multiply-accumulate operations per sample, the number
+        of state variables and the latency (samples) in the cost.
+        Default is (1.0, 0.0, 0.0), that is, the number of MACs per sample.
+
+    Raises
+    ------
+    ValueError
+        If `Wp` and `Ws` do not describe a lowpass, highpass, bandpass or
+        bandstop filter.
+        If `methods` includes an unknown method.
+        If no candidate is left, that is, `methods` is ['firpm'] and
+        `firpmmin` finds no order up to its limit.
+
+    Returns
+    -------
+    system : a tuple of array_like or ndarray describing the system.
+            A FIR filter is returned as (num, den) with den = 1, and an IIR
+            filter as second-order sections, an array of shape
+            (number of sections, 6), which the cost model assumes.
+
+    candidates : list of dict
+        Cost breakdown of every candidate sorted by the cost, where
+        candidates[0] is the returned filter. Each dict has the keys:
+
+            * 'method' : the design method.
+            * 'n' : the order of the digital filter.
+            * 'macs' : multiply-accumulate operations per sample.
+            * 'state' : the number of state variables (delays).
+            * 'latency' : the maximum group delay in the passband (samples).
+            * 'cost' : the weighted sum of 'macs', 'state' and 'latency'.
+            * 'meets' : True if the filter meets the specification.
+            * 'system' : the filter coefficients, (num, den) or sos.
+
+    Notes
+    -----
+    The cost model assumes a direct form FIR filter, which needs n+1 MACs
+    and n delays, and an IIR filter realized as a cascade of second-order
+    sections in transposed direct form II, which needs 5 MACs and 2 delays
+    for each biquad and 3 MACs and 1 delay for a first-order section.
+    The responses of the IIR candidates are measured from their
+    second-order sections, which are returned.
+    """
+
+    methodlist = ['butter', 'cheby1', 'cheby2', 'ellip', 'firpm', 'kaiser']
+    if methods is None:
+        methods = methodlist
+    for m in methods:
+        if (m in methodlist) == False:
+            raise ValueError("`methods` must be 'butter', 'cheby1', 'cheby2',"
+                             + " 'ellip', 'firpm' or 'kaiser'.")
+
+    wp = np.atleast_1d(np.asarray(Wp, dtype=float))
+    ws = np.atleast_1d(np.asarray(Ws, dtype=float))
+
+    # Determine the filter type, and the bands for FIR filter design.
+    if len(wp) == 1 and len(ws) == 1 and wp[0] < ws[0]:
+        ftype = 'low'
+        f, a = [wp[0], ws[0]], [1, 0]
+    elif len(wp) == 1 and len(ws) == 1 and wp[0] > ws[0]:
+        ftype = 'high'
+        f, a = [ws[0], wp[0]], [0, 1]
+    elif len(wp) == 2 and len(ws) == 2 and ws[0] < wp[0] < wp[1] < ws[1]:
+        ftype = 'bandpass'
+        f, a = [ws[0], wp[0], wp[1], ws[1]], [0, 1, 0]
+    elif len(wp) == 2 and len(ws) == 2 and wp[0] < ws[0] < ws[1] < wp[1]:
+        ftype = 'stop'
+        f, a = [wp[0], ws[0], ws[1], wp[1]], [1, 0, 1]
+    else:
+        raise ValueError("`Wp` and `Ws` must describe a lowpass, highpass,"
+                         + " bandpass or bandstop filter.")
+
+    if len(wp) == 1:
+        Wp = float(wp[0])
+        Ws = float(ws[0])
+    else:
+        Wp = list(wp)
+        Ws = list(ws)
+    Rp = float(Rp)
+    Rs = float(Rs)
+
+    # Deviations of FIR filters with the peak-to-peak ripple Rp.
+    dev = [(10**(Rp/20)-1)/(10**(Rp/20)+1) if x else 10**(-Rs/20) for x in a]
+
+    candidates = []
+    for method in methods:
+        # IIR filters are designed as the cascade of the cost model.
+        sos = True
+        if method == 'butter':
+            n, Wn = IIRDesign.buttord(Wp, Ws, Rp, Rs)
+            system = signal.butter(n, Wn, ftype, output='sos')
+        elif method == 'cheby1':
+            n, Wn = IIRDesign.cheb1ord(Wp, Ws, Rp, Rs)
+            system = signal.cheby1(n, Rp, Wn, ftype, output='sos')
+        elif method == 'cheby2':
+            n, Wn = IIRDesign.cheb2ord(Wp, Ws, Rp, Rs)
+            system = signal.cheby2(n, Rs, Wn, ftype, output='sos')
+        elif method == 'ellip':
+            n, Wn = IIRDesign.ellipord(Wp, Ws, Rp, Rs)
+            system = signal.ellip(n, Rp, Rs, Wn, ftype, output='sos')
+        elif method == 'firpm':
+            sos = False
+            try:
+                n, system = FIRDesign.firpmmin(f, a, dev)
+            except ValueError:
+                # No order up to the limit of `firpmmin` meets the deviations.
+                continue
+        else:
+            sos = False
+            n, Wn, beta, kftype = FIRDesign.kaiserord(f, a, dev)
+            system = FIRDesign.fir1(n, Wn, ftype=kftype,
+                                    window=('kaiser', beta), scaleopt=False)
+
+        candidates.append(_cost(method, system, f, a, Rp, Rs, weights, sos))
+
+    if len(candidates) == 0:
+        raise ValueError("No candidate design method is left, as `firpmmin`"
+                         + " finds no filter order meeting the specification.")
+
+    # Sort the candidates meeting the specification first by the cost.
+    candidates.sort(key=lambda c: (not c['meets'], c['cost']))
+    if candidates[0]['meets'] == False:
+        warnings.warn("No candidate meets the specification. The cheapest of"
+                      + " the candidates is returned.")
+
+    return candidates[0]['system'], candidates
+
+
+def _cost(method:str, system, f, a, Rp:float, Rs:float, weights,
+          sos:bool=False)->dict:
+    """
+    Cost breakdown of a designed filter, (num, den) or second-order sections.
+    """
+
+    if sos:
+        # Cascade of second-order sections, where the first-order sections
+        # have zero b2 and a2.
+        first = (system[:, 2] == 0) & (system[:, 5] == 0)
+        n = 2*len(system) - int(np.sum(first))
+        macs = 5*(n//2) + 3*(n % 2)
+        state = n
+        sections = [(s[:3], s[3:]) for s in system]
+    else:
+        # Direct form FIR filter
+        num = np.atleast_1d(system[0])
+        n = len(num) - 1
+        macs = n + 1
+        state = n
+        sections = [(num, np.atleast_1d(system[1]))]
+
+    # Maximum group delay in the passbands.
+    bands = np.hstack(([0], f, [1]))
+    latency = 0.0
+    for i in range(len(a)):
+        if a[i] != 0:
+            w = np.linspace(bands[2*i], bands[2*i+1], 256)
+            # The group delay of a cascade is the sum of the sections.
+            gd = sum(signal.group_delay(s, w=w, fs=2)[1] for s in sections)
+            latency = max(latency, float(np.max(gd)))
+
+    Rpm, Rsm, _, _ = measure(system, f, a, sos=sos)
+    meets = bool(np.all(Rpm <= Rp + 1e-3) and np.all(Rsm >= Rs - 1e-3))
+
+    cost = weights[0]*macs + weights[1]*state + weights[2]*latency
+
+    return {'method': method, 'n': n, 'macs': macs, 'state': state,
+            'latency': latency, 'cost': cost, 'meets': meets,
+            'system': system}
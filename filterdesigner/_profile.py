@@ -0,0 +1,360 @@
+import os
+import sys
+import json
+import time
+import types
+import inspect
+import bisect
+import threading
+import functools
+import contextlib
+import contextvars
+import numpy as np
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+# Upper bounds of the histogram buckets of the wall and CPU times (s) and
+# of the number of array elements of the arguments.
+_TIMEBUCKETS = [1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0, float('inf')]
+_SIZEBUCKETS = [1, 10, 100, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, float('inf')]
+
+_lock = threading.Lock()
+_stats = {}
+# Profiling is enabled in the current thread or task by `profiling`, and
+# for the whole process by the environment variable.
+_enabled = contextvars.ContextVar('filterdesigner_profiling',
+    default=os.environ.get('FILTERDESIGNER_PROFILE', '') not in ['', '0'])
+
+
+@contextlib.contextmanager
+def profiling(enable:bool=True):
+    """
+    Record the calls of the public functions.
+
+    Within the `with` block, the calls of the functions of FIRDesign,
+    IIRDesign, FilterSpec and IO are counted, and their wall times, CPU
+    times and the number of array elements of their arguments are recorded
+    in histograms. The block affects only the current thread or asyncio
+    task, as `trusted` does. Profiling is also enabled for the whole
+    process by the environment variable FILTERDESIGNER_PROFILE=1. When
+    disabled, the cost of a call is one flag check.
+
+    Generators, such as those of `impzgen` or `loadfiles(stream=True)`,
+    are timed over their iteration, excluding the time of the consumer,
+    and recorded when they are exhausted or closed.
+
+    Parameters
+    ----------
+        enable : bool, optional
+            If False, profiling is disabled within the block.
+            Default is True.
+    """
+
+    token = _enabled.set(bool(enable))
+    try:
+        yield
+    finally:
+        _enabled.reset(token)
+
+
+def profilestats(reset:bool=False) -> dict:
+    """
+    Statistics recorded by `profiling`.
+
+    Parameters
+    ----------
+        reset : bool, optional
+            If True, the statistics are cleared after they are returned.
+
+    Returns
+    -------
+        stats : dict
+            Statistics keyed by the qualified function name, such as
+            'FIRDesign.fir1'. Each value has 'calls', 'errors', 'wall_sum',
+            'cpu_sum', 'elements_sum' and the histograms 'wall', 'cpu' and
+            'elements', which are the counts of the buckets with the upper
+            bounds 'time_buckets' and 'size_buckets'.
+    """
+
+    with _lock:
+        stats = {}
+        for name, s in _stats.items():
+            stats[name] = dict(s, wall=list(s['wall']), cpu=list(s['cpu']),
+                               elements=list(s['elements']))
+        if reset:
+            _stats.clear()
+
+    for s in stats.values():
+        s['time_buckets'] = _TIMEBUCKETS
+        s['size_buckets'] = _SIZEBUCKETS
+
+    return stats
+
+
+def writeprofile(file, fmt:str='jsonl', reset:bool=False):
+    """
+    Export the statistics recorded by `profiling`.
+
+    Parameters
+    ----------
+        file : str or file-like object
+            Path or text stream to write to. A path is appended to, so that
+            periodic exports of JSON lines accumulate in one file.
+
+        fmt : str, optional
+            'jsonl' for one JSON object per function with a timestamp, or
+            'prometheus' for the Prometheus text exposition format.
+            Default is 'jsonl'.
+
+        reset : bool, optional
+            If True, the statistics are cleared after they are written.
+
+    Raises
+    ------
+        ValueError
+            If `fmt` is not 'jsonl' or 'prometheus'.
+    """
+
+    if (fmt in ['jsonl', 'prometheus']) == False:
+        raise ValueError("`fmt` must be 'jsonl' or 'prometheus'.")
+
+    stats = profilestats(reset=reset)
+    if fmt == 'prometheus':
+        text = _prometheus(stats)
+    else:
+        now = time.time()
+        text = ''.join(json.dumps(dict(s, function=name, timestamp=now)) + '\n'
+                       for name, s in stats.items())
+
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, 'a' if fmt == 'jsonl' else 'w') as fp:
+            fp.write(text)
+    else:
+        file.write(text)
+
+
+def serveprofile(port:int=9464, host:str='127.0.0.1'):
+    """
+    Serve the statistics of `profiling` for Prometheus over HTTP.
+
+    A server thread answers GET /metrics with the Prometheus text
+    exposition format.
+
+    Parameters
+    ----------
+        port : int, optional
+            The port. If 0, a free port is chosen. Default is 9464.
+
+        host : str, optional
+            The address to bind. Default is '127.0.0.1', the local host only.
+
+    Returns
+    -------
+        server : http.server.ThreadingHTTPServer
+            The running server. `server.server_address` is the bound address
+            and `server.shutdown()` stops it.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] not in ['/metrics', '/']:
+                self.send_error(404)
+                return
+            body = _prometheus(profilestats()).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server
+
+
+def _prometheus(stats:dict) -> str:
+    # Prometheus text exposition format of the statistics.
+    lines = []
+    metrics = [('filterdesigner_calls_total', 'counter', 'Number of calls.'),
+               ('filterdesigner_errors_total', 'counter',
+                'Number of calls that raised an exception.'),
+               ('filterdesigner_wall_seconds', 'histogram', 'Wall time of calls.'),
+               ('filterdesigner_cpu_seconds', 'histogram',
+                'CPU time of the calling thread.'),
+               ('filterdesigner_elements', 'histogram',
+                'Number of array elements of the arguments.')]
+    for metric, kind, text in metrics:
+        lines.append('# HELP %s %s' % (metric, text))
+        lines.append('# TYPE %s %s' % (metric, kind))
+        for name, s in sorted(stats.items()):
+            label = 'function="%s"' % name
+            if kind == 'counter':
+                key = 'calls' if metric.endswith('calls_total') else 'errors'
+                lines.append('%s{%s} %d' % (metric, label, s[key]))
+                continue
+            key = metric.split('_')[1]
+            counts = s[key]
+            bounds = _SIZEBUCKETS if key == 'elements' else _TIMEBUCKETS
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                lines.append('%s_bucket{%s,le="%s"} %d' % (metric, label, le, cumulative))
+            lines.append('%s_sum{%s} %r' % (metric, label, float(s[key + '_sum'])))
+            lines.append('%s_count{%s} %d' % (metric, label, s['calls']))
+
+    return '\n'.join(lines) + '\n'
+
+
+def _elements(x, depth:int=2) -> int:
+    # Number of array elements in an argument, such as (num, den).
+    if isinstance(x, np.ndarray):
+        return x.size
+    if isinstance(x, (list, tuple)) and depth > 0:
+        return sum(_elements(i, depth-1) for i in x) if depth > 1 else len(x)
+    return 0
+
+
+def _record(name:str, wall:float, cpu:float, elements:int, error:bool):
+    with _lock:
+        s = _stats.get(name)
+        if s is None:
+            s = _stats[name] = {'calls': 0, 'errors': 0, 'wall_sum': 0.0,
+                                'cpu_sum': 0.0, 'elements_sum': 0,
+                                'wall': [0]*len(_TIMEBUCKETS),
+                                'cpu': [0]*len(_TIMEBUCKETS),
+                                'elements': [0]*len(_SIZEBUCKETS)}
+        s['calls'] += 1
+        s['errors'] += error
+        s['wall_sum'] += wall
+        s['cpu_sum'] += cpu
+        s['elements_sum'] += elements
+        s['wall'][bisect.bisect_left(_TIMEBUCKETS, wall)] += 1
+        s['cpu'][bisect.bisect_left(_TIMEBUCKETS, cpu)] += 1
+        s['elements'][bisect.bisect_left(_SIZEBUCKETS, elements)] += 1
+
+
+def _wrap(func, name:str):
+    if inspect.iscoroutinefunction(func):
+        return _wrapasync(func, name)
+    if inspect.isgeneratorfunction(func):
+        return _wrapgen(func, name)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled.get():
+            return func(*args, **kwargs)
+        elements = _count(args, kwargs)
+        t0 = time.perf_counter()
+        c0 = time.thread_time()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            _record(name, time.perf_counter() - t0, time.thread_time() - c0,
+                    elements, True)
+            raise
+        wall = time.perf_counter() - t0
+        cpu = time.thread_time() - c0
+        if isinstance(result, types.GeneratorType):
+            # A generator returned by a function, such as the streamed
+            # results of `loadfiles`, is recorded when it ends.
+            return _iterate(result, name, elements, wall, cpu)
+        _record(name, wall, cpu, elements, False)
+        return result
+    return wrapper
+
+
+def _wrapgen(func, name:str):
+    # Generator functions stay generator functions.
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled.get():
+            return (yield from func(*args, **kwargs))
+        return (yield from _iterate(func(*args, **kwargs), name,
+                                    _count(args, kwargs), 0.0, 0.0))
+    return wrapper
+
+
+def _wrapasync(func, name:str):
+    # Coroutine functions stay coroutine functions. The CPU time is that of
+    # the thread of the event loop only.
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not _enabled.get():
+            return await func(*args, **kwargs)
+        elements = _count(args, kwargs)
+        t0 = time.perf_counter()
+        c0 = time.thread_time()
+        error = True
+        try:
+            result = await func(*args, **kwargs)
+            error = False
+            return result
+        finally:
+            _record(name, time.perf_counter() - t0, time.thread_time() - c0,
+                    elements, error)
+    return wrapper
+
+
+def _iterate(gen, name:str, elements:int, wall:float, cpu:float):
+    # Pass the values, exceptions and close of the consumer to `gen`, and
+    # time its resumptions only.
+    error = True
+    value = None
+    thrown = None
+    try:
+        while True:
+            t0 = time.perf_counter()
+            c0 = time.thread_time()
+            try:
+                if thrown is None:
+                    item = gen.send(value)
+                else:
+                    item = gen.throw(thrown)
+            except StopIteration as stop:
+                error = False
+                return stop.value
+            finally:
+                wall += time.perf_counter() - t0
+                cpu += time.thread_time() - c0
+            value = None
+            thrown = None
+            try:
+                value = yield item
+            except GeneratorExit:
+                gen.close()
+                error = False
+                raise
+            except BaseException as e:
+                thrown = e
+    finally:
+        _record(name, wall, cpu, elements, error)
+
+
+def _count(args, kwargs) -> int:
+    return sum(_elements(x) for x in args) + sum(_elements(x) for x in kwargs.values())
+
+
+def _instrument(namespace:dict):
+    """
+    Wrap the public functions in the namespace of a subpackage.
+
+    The wrappers also replace the functions in their defining modules, so
+    that the functions are pickled by reference to the wrappers, as for a
+    ProcessPoolExecutor.
+    """
+
+    package = namespace['__name__'].split('.')[-1]
+    for name, func in list(namespace.items()):
+        if name.startswith('_') or not isinstance(func, types.FunctionType):
+            continue
+        wrapper = _wrap(func, package + '.' + name)
+        namespace[name] = wrapper
+        module = sys.modules.get(func.__module__)
+        if module is not None and getattr(module, func.__qualname__, None) is func:
+            setattr(module, func.__qualname__, wrapper)
@@ -0,0 +1,113 @@
+import numbers
+import contextlib
+import contextvars
+import numpy as np
+from typing import List, Tuple
+
+# Parameter checks are skipped while this is True. A context variable keeps
+# the mode local to the thread or the task that enabled it.
+_trusted = contextvars.ContextVar('trusted', default=False)
+
+# Concrete types for isinstance, which is several times faster than the
+# abstract base classes of `numbers` on the hot path. Other registered
+# numbers.Integral or numbers.Real types fall back to the abstract check.
+_INTS = (int, np.integer)
+_FLOATS = (float, np.floating)
+
+
+@contextlib.contextmanager
+def trusted(flag:bool=True):
+    """
+    Skip the parameter checks of the design functions.
+
+    Within the `with` block, the design functions do not validate the types
+    and the ranges of their parameters, which reduces the overhead of tiny
+    designs in tight loops. Invalid parameters may then give errors from
+    SciPy or wrong results instead of ValueError.
+
+    Parameters
+    ----------
+        flag : bool, optional
+            If False, the checks are enabled within the block, for example
+            inside a trusted block. Default is True.
+
+    Examples
+    --------
+        >>> with filterdesigner.trusted():
+        ...     for fc in np.linspace(0.1, 0.9, 1000):
+        ...         num, den = filterdesigner.IIRDesign.butter(4, fc)
+    """
+
+    token = _trusted.set(bool(flag))
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+def _istrusted()->bool:
+    return _trusted.get()
+
+
+def _isint(x)->bool:
+    # Integers except bool.
+    if isinstance(x, _INTS):
+        return not isinstance(x, bool)
+    return isinstance(x, numbers.Integral) and not isinstance(x, bool)
+
+
+def _isfloat(x)->bool:
+    # Floating point scalars.
+    return isinstance(x, _FLOATS)
+
+
+def _isreal(x)->bool:
+    # Integer or floating point scalars except bool.
+    if isinstance(x, _FLOATS):
+        return True
+    return _isint(x) or (isinstance(x, numbers.Real) and not isinstance(x, bool))
+
+
+def _isseq(x)->bool:
+    # Sequences of frequencies.
+    return isinstance(x, (list, np.ndarray))
+
+
+def _asvector(x)->np.ndarray:
+    # Scalars and sequences as 1D arrays. Arrays are returned as they are.
+    if isinstance(x, np.ndarray):
+        return x
+    if isinstance(x, (list, tuple)):
+        return np.array(x)
+    return np.array([x])
+
+
+def _checkint(x, msg:str):
+    if not _trusted.get() and not _isint(x):
+        raise ValueError(msg)
+
+
+def _checkfloat(x, msg:str):
+    if not _trusted.get() and not _isfloat(x):
+        raise ValueError(msg)
+
+
+def _checkreal(x, msg:str):
+    if not _trusted.get() and not _isreal(x):
+        raise ValueError(msg)
+
+
+def _checkin(x, options, msg:str):
+    if not _trusted.get() and (x in options) == False:
+        raise ValueError(msg)
+
+
+def _checkrange(x, msg:str):
+    # Normalized digital frequencies from 0 to 1.
+    if _trusted.get():
+        return
+    if _isseq(x):
+        if np.max(x) >= 1.0 or np.min(x) < 0.0:
+            raise ValueError(msg)
+    elif x >= 1.0 or x < 0.0:
+        raise ValueError(msg)
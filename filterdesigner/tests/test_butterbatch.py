@@ -0,0 +1,48 @@
+import unittest
+import filterdesigner.IIRDesign as IIRDesign
+import scipy.signal as signal
+import numpy as np
+
+class TestButterbatch(unittest.TestCase):
+
+    def setUp(self):
+        self.n = np.array([1, 2, 3, 4, 5, 8])
+        self.fc = np.linspace(0.1, 0.8, 6)
+
+    def test_butterbatch_1(self):
+        # Test case for lowpass filters as SOS
+        sos = IIRDesign.butterbatch(self.n, self.fc)
+        self.assertTrue(sos.shape == (6, 4, 6))
+        for i in range(len(self.n)):
+            _, h = signal.sosfreqz(sos[i])
+            _, hh = signal.sosfreqz(signal.butter(self.n[i], self.fc[i], output='sos'))
+            self.assertTrue(np.allclose(h, hh))
+
+    def test_butterbatch_2(self):
+        # Test case for highpass filters as zpk
+        z, p, k = IIRDesign.butterbatch(self.n, self.fc, ftype='high', output='zpk')
+        self.assertTrue(z.shape == (6, 8) and p.shape == (6, 8) and k.shape == (6,))
+        for i in range(len(self.n)):
+            _, h = signal.freqz_zpk(z[i], p[i], k[i])
+            _, hh = signal.freqz_zpk(*signal.butter(self.n[i], self.fc[i], 'high', output='zpk'))
+            self.assertTrue(np.allclose(h, hh))
+
+    def test_butterbatch_3(self):
+        # Test case for broadcasting a scalar order
+        sos = IIRDesign.butterbatch(4, self.fc)
+        self.assertTrue(sos.shape == (6, 2, 6))
+
+    def test_butterbatch_4(self):
+        # Test case for Exception 1
+        with self.assertRaises(ValueError):
+            IIRDesign.butterbatch(3.5, self.fc)
+
+    def test_butterbatch_5(self):
+        # Test case for Exception 2
+        with self.assertRaises(ValueError):
+            IIRDesign.butterbatch(self.n, self.fc, ftype='bandpass')
+
+    def test_butterbatch_6(self):
+        # Test case for Exception 3
+        with self.assertRaises(ValueError):
+            IIRDesign.butterbatch(self.n, 1.5)
@@ -0,0 +1,32 @@
+import unittest
+import filterdesigner.IIRDesign as IIRDesign
+import scipy.signal as signal
+import numpy as np
+
+class TestCheby1batch(unittest.TestCase):
+
+    def setUp(self):
+        self.n = np.array([1, 2, 3, 4, 5, 8])
+        self.rp = np.array([0.1, 0.5, 1, 1, 2, 3])
+        self.fc = np.linspace(0.1, 0.8, 6)
+
+    def test_cheby1batch_1(self):
+        # Test case for lowpass filters as SOS
+        sos = IIRDesign.cheby1batch(self.n, self.rp, self.fc)
+        for i in range(len(self.n)):
+            _, h = signal.sosfreqz(sos[i])
+            _, hh = signal.sosfreqz(signal.cheby1(self.n[i], self.rp[i], self.fc[i], output='sos'))
+            self.assertTrue(np.allclose(h, hh))
+
+    def test_cheby1batch_2(self):
+        # Test case for highpass filters as zpk
+        z, p, k = IIRDesign.cheby1batch(self.n, self.rp, self.fc, ftype='high', output='zpk')
+        for i in range(len(self.n)):
+            _, h = signal.freqz_zpk(z[i], p[i], k[i])
+            _, hh = signal.freqz_zpk(*signal.cheby1(self.n[i], self.rp[i], self.fc[i], 'high', output='zpk'))
+            self.assertTrue(np.allclose(h, hh))
+
+    def test_cheby1batch_3(self):
+        # Test case for Exception
+        with self.assertRaises(ValueError):
+            IIRDesign.cheby1batch(self.n, -1, self.fc)
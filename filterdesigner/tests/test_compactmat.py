@@ -0,0 +1,38 @@
+import os
+import shutil
+import tempfile
+import unittest
+import warnings
+import filterdesigner.IO as IO
+import scipy.io as io
+import numpy as np
+
+class TestCompactmat(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, 'filters.mat')
+        IO.savemat(self.filename, {'b': np.arange(5.0), 'a': np.ones(3)})
+        IO.savemat(self.filename, {'b': np.arange(7.0), 'c': np.eye(4)}, comp=True, append=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_compactmat_1(self):
+        # Test case for the superseded variables
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            ref = IO.loadmat(self.filename, None)
+        self.assertTrue(np.array_equal(ref['b'][0], np.arange(7.0)))
+        self.assertTrue(IO.compactmat(self.filename) > 0)
+        self.assertTrue([v[0] for v in io.whosmat(self.filename)] == ['a', 'b', 'c'])
+        mat = io.loadmat(self.filename)
+        for name in ['a', 'b', 'c']:
+            self.assertTrue(np.array_equal(mat[name], ref[name]))
+        self.assertTrue(IO.compactmat(self.filename) == 0)
+
+    def test_compactmat_2(self):
+        # Test case for the removed variables
+        IO.compactmat(self.filename, remove=['c'])
+        self.assertTrue([v[0] for v in io.whosmat(self.filename)] == ['a', 'b'])
+        self.assertTrue(np.array_equal(io.loadmat(self.filename)['b'][0], np.arange(7.0)))
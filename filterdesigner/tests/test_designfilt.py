@@ -0,0 +1,69 @@
+import unittest
+import warnings
+import filterdesigner as filterdesigner
+import filterdesigner.FilterSpec as FilterSpec
+import scipy.signal as signal
+import numpy as np
+
+class TestDesignfilt(unittest.TestCase):
+
+    def setUp(self):
+        self.wp = 0.2
+        self.ws = 0.3
+        self.Rp = 1
+        self.Rs = 60
+        self.wp2 = [0.2, 0.5]
+        self.ws2 = [0.1, 0.6]
+
+    def test_designfilt_1(self):
+        # Test case for lowpass filter
+        fil, cand = filterdesigner.designfilt(self.wp, self.ws, self.Rp, self.Rs)
+        self.assertTrue(len(cand) == 6 and cand[0]['system'] is fil)
+        self.assertTrue(cand[0]['meets'] and cand[0]['method'] == 'ellip')
+        self.assertTrue(fil.shape == ((cand[0]['n']+1)//2, 6))
+        costs = [c['cost'] for c in cand if c['meets']]
+        self.assertTrue(costs == sorted(costs))
+        Rp, Rs, _, _ = FilterSpec.measure(signal.sos2tf(fil), [self.wp, self.ws], [1, 0])
+        self.assertTrue(Rp[0] <= self.Rp + 1e-3 and Rs[0] >= self.Rs - 1e-3)
+
+    def test_designfilt_2(self):
+        # Test case for bandpass filter with FIR methods only
+        fil, cand = filterdesigner.designfilt(self.wp2, self.ws2, self.Rp, 50,
+                                              methods=['firpm', 'kaiser'])
+        self.assertTrue(cand[0]['method'] == 'firpm' and np.all(fil[1] == 1))
+        self.assertTrue(cand[0]['macs'] == len(fil[0]))
+        self.assertAlmostEqual(cand[0]['latency'], (len(fil[0])-1)/2)
+
+    def test_designfilt_3(self):
+        # Test case for the weights of the cost
+        _, cand = filterdesigner.designfilt(self.wp, self.ws, self.Rp, self.Rs,
+                                            weights=(1, 2, 3))
+        for c in cand:
+            self.assertTrue(np.isclose(c['cost'], c['macs'] + 2*c['state'] + 3*c['latency']))
+
+    def test_designfilt_4(self):
+        # Test case for Exception 1
+        with self.assertRaises(ValueError):
+            filterdesigner.designfilt(self.wp2, self.ws, self.Rp, self.Rs)
+
+    def test_designfilt_5(self):
+        # Test case for Exception 2
+        with self.assertRaises(ValueError):
+            filterdesigner.designfilt(self.wp, self.ws, self.Rp, self.Rs, methods=['x'])
+
+    def test_designfilt_6(self):
+        # Test case for the warning when no candidate meets the specification
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            fil, cand = filterdesigner.designfilt(0.2, 0.22, 0.01, 120, methods=['kaiser'])
+        self.assertTrue(cand[0]['meets'] == False and fil is cand[0]['system'])
+        self.assertTrue(any('No candidate' in str(x.message) for x in w))
+
+    def test_designfilt_7(self):
+        # Test case for the firpm candidate beyond the order limit of firpmmin
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            _, cand = filterdesigner.designfilt(0.2, 0.205, 0.01, 120, methods=['firpm', 'kaiser'])
+            self.assertTrue([c['method'] for c in cand] == ['kaiser'])
+            with self.assertRaises(ValueError):
+                filterdesigner.designfilt(0.2, 0.205, 0.01, 120, methods=['firpm'])
@@ -0,0 +1,50 @@
+import unittest
+import filterdesigner.FilterSpec as FilterSpec
+import filterdesigner.FIRDesign as FIRDesign
+import filterdesigner.IIRDesign as IIRDesign
+import scipy.signal as signal
+import numpy as np
+
+class TestFilternorm(unittest.TestCase):
+
+    def setUp(self):
+        self.order = 80
+        self.cut = 0.5
+        self.n = 20000
+
+    def energy(self, b, a):
+        h = signal.lfilter(b, a, np.eye(1, self.n)[0])
+        return np.sqrt(np.sum(h**2))
+
+    def test_filternorm_1(self):
+        # Test case for FIR filter
+        fil = FIRDesign.fir1(self.order, self.cut)
+        self.assertTrue(np.isclose(FilterSpec.filternorm(fil), np.sqrt(np.sum(fil[0]**2))))
+
+    def test_filternorm_2(self):
+        # Test case for a bank of IIR filters
+        bank = [IIRDesign.butter(n, 0.3) for n in range(1, 10)] + [IIRDesign.iirpeak(0.3, 0.01)]
+        L = FilterSpec.filternorm(bank)
+        self.assertTrue(L.shape == (10,))
+        self.assertTrue(np.allclose(L, [self.energy(*fil) for fil in bank]))
+
+    def test_filternorm_3(self):
+        # Test case for second-order sections
+        sos = signal.ellip(8, 0.5, 60, 0.2, output='sos')
+        b, a = signal.sos2tf(sos)
+        L = FilterSpec.filternorm(np.array([sos, sos[::-1]]), sos=True)
+        self.assertTrue(np.allclose(L, self.energy(b, a)))
+        self.assertTrue(np.isclose(FilterSpec.filternorm(sos, np.inf, sos=True), 1.0, atol=1e-6))
+
+    def test_filternorm_4(self):
+        # Test case for infinity-norm
+        fil = IIRDesign.cheby1(5, 1, 0.3)
+        w, h = signal.freqz(fil[0], fil[1], worN=2**16)
+        self.assertTrue(np.isclose(FilterSpec.filternorm(fil, pnorm=np.inf), np.max(np.abs(h)), atol=1e-6))
+
+    def test_filternorm_5(self):
+        # Test case for Exception
+        with self.assertRaises(ValueError):
+            FilterSpec.filternorm(([1], [1, -2]))
+        with self.assertRaises(ValueError):
+            FilterSpec.filternorm(([1], [1, 0.5]), pnorm=1)
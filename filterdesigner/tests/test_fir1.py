@@ -66,3 +66,28 @@ class TestFIR1(unittest.TestCase):
         # test for exception 4
         with self.assertRaises(ValueError):
             FIRDesign.fir1(self.n, [self.f1, self.f2, self.f3, self.f4], ftype='high')
+
+    def test_fir1_11(self):
+        # Test for lowpass filters with 2D array of cutoff frequencies.
+        cuts = np.linspace(0.1, 0.9, 9)
+        FIR = FIRDesign.fir1(self.n, cuts[:, None])
+        fir = np.array([signal.firwin(self.n+1, c, window='hamming', pass_zero=True, scale=True) for c in cuts])
+        self.assertTrue(FIR[0].shape == (9, self.n+1) and np.all(FIR[0] == fir))
+
+    def test_fir1_12(self):
+        # Test for bandstop filters with 2D array of band edges.
+        edges = np.array([[self.f1, self.f2], [self.f2, self.f3], [self.f3, self.f4]])
+        FIR = FIRDesign.fir1(self.n, edges, ftype='stop')
+        fir = np.array([signal.firwin(self.n+1, e, window='hamming', pass_zero=True, scale=True) for e in edges])
+        self.assertTrue(np.all(FIR[0] == fir))
+
+    def test_fir1_13(self):
+        # Test for bandpass filter with 1D array.
+        FIR = FIRDesign.fir1(self.n, np.array([self.f1, self.f2]))
+        fir = signal.firwin(self.n+1, [self.f1, self.f2], window='hamming', pass_zero=False, scale=True)
+        self.assertTrue(np.all(FIR[0] == fir))
+
+    def test_fir1_14(self):
+        # test for exception 5
+        with self.assertRaises(ValueError):
+            FIRDesign.fir1(self.n, np.array([[self.f2], [1.5]]))
@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+import scipy.signal as signal
+import filterdesigner.FIRDesign as FIRDesign
+
+class TestFIRpmmin(unittest.TestCase):
+    def setUp(self):
+        self.f1 = [0.2, 0.3]
+        self.a1 = [1, 0]
+        self.dev1 = [0.01, 0.001]
+        self.a2 = [0, 1]
+        self.dev2 = [0.001, 0.01]
+        self.f3 = [0.2, 0.3, 0.5, 0.6]
+        self.a3 = [0, 1, 0]
+        self.dev3 = 0.01
+
+    def meets(self, num, f, a, dev):
+        # Check the specification on a dense grid
+        bands = np.hstack(([0], f, [1]))
+        dev = np.broadcast_to(dev, len(a))
+        for i in range(len(a)):
+            w = np.linspace(bands[2*i], bands[2*i+1], 4096)
+            _, h = signal.freqz(num, 1, worN=w, fs=2)
+            if np.max(np.abs(np.abs(h)-a[i])) > dev[i]:
+                return False
+        return True
+
+    def remez(self, n, f, a, dev):
+        bands = np.hstack(([0], f, [1]))
+        dev = np.broadcast_to(dev, len(a))
+        return signal.remez(n+1, bands, a, weight=np.max(dev)/dev, fs=2)
+
+    def test_firpmmin_1(self):
+        # Test case for lowpass filter
+        n, fil = FIRDesign.firpmmin(self.f1, self.a1, self.dev1)
+        self.assertTrue(len(fil[0]) == n+1 and fil[1] == 1)
+        self.assertTrue(self.meets(fil[0], self.f1, self.a1, self.dev1))
+        self.assertFalse(self.meets(self.remez(n-1, self.f1, self.a1, self.dev1),
+                                    self.f1, self.a1, self.dev1))
+
+    def test_firpmmin_2(self):
+        # Test case for highpass filter, the order must be even
+        n, fil = FIRDesign.firpmmin(self.f1, self.a2, self.dev2)
+        self.assertTrue(n % 2 == 0)
+        self.assertTrue(self.meets(fil[0], self.f1, self.a2, self.dev2))
+        self.assertFalse(self.meets(self.remez(n-2, self.f1, self.a2, self.dev2),
+                                    self.f1, self.a2, self.dev2))
+
+    def test_firpmmin_3(self):
+        # Test case for bandpass filter
+        n, fil = FIRDesign.firpmmin(self.f3, self.a3, self.dev3)
+        self.assertTrue(self.meets(fil[0], self.f3, self.a3, self.dev3))
+        self.assertTrue(n <= FIRDesign.kaiserord(self.f3, self.a3, self.dev3)[0])
+
+    def test_firpmmin_4(self):
+        # Test case for Exception 1
+        with self.assertRaises(ValueError):
+            FIRDesign.firpmmin(self.f1, self.a3, self.dev3)
+
+    def test_firpmmin_5(self):
+        # Test case for Exception 2
+        with self.assertRaises(ValueError):
+            FIRDesign.firpmmin(self.f1, self.a1, self.dev1, nmax=10)
@@ -49,3 +49,49 @@ class TestFreqz(unittest.TestCase):
             FilterSpec.freqz(fil, outform='x')
 
         
+
+    def test_freqz_6(self):
+        # Test case for output buffers
+        fil = IIRDesign.butter(6, self.fc/(self.fs/2))
+        w2, h2 = signal.freqz(fil[0], fil[1], worN=512, fs=self.fs)
+        out = np.empty(512, dtype=complex)
+        w1, h1 = FilterSpec.freqz(fil, fs=self.fs, out=out)
+        self.assertTrue(h1 is out and np.allclose(w1, w2) and np.allclose(h1, h2))
+        out = np.empty(512)
+        w1, h1 = FilterSpec.freqz(fil, fs=self.fs, outform='dB', out=out)
+        i = np.abs(h2) > 1e-6
+        self.assertTrue(h1 is out and np.allclose(h1[i], 20*np.log10(np.abs(h2[i]))))
+
+    def test_freqz_7(self):
+        # Test case for single precision
+        fil = FIRDesign.fir1(self.order, self.cut)
+        w2, h2 = signal.freqz(fil[0], fil[1], worN=64)
+        w1, h1 = FilterSpec.freqz(fil, worN=64, outform='abs', precision='single')
+        self.assertTrue(h1.dtype == np.float32 and np.allclose(h1, np.abs(h2), atol=1e-6))
+        w1, h1 = FilterSpec.freqz(fil, worN=w2, precision='single')
+        self.assertTrue(h1.dtype == np.complex64 and np.allclose(h1, h2, atol=1e-6))
+
+    def test_freqz_8(self):
+        # Test case for exception of output buffers
+        fil = FIRDesign.fir1(self.order, self.cut)
+        with self.assertRaises(ValueError):
+            FilterSpec.freqz(fil, outform='abs', out=np.empty(512, dtype=complex))
+
+    def test_freqz_9(self):
+        # Test case for worN=None with an output buffer
+        fil = FIRDesign.fir1(self.order, self.cut)
+        out = np.empty(512)
+        w, h = FilterSpec.freqz(fil, worN=None, outform='abs', out=out)
+        w0, h0 = FilterSpec.freqz(fil, outform='abs')
+        self.assertTrue(h is out and np.allclose(w, w0) and np.allclose(h, h0))
+
+    def test_freqz_10(self):
+        # Test case for an IIR filter at given frequencies in single precision
+        fil = IIRDesign.ellip(6, 1, 60, 0.3)
+        w = np.linspace(0, np.pi, 300)
+        out = np.empty(300, dtype=np.complex64)
+        _, h1 = FilterSpec.freqz(fil, worN=w, out=out, precision='single')
+        _, h2 = signal.freqz(fil[0], fil[1], worN=w)
+        self.assertTrue(h1 is out and np.allclose(h1, h2, atol=1e-3))
+        _, h1 = FilterSpec.freqz(fil, worN=w, out=np.empty(300, dtype=complex))
+        self.assertTrue(np.allclose(h1, h2))
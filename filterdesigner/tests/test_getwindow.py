@@ -0,0 +1,46 @@
+import unittest
+import filterdesigner.FIRDesign as FIRDesign
+import scipy.signal as signal
+import numpy as np
+
+class TestGetwindow(unittest.TestCase):
+    def setUp(self):
+        self.n = 64
+        self.cut = 0.3
+        self.beta = 8.0
+        FIRDesign.windowcache(clear=True)
+
+    def tearDown(self):
+        FIRDesign.windowcache(maxbytes=64 * 2**20, clear=True)
+
+    def test_getwindow_1(self):
+        # Test case for the cached window
+        win = FIRDesign.getwindow(('kaiser', self.beta), self.n+1)
+        self.assertTrue(np.all(win == signal.get_window(('kaiser', self.beta), self.n+1, fftbins=False)))
+        self.assertTrue(FIRDesign.getwindow(('kaiser', self.beta), self.n+1) is win)
+        info = FIRDesign.windowcache()
+        self.assertTrue(info['hits'] == 1 and info['misses'] == 1 and info['entries'] == 1)
+        self.assertFalse(win.flags.writeable)
+
+    def test_getwindow_2(self):
+        # Test case for the bounded memory
+        FIRDesign.windowcache(maxbytes=3*8*(self.n+1))
+        for n in range(self.n, self.n+5):
+            FIRDesign.getwindow('hann', n+1)
+        info = FIRDesign.windowcache()
+        self.assertTrue(info['entries'] <= 3 and info['nbytes'] <= 3*8*(self.n+1))
+
+    def test_getwindow_3(self):
+        # Test case for fir1 and fir2 with a precomputed window
+        win = signal.get_window(('kaiser', self.beta), self.n+1, fftbins=False)
+        FIR = FIRDesign.fir1(self.n, self.cut, window=win)
+        fir = signal.firwin(self.n+1, self.cut, window=('kaiser', self.beta))
+        self.assertTrue(np.allclose(FIR[0], fir))
+        FIR = FIRDesign.fir2(self.n, [0, 0.3, 0.4, 1], [1, 1, 0, 0], window=win)
+        fir = signal.firwin2(self.n+1, [0, 0.3, 0.4, 1], [1, 1, 0, 0], nfreqs=1024, window=('kaiser', self.beta))
+        self.assertTrue(np.allclose(FIR[0], fir))
+
+    def test_getwindow_4(self):
+        # Test case for Exception
+        with self.assertRaises(ValueError):
+            FIRDesign.getwindow(np.ones(self.n), self.n+1)
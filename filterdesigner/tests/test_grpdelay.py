@@ -27,3 +27,29 @@ class TestGrpdelay(unittest.TestCase):
         w, gd = FilterSpec.grpdelay(fil)
         ww, gdgd = signal.group_delay(fil, w=512, fs=2*np.pi)
         self.assertTrue(np.all(w == ww) and np.all(gd == gdgd))
+
+    def test_grpdelay_3(self):
+        # Test case for odd order linear phase FIR filter
+        fil = FIRDesign.fir1(self.order+1, self.cut, ftype='low')
+        w, gd = FilterSpec.grpdelay(fil, worN=256, fs=self.fs)
+        ww, gdgd = signal.group_delay(fil, w=256, fs=self.fs)
+        self.assertTrue(np.all(w == ww) and np.all(gd == (self.order+1)/2))
+        self.assertTrue(np.allclose(gd, gdgd))
+
+    def test_grpdelay_4(self):
+        # Test case for a bank of filters
+        fils = [IIRDesign.butter(n, 0.4) for n in [2, 5]]
+        fils.append((signal.minimum_phase(FIRDesign.fir1(self.order, self.cut)[0]), 1))
+        w, gd = FilterSpec.grpdelay(fils, worN=128)
+        self.assertTrue(gd.shape == (3, 128))
+        for i in range(len(fils)):
+            ww, gdgd = signal.group_delay(fils[i], w=128)
+            # The multiple zeros at z = -1 are ill-conditioned near Nyquist
+            self.assertTrue(np.allclose(w, ww) and np.allclose(gd[i], gdgd, atol=1e-3))
+
+    def test_grpdelay_5(self):
+        # Test case for second-order sections
+        sos = signal.ellip(7, 1, 60, 0.3, output='sos')
+        w, gd = FilterSpec.grpdelay(sos, worN=128, sos=True)
+        ww, gdgd = signal.group_delay(signal.sos2tf(sos), w=128)
+        self.assertTrue(np.allclose(w, ww) and np.allclose(gd, gdgd))
@@ -49,3 +49,32 @@ class TestImpz(unittest.TestCase):
         yout = i_d[1][0]
         tt, y = FilterSpec.impz(fil, n=self.n, fs=self.fs)
         self.assertTrue(np.all(tt == T) and np.all(y == yout))
+
+    def test_impzgen_1(self):
+        # Test case for blocks of IIR filter with n
+        fil = IIRDesign.butter(6, self.fc/(self.fs/2))
+        blocks = list(FilterSpec.impzgen(fil, n=self.n, fs=self.fs, blocksize=300))
+        self.assertTrue([len(y) for _, y in blocks] == [300, 300, 300, 100])
+        tt, y = FilterSpec.impz(fil, n=self.n, fs=self.fs)
+        self.assertTrue(np.allclose(np.hstack([t for t, _ in blocks]), tt))
+        self.assertTrue(np.allclose(np.hstack([y for _, y in blocks]), y[:, 0]))
+
+    def test_impzgen_2(self):
+        # Test case for early stop of a resonator
+        fil = IIRDesign.iirpeak(0.3, 0.001)
+        y = np.hstack([y for _, y in FilterSpec.impzgen(fil, blocksize=1000, tol=1e-6)])
+        yy = signal.lfilter(fil[0], fil[1], np.eye(1, 10*len(y))[0])
+        tail = np.sum(yy[len(y):]**2) / np.sum(yy**2)
+        self.assertTrue(len(y) % 1000 == 0 and tail <= 1e-6 and tail > 1e-9)
+        self.assertTrue(np.allclose(y, yy[:len(y)]))
+
+    def test_impzgen_3(self):
+        # Test case for FIR filter and Exception
+        fil = FIRDesign.fir1(self.order, self.cut)
+        y = np.hstack([y for _, y in FilterSpec.impzgen(fil, blocksize=16)])
+        self.assertTrue(np.allclose(y, fil[0]))
+        with self.assertRaises(ValueError):
+            next(FilterSpec.impzgen(IIRDesign.butter(6, 0.3)))
+        with self.assertRaises(ValueError):
+            next(FilterSpec.impzgen(([1], [1, -1.5]), tol=1e-6))
+        self.assertTrue(len(list(FilterSpec.impzgen(([1], [1, -1.5]), n=10, tol=1e-6))) == 1)
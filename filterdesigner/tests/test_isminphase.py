@@ -2,6 +2,7 @@ import unittest
 import filterdesigner.FIRDesign as FIRDesign
 import filterdesigner.FilterSpec as FilterSpec
 import filterdesigner.IIRDesign as IIRDesign
+import numpy as np
 
 class TestIsminphase(unittest.TestCase):
 
@@ -21,3 +22,20 @@ class TestIsminphase(unittest.TestCase):
         # Test case
         fil = IIRDesign.butter(self.n, self.fc)
         self.assertTrue(FilterSpec.isminphase(fil) == False)
+
+    def test_isminphase_3(self):
+        # Test case for a bank of FIR filters with margin
+        rng = np.random.default_rng(0)
+        bank = rng.normal(size=(200, 8))
+        flag, mgn = FilterSpec.isminphase((bank, 1), margin=True)
+        ref = [np.max(np.abs(np.roots(b))) <= 1.0 - 1e-10 for b in bank]
+        self.assertTrue(np.all(flag == ref) and np.all((mgn > 0) == flag))
+        self.assertTrue(np.any(flag) and not np.all(flag))
+
+    def test_isminphase_4(self):
+        # Test case for second-order sections
+        sos = np.array([[[1, 0.5, 0.25, 1, 0, 0], [0, 1, 0.5, 1, 0, 0]],
+                        [[1, 0.5, 0.25, 1, 0, 0], [1, 2, 1, 1, 0, 0]]])
+        flag = FilterSpec.isminphase(sos, sos=True)
+        self.assertTrue(np.all(flag == [True, False]))
+        self.assertTrue(FilterSpec.isminphase(sos[0], sos=True) == True)
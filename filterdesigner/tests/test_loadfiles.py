@@ -0,0 +1,69 @@
+import os
+import shutil
+import asyncio
+import tempfile
+import unittest
+import warnings
+import filterdesigner.IO as IO
+import scipy.io as io
+import numpy as np
+
+class TestLoadfiles(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.coefs = np.random.randn(20, 16)
+        for i, b in enumerate(self.coefs):
+            name = os.path.join(self.dir, 'f%02d' % i)
+            if i % 3 == 0:
+                io.savemat(name + '.mat', {'b': b})
+            elif i % 3 == 1:
+                np.savez(name + '.npz', b=b)
+            else:
+                np.save(name + '.npy', b)
+        self.pattern = os.path.join(self.dir, 'f*')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def coef(self, data):
+        if isinstance(data, dict):
+            return np.ravel(data['b'])
+        return data
+
+    def test_loadfiles_1(self):
+        # Test case for the ordered results
+        files = IO.loadfiles(self.pattern, max_workers=4)
+        self.assertTrue(list(files) == sorted(files) and len(files) == len(self.coefs))
+        for b, data in zip(self.coefs, files.values()):
+            self.assertTrue(np.array_equal(self.coef(data), b))
+
+    def test_loadfiles_2(self):
+        # Test case for the streamed results in the order of loading
+        paths = sorted(IO.loadfiles(self.pattern))
+        files = IO.loadfiles(paths, max_workers=2, ordered=False, stream=True)
+        self.assertTrue(sorted(path for path, _ in files) == paths)
+
+    def test_loadfiles_3(self):
+        # Test case for the coroutine
+        files = asyncio.run(IO.aloadfiles(self.pattern, max_workers=4))
+        self.assertTrue(list(files) == sorted(files))
+        for b, data in zip(self.coefs, files.values()):
+            self.assertTrue(np.array_equal(self.coef(data), b))
+
+    def test_loadfiles_4(self):
+        # Test case for Exception
+        with self.assertRaises(ValueError):
+            IO.loadfiles([os.path.join(self.dir, 'f00.txt')])
+        with self.assertRaises(ValueError):
+            IO.loadfiles(self.pattern, max_workers=0)
+
+    def test_loadfiles_5(self):
+        # Test case for a .mat file with appended variables
+        name = os.path.join(self.dir, 'f00.mat')
+        IO.savemat(name, {'b': np.ones(3)}, append=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            files = IO.loadfiles([name])
+        self.assertTrue(np.array_equal(files[name]['b'], IO.loadmat(name, None)['b']))
+        self.assertTrue(np.array_equal(self.coef(files[name]), np.ones(3)))
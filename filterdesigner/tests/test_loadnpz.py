@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+import unittest
+import filterdesigner.IO as IO
+import numpy as np
+
+class TestLoadnpz(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, 'bank.npz')
+        self.arrays = {'bank': np.random.randn(100, 41), 'sos': np.asfortranarray(np.random.randn(6, 3)),
+                       'n': np.arange(5, dtype='>i4'), 'empty': np.zeros((0, 6))}
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_loadnpz_1(self):
+        # Test case for the memory-mapped members
+        IO.savenpz(self.filename, **self.arrays)
+        arrays = IO.loadnpz(self.filename)
+        self.assertTrue(sorted(arrays) == sorted(self.arrays))
+        for name in ['bank', 'sos', 'n']:
+            self.assertTrue(isinstance(arrays[name], np.memmap))
+        for name, x in self.arrays.items():
+            self.assertTrue(np.array_equal(arrays[name], x) and arrays[name].dtype == x.dtype)
+        self.assertTrue(arrays['sos'].flags.f_contiguous)
+        for name in ['bank', 'sos', 'n']:
+            self.assertTrue(arrays[name].flags.aligned)
+            self.assertTrue(arrays[name].offset % 64 == 0)
+        with self.assertRaises(ValueError):
+            arrays['bank'][0, 0] = 0.0
+
+    def test_loadnpz_2(self):
+        # Test case for the compressed members
+        np.savez_compressed(self.filename, **self.arrays)
+        arrays = IO.loadnpz(self.filename)
+        for name, x in self.arrays.items():
+            self.assertFalse(isinstance(arrays[name], np.memmap))
+            self.assertTrue(np.array_equal(arrays[name], x))
+
+    def test_loadnpz_3(self):
+        # Test case for Exception
+        IO.savenpz(self.filename, **self.arrays)
+        with self.assertRaises(ValueError):
+            IO.loadnpz(self.filename, mmap_mode='r+')
+
+    def test_loadnpz_4(self):
+        # Test case for the object arrays
+        IO.savenpz(self.filename, names=np.array(['lowpass', None], dtype=object), b=np.ones(3))
+        with self.assertRaises(ValueError):
+            IO.loadnpz(self.filename)
+        arrays = IO.loadnpz(self.filename, allow_pickle=True)
+        self.assertTrue(list(arrays['names']) == ['lowpass', None])
+        self.assertTrue(isinstance(arrays['b'], np.memmap) and arrays['b'].flags.aligned)
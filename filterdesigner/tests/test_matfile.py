@@ -0,0 +1,49 @@
+import os
+import shutil
+import tempfile
+import unittest
+import filterdesigner.IO as IO
+import filterdesigner.IIRDesign as IIRDesign
+import scipy.io as io
+import numpy as np
+
+class TestMatFile(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, 'filters.mat')
+        b, a = IIRDesign.butter(4, 0.3)
+        self.mdict = {'b': b, 'a': a, 'bank': np.random.randn(20, 41), 'name': 'butter'}
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_matfile_1(self):
+        # Test case for the variables decoded on access
+        io.savemat(self.filename, self.mdict)
+        with IO.MatFile(self.filename) as mat:
+            self.assertTrue(sorted(mat) == sorted(self.mdict) and len(mat) == 4)
+            self.assertTrue(mat.whos() == io.whosmat(self.filename))
+            self.assertTrue('bank' in mat and len(mat._cache) == 0)
+            self.assertTrue(np.array_equal(mat['bank'], self.mdict['bank']))
+            self.assertTrue(list(mat._cache) == ['bank'])
+            self.assertTrue(mat['bank'] is mat['bank'])
+            self.assertTrue(np.array_equal(mat['b'][0], self.mdict['b']))
+        with self.assertRaises(ValueError):
+            mat['a']
+
+    def test_matfile_2(self):
+        # Test case for compressed and MATLAB 4 files
+        for kwds in [{'do_compression': True}, {'format': '4'}]:
+            io.savemat(self.filename, self.mdict, **kwds)
+            ref = io.loadmat(self.filename)
+            with IO.MatFile(self.filename) as mat:
+                for name in self.mdict:
+                    self.assertTrue(np.array_equal(mat[name], ref[name]))
+
+    def test_matfile_3(self):
+        # Test case for Exception
+        io.savemat(self.filename, self.mdict)
+        with IO.MatFile(self.filename) as mat:
+            with self.assertRaises(KeyError):
+                mat['c']
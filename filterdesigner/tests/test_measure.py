@@ -0,0 +1,80 @@
+import unittest
+import filterdesigner.FilterSpec as FilterSpec
+import filterdesigner.FIRDesign as FIRDesign
+import filterdesigner.IIRDesign as IIRDesign
+import scipy.signal as signal
+import numpy as np
+
+class TestMeasure(unittest.TestCase):
+
+    def setUp(self):
+        self.order = 60
+        self.cut = 0.3
+        self.f = [0.25, 0.35]
+        self.n = 5
+        self.Rp = 1
+        self.cuts = np.linspace(0.28, 0.32, 20)
+
+    def reference(self, fil, fp, fs, a):
+        # Measure on dense grids including the band edges
+        def mag(lo, hi):
+            w = np.linspace(lo, hi, 2**17)
+            return w, np.abs(signal.freqz(fil[0], fil[1], worN=w, fs=2)[1])
+        _, mp = mag(0, fp) if a[0] else mag(fs, 1)
+        _, ms = mag(fs, 1) if a[0] else mag(0, fp)
+        rp = 20*np.log10(mp.max()/mp.min())
+        rs = -20*np.log10(ms.max())
+        w, m = mag(fp, fs)
+        f3 = w[np.argmin(np.abs(m-1/np.sqrt(2)))]
+        return rp, rs, f3
+
+    def test_measure_1(self):
+        # Test case for FIR lowpass filter
+        fil = FIRDesign.fir1(self.order, self.cut)
+        Rp, Rs, F3dB, TW = FilterSpec.measure(fil, self.f, [1, 0])
+        rp, rs, f3 = self.reference(fil, self.f[0], self.f[1], [1, 0])
+        self.assertTrue(np.allclose([Rp[0], Rs[0], F3dB[0]], [rp, rs, f3], atol=1e-4))
+        self.assertTrue(np.allclose(TW, self.f[1]-self.f[0]))
+
+    def test_measure_2(self):
+        # Test case for FIR highpass filter
+        fil = FIRDesign.fir1(self.order, self.cut, ftype='high')
+        Rp, Rs, F3dB, _ = FilterSpec.measure(fil, self.f, [0, 1])
+        rp, rs, f3 = self.reference(fil, self.f[0], self.f[1], [0, 1])
+        self.assertTrue(np.allclose([Rp[0], Rs[0], F3dB[0]], [rp, rs, f3], atol=1e-4))
+
+    def test_measure_3(self):
+        # Test case for IIR filter with specified levels
+        fil = IIRDesign.cheby1(self.n, self.Rp, self.cut)
+        Rp, Rs, F3dB, TW = FilterSpec.measure(fil, [0.3, 0.4], [1, 0], Apass=1, Astop=20)
+        rp, rs, f3 = self.reference(fil, 0.3, 0.4, [1, 0])
+        self.assertTrue(np.allclose([Rp[0], Rs[0], F3dB[0]], [rp, rs, f3], atol=1e-4))
+        w, h = signal.freqz(fil[0], fil[1], worN=2**18, fs=2)
+        ws = w[np.argmax(20*np.log10(np.abs(h)) <= -20)]
+        self.assertTrue(abs(TW[0] - (ws-0.3)) < 1e-4)
+
+    def test_measure_4(self):
+        # Test case for a bank of FIR filters
+        bank = np.array([FIRDesign.fir1(self.order, c)[0] for c in self.cuts])
+        Rp, Rs, F3dB, TW = FilterSpec.measure((bank, 1), [0.2, 0.4], [1, 0])
+        self.assertTrue(Rp.shape == (len(self.cuts), 1) and F3dB.shape == (len(self.cuts), 1))
+        for i in [0, len(self.cuts)-1]:
+            r = FilterSpec.measure((bank[i], 1), [0.2, 0.4], [1, 0])
+            self.assertTrue(np.allclose(np.hstack(r), np.hstack([x[i] for x in (Rp, Rs, F3dB, TW)])))
+
+    def test_measure_5(self):
+        # Test case for Exception
+        fil = FIRDesign.fir1(self.order, self.cut)
+        with self.assertRaises(ValueError):
+            FilterSpec.measure(fil, self.f, [1, 1])
+
+    def test_measure_6(self):
+        # Test case for second-order sections
+        sos = signal.ellip(8, self.Rp, 60, self.cut, output='sos')
+        r = FilterSpec.measure(sos, self.f, [1, 0], sos=True)
+        ref = FilterSpec.measure(signal.sos2tf(sos), self.f, [1, 0])
+        self.assertTrue(np.allclose(np.hstack(r), np.hstack(ref)))
+        Rp, _, _, _ = FilterSpec.measure(np.stack([sos, sos]), self.f, [1, 0], sos=True)
+        self.assertTrue(Rp.shape == (2, 1))
+        with self.assertRaises(ValueError):
+            FilterSpec.measure(sos[:, :5], self.f, [1, 0], sos=True)
@@ -0,0 +1,51 @@
+import os
+import shutil
+import tempfile
+import unittest
+import filterdesigner.IO as IO
+import filterdesigner.FIRDesign as FIRDesign
+import numpy as np
+
+class TestNpyBank(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, 'bank.npy')
+        self.order = 40
+        self.bank = np.array([FIRDesign.fir1(self.order, c)[0] for c in np.linspace(0.1, 0.9, 9)])
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_npybank_1(self):
+        # Test case for appending one and several filters
+        IO.createbank(self.filename, self.order+1, capacity=4)
+        self.assertTrue(IO.appendbank(self.filename, self.bank[0]) == 1)
+        self.assertTrue(IO.appendbank(self.filename, self.bank[1:]) == len(self.bank))
+        self.assertTrue(np.array_equal(np.load(self.filename), self.bank))
+
+    def test_npybank_2(self):
+        # Test case for the memory-mapped read
+        IO.createbank(self.filename, self.order+1)
+        IO.appendbank(self.filename, self.bank)
+        bank = IO.openbank(self.filename)
+        self.assertTrue(isinstance(bank, np.memmap) and bank.shape == self.bank.shape)
+        self.assertTrue(np.array_equal(bank[3], self.bank[3]))
+        with self.assertRaises(ValueError):
+            bank[0, 0] = 1.0
+
+    def test_npybank_3(self):
+        # Test case for a bank of second-order sections
+        IO.createbank(self.filename, (3, 6), dtype=np.float32)
+        sos = np.random.randn(5, 3, 6)
+        IO.appendbank(self.filename, sos)
+        bank = IO.openbank(self.filename)
+        self.assertTrue(bank.dtype == np.float32 and np.allclose(bank, sos.astype(np.float32)))
+
+    def test_npybank_4(self):
+        # Test case for Exception
+        IO.createbank(self.filename, self.order+1)
+        with self.assertRaises(ValueError):
+            IO.appendbank(self.filename, np.ones(self.order))
+        with self.assertRaises(ValueError):
+            IO.openbank(self.filename, mode='w')
@@ -9,5 +9,23 @@ class TestPolyscale(unittest.TestCase):
 
     def test_polyscale(self):
         # Test case
-        self.assertTrue(np.all(IIRDesign.polyscale(self.a, self.alpha) == (self.alpha * np.roots(self.a))))
+        self.assertTrue(np.all(IIRDesign.polyscale(self.a, self.alpha, output='roots') == (self.alpha * np.roots(self.a))))
+
+    def test_polyscale_2(self):
+        # Test case for the scaled polynomial
+        b = IIRDesign.polyscale(self.a, self.alpha)
+        self.assertTrue(np.allclose(np.sort(np.roots(b)), np.sort(self.alpha * np.roots(self.a))))
+
+    def test_polyscale_3(self):
+        # Test case for a stack of polynomials
+        a = np.array([[1, -2, -3], [1, 0.5, 0.25]])
+        alpha = np.array([0.5, 1j])
+        b = IIRDesign.polyscale(a, alpha)
+        for i in range(2):
+            self.assertTrue(np.allclose(b[i], IIRDesign.polyscale(a[i], alpha[i])))
+
+    def test_polyscale_4(self):
+        # Test case for Exception
+        with self.assertRaises(ValueError):
+            IIRDesign.polyscale(self.a, self.alpha, output='zpk')
         
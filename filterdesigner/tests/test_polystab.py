@@ -14,3 +14,26 @@ class TestPolystab(unittest.TestCase):
         v = (1 - vs) * v + vs / np.conj(v)
         b = x[0] * np.poly(v)
         self.assertTrue(np.all(IIRDesign.polystab(self.a) == b))
+
+    def test_polystab_2(self):
+        # Test case for a stack of polynomials
+        a = np.array([[1, -2, -3], [1, 0.5, 0.25], [2, -1, 4]])
+        b = IIRDesign.polystab(a)
+        for i in range(len(a)):
+            self.assertTrue(np.allclose(b[i], IIRDesign.polystab(a[i])))
+
+    def test_polystab_3(self):
+        # Test case for second-order sections
+        sos = np.array([[1, 0, 0, 1, -2, -3], [1, 2, 1, 1, 0.5, 4], [1, 1, 0, 2, -3, 0], [1, 1, 1, 1, 0.2, 0.5]])
+        b = IIRDesign.polystab(sos, sos=True)
+        self.assertTrue(np.all(b[:, :3] == sos[:, :3]))
+        for i in range(len(sos)):
+            # First-order sections keep the trailing zero
+            c = IIRDesign.polystab(sos[i, 3:])
+            self.assertTrue(np.allclose(b[i, 3:3+len(c)], c))
+        self.assertTrue(np.all(np.abs(np.roots(b[1, 3:])) <= 1))
+
+    def test_polystab_4(self):
+        # Test case for Exception
+        with self.assertRaises(ValueError):
+            IIRDesign.polystab(np.ones((2, 5)), sos=True)
@@ -0,0 +1,115 @@
+import io
+import json
+import pickle
+import inspect
+import threading
+import unittest
+import urllib.request
+import filterdesigner
+import filterdesigner.FIRDesign as FIRDesign
+import filterdesigner.IIRDesign as IIRDesign
+import filterdesigner.FilterSpec as FilterSpec
+import numpy as np
+
+class TestProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.n = 4
+        self.Wn = 0.3
+        filterdesigner.profilestats(reset=True)
+
+    def tearDown(self):
+        filterdesigner.profilestats(reset=True)
+
+    def test_profile_1(self):
+        # Test case for the calls recorded only within the block
+        IIRDesign.butter(self.n, self.Wn)
+        with filterdesigner.profiling():
+            for _ in range(3):
+                IIRDesign.butter(self.n, self.Wn)
+            FIRDesign.fir1(40, self.Wn)
+        IIRDesign.butter(self.n, self.Wn)
+        stats = filterdesigner.profilestats()
+        self.assertTrue(stats['IIRDesign.butter']['calls'] == 3)
+        self.assertTrue(sum(stats['IIRDesign.butter']['wall']) == 3)
+        self.assertTrue(stats['FIRDesign.fir1']['calls'] == 1)
+
+    def test_profile_2(self):
+        # Test case for the errors and the disabled block
+        with filterdesigner.profiling():
+            with self.assertRaises(ValueError):
+                IIRDesign.butter(self.n, 1.5)
+            with filterdesigner.profiling(False):
+                IIRDesign.butter(self.n, self.Wn)
+        stats = filterdesigner.profilestats(reset=True)
+        self.assertTrue(stats['IIRDesign.butter']['calls'] == 1)
+        self.assertTrue(stats['IIRDesign.butter']['errors'] == 1)
+        self.assertTrue(filterdesigner.profilestats() == {})
+
+    def test_profile_3(self):
+        # Test case for the number of array elements of the arguments
+        with filterdesigner.profiling():
+            FIRDesign.fir1(40, self.Wn, window=np.hamming(41))
+        stats = filterdesigner.profilestats()
+        self.assertTrue(stats['FIRDesign.fir1']['elements_sum'] == 41)
+
+    def test_profile_4(self):
+        # Test case for the exports
+        with filterdesigner.profiling():
+            IIRDesign.butter(self.n, self.Wn)
+        buf = io.StringIO()
+        filterdesigner.writeprofile(buf)
+        record = json.loads(buf.getvalue().splitlines()[0])
+        self.assertTrue(record['function'] == 'IIRDesign.butter' and record['calls'] == 1)
+        buf = io.StringIO()
+        filterdesigner.writeprofile(buf, fmt='prometheus')
+        self.assertTrue('filterdesigner_calls_total{function="IIRDesign.butter"} 1' in buf.getvalue())
+        with self.assertRaises(ValueError):
+            filterdesigner.writeprofile(buf, fmt='csv')
+
+    def test_profile_5(self):
+        # Test case for the metrics endpoint
+        with filterdesigner.profiling():
+            IIRDesign.butter(self.n, self.Wn)
+        server = filterdesigner.serveprofile(port=0)
+        try:
+            url = 'http://127.0.0.1:%d/metrics' % server.server_address[1]
+            text = urllib.request.urlopen(url).read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertTrue('filterdesigner_calls_total{function="IIRDesign.butter"} 1' in text)
+
+    def test_profile_6(self):
+        # Test case for pickling the instrumented functions
+        fir1 = pickle.loads(pickle.dumps(FIRDesign.fir1))
+        self.assertTrue(fir1 is FIRDesign.fir1)
+        with filterdesigner.profiling():
+            fir1(40, self.Wn)
+        stats = filterdesigner.profilestats()
+        self.assertTrue(stats['FIRDesign.fir1']['calls'] == 1)
+
+    def test_profile_7(self):
+        # Test case for the generator functions, recorded when exhausted
+        self.assertTrue(inspect.isgeneratorfunction(FilterSpec.impzgen))
+        self.assertTrue(inspect.isgeneratorfunction(FilterSpec.stepzgen))
+        b, a = IIRDesign.butter(self.n, self.Wn)
+        with filterdesigner.profiling():
+            gen = FilterSpec.impzgen((b, a), 100, blocksize=10)
+            next(gen)
+            self.assertTrue(filterdesigner.profilestats() == {})
+            blocks = 1 + sum(1 for _ in gen)
+        stats = filterdesigner.profilestats()
+        self.assertTrue(blocks == 10)
+        self.assertTrue(stats['FilterSpec.impzgen']['calls'] == 1)
+        self.assertTrue(stats['FilterSpec.impzgen']['errors'] == 0)
+
+    def test_profile_8(self):
+        # Test case for the block affecting only the current thread
+        def design():
+            IIRDesign.butter(self.n, self.Wn)
+        with filterdesigner.profiling():
+            thread = threading.Thread(target=design)
+            thread.start()
+            thread.join()
+        self.assertTrue(filterdesigner.profilestats() == {})
@@ -0,0 +1,41 @@
+import unittest
+import filterdesigner.FilterSpec as FilterSpec
+import filterdesigner.FIRDesign as FIRDesign
+import filterdesigner.IIRDesign as IIRDesign
+import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+
+class TestRender(unittest.TestCase):
+
+    def setUp(self):
+        self.order = 40
+        self.cut = 0.5
+        self.bank = [IIRDesign.butter(n, 0.3) for n in range(1, 5)]
+
+    def test_render_1(self):
+        # Test case for PNG of zero-pole plot without pyplot figures
+        fil = FIRDesign.fir1(self.order, self.cut)
+        n = len(plt.get_fignums())
+        img = FilterSpec.render(fil)
+        self.assertTrue(img[:8] == b'\x89PNG\r\n\x1a\n' and len(plt.get_fignums()) == n)
+
+    def test_render_2(self):
+        # Test case for SVG of frequency response
+        img = FilterSpec.render(self.bank[2], kind='freqz', fmt='svg')
+        self.assertTrue(b'<svg' in img[:1000])
+
+    def test_render_3(self):
+        # Test case for threads
+        with ThreadPoolExecutor(4) as pool:
+            imgs = list(pool.map(FilterSpec.render, self.bank))
+        self.assertTrue(all(img[:4] == b'\x89PNG' for img in imgs))
+
+    def test_renderbank_1(self):
+        # Test case for a pool of processes
+        imgs = FilterSpec.renderbank(self.bank, kind='freqz', max_workers=2, figsize=(4, 3))
+        self.assertTrue(imgs == FilterSpec.renderbank(self.bank, kind='freqz', max_workers=1, figsize=(4, 3)))
+
+    def test_render_4(self):
+        # Test case for Exception
+        with self.assertRaises(ValueError):
+            FilterSpec.render(self.bank[0], fmt='jpg')
@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import unittest
+import filterdesigner.IO as IO
+import scipy.io as io
+import numpy as np
+
+class TestSavemat(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, 'filters.mat')
+        self.b = np.arange(5.0)
+        self.bank = np.random.randn(50, 41)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_savemat_1(self):
+        # Test case for appending without rewriting the file
+        IO.savemat(self.filename, {'b': self.b})
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+        IO.savemat(self.filename, {'bank': self.bank}, append=True)
+        with open(self.filename, 'rb') as f:
+            self.assertTrue(f.read(len(data)) == data)
+        mat = io.loadmat(self.filename)
+        self.assertTrue(np.array_equal(mat['b'][0], self.b) and np.array_equal(mat['bank'], self.bank))
+
+    def test_savemat_2(self):
+        # Test case for the compression of the specified variables
+        IO.savemat(self.filename, {'b': self.b, 'bank': np.zeros((50, 41))}, comp=['bank'])
+        size = os.path.getsize(self.filename)
+        IO.savemat(self.filename, {'b': self.b, 'bank': np.zeros((50, 41))})
+        self.assertTrue(size < os.path.getsize(self.filename) / 10)
+        self.assertTrue(np.array_equal(io.loadmat(self.filename)['bank'], np.zeros((50, 41))))
+        IO.savemat(self.filename, {'b': self.b, 'bank': np.zeros((50, 41))}, comp='bank')
+        self.assertTrue(os.path.getsize(self.filename) == size)
+        IO.savemat(self.filename, {'b': self.b, 'bank': np.zeros((50, 41))}, comp=np.bool_(True))
+        self.assertTrue(os.path.getsize(self.filename) < size)
+
+    def test_savemat_3(self):
+        # Test case for Exception
+        io.savemat(self.filename, {'b': self.b}, format='4')
+        with self.assertRaises(ValueError):
+            IO.savemat(self.filename, {'bank': self.bank}, append=True)
+
+    def test_savemat_4(self):
+        # Test case for the appended variables loaded by name and listed
+        IO.savemat(self.filename, {'b': np.array([1, 2]), 'a': self.b})
+        IO.savemat(self.filename, {'b': np.array([9.0, 9.0, 9.0])}, append=True)
+        mdict = {}
+        mat = IO.loadmat(self.filename, mdict, variable_names=['b'])
+        self.assertTrue(mat is mdict and np.array_equal(mat['b'], [[9, 9, 9]]))
+        self.assertTrue(('a' in mat) == False and '__header__' in mat)
+        self.assertTrue(np.array_equal(IO.loadmat(self.filename, None, variable_names='a')['a'][0], self.b))
+        self.assertTrue(IO.whosmat(self.filename) == [('a', (1, 5), 'double'), ('b', (1, 3), 'double')])
@@ -0,0 +1,58 @@
+import os
+import shutil
+import zipfile
+import tempfile
+import unittest
+import filterdesigner.IO as IO
+import numpy as np
+
+class TestSavenpz(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, 'bank.npz')
+        self.arrays = {'bank': np.round(np.random.randn(600, 512), 3),
+                       'sos': np.asfortranarray(np.random.randn(6, 3)),
+                       'n': np.arange(5, dtype='>i4'), 'empty': np.zeros((0, 6)),
+                       'fs': np.float32(48000)}
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_savenpz_1(self):
+        # Test case for the compressed archive
+        IO.savenpz(self.filename, np.arange(3), comp=True, max_workers=4, **self.arrays)
+        with zipfile.ZipFile(self.filename) as zf:
+            self.assertTrue(zf.testzip() is None)
+            self.assertTrue(all(info.compress_type == zipfile.ZIP_DEFLATED for info in zf.infolist()))
+        with np.load(self.filename) as npz:
+            self.assertTrue(np.array_equal(npz['arr_0'], np.arange(3)))
+            for name, x in self.arrays.items():
+                self.assertTrue(np.array_equal(npz[name], x) and npz[name].dtype == x.dtype)
+            self.assertTrue(npz['sos'].flags.f_contiguous)
+
+    def test_savenpz_2(self):
+        # Test case for the size against np.savez_compressed
+        IO.savenpz(self.filename, comp=True, **self.arrays)
+        size = os.path.getsize(self.filename)
+        np.savez_compressed(self.filename, **self.arrays)
+        self.assertTrue(abs(size - os.path.getsize(self.filename)) < 0.01 * size)
+
+    def test_savenpz_3(self):
+        # Test case for the uncompressed archive
+        IO.savenpz(self.filename, **self.arrays)
+        with zipfile.ZipFile(self.filename) as zf:
+            self.assertTrue(all(info.compress_type == zipfile.ZIP_STORED for info in zf.infolist()))
+
+    def test_savenpz_4(self):
+        # Test case for the file removed on failure
+        class Unconvertible:
+            def __array__(self, dtype=None):
+                raise RuntimeError('unconvertible')
+        for comp in [False, True]:
+            with self.assertRaises(RuntimeError):
+                IO.savenpz(self.filename, b=np.ones(3), bad=Unconvertible(), comp=comp)
+            self.assertFalse(os.path.exists(self.filename))
+        with self.assertRaises(FileNotFoundError) as cm:
+            IO.savenpz(os.path.join(self.dir, 'missing', 'bank.npz'), b=np.ones(3))
+        self.assertTrue(cm.exception.__context__ is None)
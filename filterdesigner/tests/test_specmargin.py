@@ -0,0 +1,60 @@
+import unittest
+import filterdesigner.FilterSpec as FilterSpec
+import filterdesigner.FIRDesign as FIRDesign
+import filterdesigner.IIRDesign as IIRDesign
+import scipy.signal as signal
+import numpy as np
+
+class TestSpecmargin(unittest.TestCase):
+
+    def setUp(self):
+        self.order = 40
+        self.f = [0.2, 0.4]
+        self.a = [1, 0]
+        self.dev = [0.05, 0.01]
+        self.cuts = np.linspace(0.25, 0.35, 5)
+
+    def margin(self, b, a):
+        # Reference margin by freqz on a dense grid
+        bands = np.hstack(([0], self.f, [1]))
+        m = []
+        for i in range(len(self.a)):
+            w = np.linspace(bands[2*i], bands[2*i+1], 4096)
+            _, h = signal.freqz(b, a, worN=w, fs=2)
+            m.append(self.dev[i] - np.max(np.abs(np.abs(h)-self.a[i])))
+        return np.array(m)
+
+    def test_specmargin_1(self):
+        # Test case for FIR filter
+        fil = FIRDesign.fir1(self.order, 0.3)
+        m = FilterSpec.specmargin(fil, self.f, self.a, self.dev)
+        self.assertTrue(m.shape == (2,))
+        self.assertTrue(np.allclose(m, self.margin(fil[0], fil[1]), atol=1e-4))
+
+    def test_specmargin_2(self):
+        # Test case for a bank of FIR filters
+        bank = np.array([FIRDesign.fir1(self.order, c)[0] for c in self.cuts])
+        m = FilterSpec.specmargin((bank, 1), self.f, self.a, self.dev, chunk=100)
+        self.assertTrue(m.shape == (len(self.cuts), 2))
+        for i in range(len(self.cuts)):
+            self.assertTrue(np.allclose(m[i], self.margin(bank[i], 1), atol=1e-4))
+
+    def test_specmargin_3(self):
+        # Test case for a list of IIR filters
+        fils = [IIRDesign.butter(4, 0.3), IIRDesign.cheby1(5, 1, 0.3)]
+        m = FilterSpec.specmargin(fils, self.f, self.a, [0.2, 0.05])
+        self.dev = [0.2, 0.05]
+        for i in range(len(fils)):
+            self.assertTrue(np.allclose(m[i], self.margin(*fils[i]), atol=1e-4))
+
+    def test_specmargin_4(self):
+        # Test case for Exception
+        with self.assertRaises(ValueError):
+            fil = FIRDesign.fir1(self.order, 0.3)
+            FilterSpec.specmargin(fil, self.f, [1, 0, 1], self.dev)
+
+    def test_specmargin_5(self):
+        # Test case for the chunks limited by the number of taps
+        fil = FIRDesign.fir1(400, 0.3)
+        m = FilterSpec.specmargin(fil, self.f, self.a, self.dev, chunk=1000)
+        self.assertTrue(np.allclose(m, FilterSpec.specmargin(fil, self.f, self.a, self.dev)))
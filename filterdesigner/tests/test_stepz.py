@@ -0,0 +1,50 @@
+import unittest
+import filterdesigner.FilterSpec as FilterSpec
+import filterdesigner.FIRDesign as FIRDesign
+import filterdesigner.IIRDesign as IIRDesign
+import scipy.signal as signal
+import numpy as np
+
+class TestStepz(unittest.TestCase):
+
+    def setUp(self):
+        self.order = 80
+        self.cut = 0.5
+        self.fc = 300
+        self.fs = 1000
+        self.n = 1000
+
+    def test_stepz_1(self):
+        # Test case for FIR filter
+        fil = FIRDesign.fir1(self.order, self.cut)
+        T, y = FilterSpec.stepz(fil)
+        self.assertTrue(len(T) == self.order+1 and np.allclose(y, np.cumsum(fil[0])))
+
+    def test_stepz_2(self):
+        # Test case for IIR filter
+        fil = IIRDesign.butter(6, self.fc/(self.fs/2))
+        T, y = FilterSpec.stepz(fil, n=self.n, fs=self.fs)
+        tt, yy = signal.dstep(signal.dlti(fil[0], fil[1], dt=1/self.fs), n=self.n)
+        self.assertTrue(np.allclose(T, tt) and np.allclose(y, yy[0][:, 0]))
+
+    def test_stepzgen_1(self):
+        # Test case for blocks of IIR filter
+        fil = IIRDesign.butter(6, self.fc/(self.fs/2))
+        y = np.hstack([y for _, y in FilterSpec.stepzgen(fil, n=self.n, blocksize=128)])
+        self.assertTrue(np.allclose(y, FilterSpec.stepz(fil, n=self.n)[1]))
+
+    def test_stepzgen_2(self):
+        # Test case for early stop of a resonator
+        fil = IIRDesign.iirnotch(0.3, 0.001)
+        y = np.hstack([y for _, y in FilterSpec.stepzgen(fil, blocksize=1000, tol=1e-6)])
+        yy = signal.lfilter(fil[0], fil[1], np.ones(10*len(y)))
+        e = (yy - yy[-1])**2
+        self.assertTrue(np.sum(e[len(y):]) / np.sum(e) <= 1e-6)
+        self.assertTrue(np.allclose(y, yy[:len(y)]))
+
+    def test_stepzgen_3(self):
+        # Test case for Exception
+        with self.assertRaises(ValueError):
+            next(FilterSpec.stepzgen(IIRDesign.butter(6, 0.3)))
+        with self.assertRaises(ValueError):
+            next(FilterSpec.stepzgen(([1], [1, -1.5]), tol=1e-6))
@@ -0,0 +1,38 @@
+import unittest
+import filterdesigner
+import filterdesigner.IIRDesign as IIRDesign
+import numpy as np
+
+class TestValidate(unittest.TestCase):
+
+    def setUp(self):
+        self.n = 4
+        self.fc = 0.3
+
+    def test_validate_1(self):
+        # Test case for NumPy scalars
+        fil = IIRDesign.butter(np.int32(self.n), np.float32(self.fc))
+        fil2 = IIRDesign.butter(self.n, self.fc)
+        self.assertTrue(np.allclose(fil[0], fil2[0]) and np.allclose(fil[1], fil2[1]))
+        n, Wn = IIRDesign.ellipord(np.float64(0.2), np.float64(0.3), np.int64(1), 40.0)
+        self.assertTrue(n == IIRDesign.ellipord(0.2, 0.3, 1, 40)[0])
+
+    def test_validate_2(self):
+        # Test case for Exception
+        with self.assertRaises(ValueError):
+            IIRDesign.butter(True, self.fc)
+        with self.assertRaises(ValueError):
+            IIRDesign.iirnotch(1, 0.01)
+        with self.assertRaises(ValueError):
+            IIRDesign.cheb1ord(0.2, 0.3, '1', 40)
+
+    def test_validate_3(self):
+        # Test case for trusted inputs
+        with filterdesigner.trusted():
+            fil = IIRDesign.butter(4.0, self.fc)
+            with filterdesigner.trusted(False):
+                with self.assertRaises(ValueError):
+                    IIRDesign.butter(4.0, self.fc)
+        self.assertTrue(len(fil[0]) == self.n+1)
+        with self.assertRaises(ValueError):
+            IIRDesign.butter(4.0, self.fc)
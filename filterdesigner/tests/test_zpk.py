@@ -0,0 +1,47 @@
+import unittest
+import filterdesigner.FIRDesign as FIRDesign
+import filterdesigner.IIRDesign as IIRDesign
+import filterdesigner.FilterSpec as FilterSpec
+import scipy.signal as signal
+import numpy as np
+
+class TestZpk(unittest.TestCase):
+    def setUp(self):
+        self.order = 40
+        self.cuts = np.linspace(0.2, 0.6, 5)
+
+    def sortclose(self, x, y):
+        return np.allclose(np.sort_complex(x), np.sort_complex(y))
+
+    def test_zpk_1(self):
+        # Test case for a single filter
+        fil = IIRDesign.cheby1(6, 1, 0.3)
+        z, p, k = signal.tf2zpk(fil[0], fil[1])
+        Z, P, K, nz, npoles = FilterSpec.zpk(fil)
+        self.assertTrue(self.sortclose(Z, z) and self.sortclose(P, p) and np.isclose(K, k))
+        self.assertTrue(nz == 6 and npoles == 6)
+
+    def test_zpk_2(self):
+        # Test case for a bank of FIR filters
+        bank = np.array([FIRDesign.fir1(self.order, c)[0] for c in self.cuts])
+        Z, P, K, nz, npoles = FilterSpec.zpk((bank, 1))
+        self.assertTrue(Z.shape == (5, self.order) and P.shape == (5, 0))
+        self.assertTrue(np.all(nz == self.order) and np.all(npoles == 0))
+        for i in range(len(bank)):
+            self.assertTrue(self.sortclose(Z[i], np.roots(bank[i])) and K[i] == bank[i][0])
+
+    def test_zpk_3(self):
+        # Test case for a list of filters of different orders
+        fils = [IIRDesign.butter(n, 0.4) for n in [2, 5, 3]]
+        fils.append(([0, 0.5, 1], [2, 1]))
+        Z, P, K, nz, npoles = FilterSpec.zpk(fils)
+        self.assertTrue(np.all(nz == [2, 5, 3, 1]) and np.all(npoles == [2, 5, 3, 1]))
+        for i in range(len(fils)):
+            z, p, k = signal.tf2zpk(*fils[i])
+            self.assertTrue(self.sortclose(Z[i, :nz[i]], z) and self.sortclose(P[i, :npoles[i]], p))
+            self.assertTrue(np.isclose(K[i], k) and np.all(np.isnan(P[i, npoles[i]:])))
+
+    def test_zpk_4(self):
+        # Test case for Exception
+        with self.assertRaises(ValueError):
+            FilterSpec.zpk(([1, 2], [0, 0]))
@@ -14,11 +14,12 @@ def read(fname):
 setup(
     name='filterdesigner',
     version=__version__,
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     #package_data={
     #  'filterdesigner': []
     #},
     install_requires=['numpy', 'scipy>=1.2.0', 'matplotlib'],
+    python_requires='>=3.7',
     zip_safe=False,
     include_package_data=True,
     author="Yuki Fukuda",
@@ -41,7 +42,6 @@ setup(
         "Operating System :: MacOS",
         "Natural Language :: English",
         "Programming Language :: Python :: 3 :: Only",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",